@@ -18,8 +18,14 @@ Usage:
 """
 
 import os
+import re
+import asyncio
+import hashlib
+import concurrent.futures
 from typing import List, Optional
 
+import numpy as np
+
 # Gemini API 임포트 (graceful fallback)
 try:
     import google.generativeai as genai
@@ -28,6 +34,16 @@ except ImportError:
     HAS_GENAI = False
     print("⚠️ google-generativeai 미설치. 임베딩 서비스 비활성화.")
 
+# 영구 임베딩 캐시 (graceful fallback)
+try:
+    from api.embedding_cache import EmbeddingDiskCache
+    HAS_EMBEDDING_CACHE = True
+except ImportError:
+    HAS_EMBEDDING_CACHE = False
+
+# 코드성 텍스트 감지 (코드는 자주 바뀌므로 캐시에 TTL 적용)
+_CODE_HINT_RE = re.compile(r"```|^\s*(?:def|class|import|from\s+\S+\s+import)\s", re.MULTILINE)
+
 
 class EmbeddingService:
     """
@@ -45,6 +61,24 @@ class EmbeddingService:
     DEFAULT_MODEL = "models/text-embedding-004"
     DEFAULT_DIMENSION = 768
     
+    # Gemini 전송 방식 (grpc: HTTP/2 멀티플렉싱, rest: 프록시 환경용)
+    TRANSPORT = os.environ.get("GEMINI_TRANSPORT", "grpc")
+    
+    # 코드성 텍스트 캐시 유효 기간 (초)
+    CODE_CACHE_TTL = 7 * 24 * 3600
+    
+    # 배치 요청 한도 (Gemini 4,194,304 바이트 상한 대비 안전 마진)
+    MAX_BATCH_BYTES = 3 * 1024 * 1024
+    MAX_BATCH_SIZE = 100
+    MAX_CONCURRENT_BATCHES = 20
+    
+    # 빈 텍스트용 영벡터 원본 (불변 튜플이라 공유 안전)
+    _ZERO_VECTOR = (0.0,) * DEFAULT_DIMENSION
+    
+    # 폴백 벡터 생성용 상수 배열 (호출마다 재할당 방지)
+    _FALLBACK_POSITIONS = np.arange(DEFAULT_DIMENSION)
+    _FALLBACK_BIAS = (_FALLBACK_POSITIONS % 10) / 100.0
+    
     _instance: Optional["EmbeddingService"] = None
     
     def __new__(cls):
@@ -61,6 +95,7 @@ class EmbeddingService:
         self.model_name = self.DEFAULT_MODEL
         self.dimension = self.DEFAULT_DIMENSION
         self._api_available = False
+        self._cache: Optional["EmbeddingDiskCache"] = None
         
         self._configure_api()
         self._initialized = True
@@ -87,8 +122,11 @@ class EmbeddingService:
             return
         
         try:
-            genai.configure(api_key=api_key)
+            # gRPC(HTTP/2) 전송: 프로세스당 한 번 설정된 채널을 모든 호출이 공유 (호출마다 TLS 핸드셰이크 없음)
+            genai.configure(api_key=api_key, transport=self.TRANSPORT)
             self._api_available = True
+            if HAS_EMBEDDING_CACHE:
+                self._cache = EmbeddingDiskCache()
             print(f"✅ EmbeddingService 초기화 완료 (모델: {self.model_name})")
         except Exception as e:
             print(f"❌ EmbeddingService 초기화 실패: {e}")
@@ -111,15 +149,11 @@ class EmbeddingService:
         Returns:
             벡터 리스트 (List[float]) - 768차원
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             print("⚠️ 빈 텍스트. 영벡터 반환.")
-            return [0.0] * self.dimension
+            return self._zero_vector()
         
-        # 텍스트 정규화 (너무 긴 텍스트 처리)
-        normalized_text = text.strip()
-        if len(normalized_text) > 10000:
-            normalized_text = normalized_text[:10000]
-            print(f"⚠️ 텍스트 길이 초과. 10000자로 잘림.")
+        normalized_text = self._normalize_text(text)
         
         # API 사용 가능하면 Gemini 호출
         if self._api_available:
@@ -128,8 +162,50 @@ class EmbeddingService:
         # 폴백: 해시 기반 결정론적 벡터
         return self._embed_fallback(normalized_text)
     
+    def _zero_vector(self) -> List[float]:
+        """빈 텍스트용 영벡터 (기본 차원이면 공유 튜플에서 복사)"""
+        if len(self._ZERO_VECTOR) == self.dimension:
+            return list(self._ZERO_VECTOR)
+        return [0.0] * self.dimension
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """텍스트 정규화 (너무 긴 텍스트 처리)"""
+        normalized_text = text.strip()
+        if len(normalized_text) > 10000:
+            normalized_text = normalized_text[:10000]
+            print(f"⚠️ 텍스트 길이 초과. 10000자로 잘림.")
+        return normalized_text
+    
+    def _get_cached(self, text: str, task_type: str) -> Optional[List[float]]:
+        """영구 캐시 조회 (캐시 비활성 시 None)"""
+        if self._cache is None:
+            return None
+        return self._cache.get(EmbeddingDiskCache.make_key(self.model_name, task_type, text))
+    
+    def _store_cached(self, text: str, task_type: str, embedding: List[float]):
+        """API 결과를 영구 캐시에 기록 (코드성 텍스트는 TTL 적용)"""
+        self._store_cached_many([text], task_type, [embedding])
+    
+    def _store_cached_many(self, texts: List[str], task_type: str, embeddings: List[List[float]]):
+        """배치 API 결과를 영구 캐시에 한 트랜잭션으로 기록"""
+        if self._cache is None:
+            return
+        self._cache.set_many(self.model_name, [
+            (
+                EmbeddingDiskCache.make_key(self.model_name, task_type, text),
+                embedding,
+                self.CODE_CACHE_TTL if _CODE_HINT_RE.search(text) else None
+            )
+            for text, embedding in zip(texts, embeddings)
+        ])
+    
     def _embed_with_api(self, text: str, task_type: str) -> List[float]:
-        """Gemini API를 통한 실제 임베딩 생성"""
+        """Gemini API를 통한 실제 임베딩 생성 (캐시 히트 시 API 생략)"""
+        cached = self._get_cached(text, task_type)
+        if cached is not None:
+            return cached
+        
         try:
             result = genai.embed_content(
                 model=self.model_name,
@@ -148,6 +224,7 @@ class EmbeddingService:
                 print(f"ℹ️ 임베딩 차원: {len(embedding)} (예상: {self.dimension})")
                 self.dimension = len(embedding)
             
+            self._store_cached(text, task_type, embedding)
             return embedding
             
         except Exception as e:
@@ -161,25 +238,41 @@ class EmbeddingService:
         API 실패 시에도 시스템이 작동하도록 일관된 벡터를 생성한다.
         동일한 텍스트는 항상 동일한 벡터를 반환한다.
         """
-        import hashlib
+        hash_bytes = self._fallback_bytes(text)
         
-        normalized = text.lower().strip()
+        # 0~1 범위로 정규화 + 위치별 변형
+        # 합은 [0, 1.09) 범위라 % 1.0은 "1 이상이면 1 빼기"와 정확히 같음 (비교+뺄셈으로 SIMD화)
+        values = hash_bytes / 255.0 + self._fallback_bias()
+        values -= values >= 1.0
+        return values.tolist()
+    
+    def _fallback_bytes(self, text: str) -> np.ndarray:
+        """
+        폴백 벡터의 원천 데이터 (차원별 uint8 해시 바이트)
         
-        # SHA-256 해시를 기반으로 벡터 생성
-        hash_bytes = hashlib.sha256(normalized.encode('utf-8')).digest()
+        폴백 벡터는 이 바이트와 위치만으로 완전히 결정되므로,
+        보관이 필요하면 float 대신 이 uint8 배열(1바이트/차원)을 저장하면 된다.
+        """
+        normalized = text.lower().strip()
         
-        vector = []
+        # BLAKE2b(64바이트) 해시를 기반으로 벡터 생성 (암호학적 강도 불필요, SHA-256보다 빠름)
+        digest = hashlib.blake2b(normalized.encode('utf-8'), digest_size=64).digest()
+        hash_bytes = np.frombuffer(digest, dtype=np.uint8)
         
         # 해시 바이트를 반복하여 768차원 채우기
-        for i in range(self.dimension):
-            byte_idx = i % len(hash_bytes)
-            # 0~1 범위로 정규화
-            val = hash_bytes[byte_idx] / 255.0
-            # 약간의 변형 추가 (위치에 따라)
-            val = (val + (i % 10) / 100.0) % 1.0
-            vector.append(val)
-        
-        return vector
+        return hash_bytes[self._fallback_positions() % hash_bytes.size]
+    
+    def _fallback_positions(self) -> np.ndarray:
+        """폴백 벡터의 차원 인덱스 (현재 차원 기준)"""
+        if self._FALLBACK_POSITIONS.size != self.dimension:
+            return np.arange(self.dimension)
+        return self._FALLBACK_POSITIONS
+    
+    def _fallback_bias(self) -> np.ndarray:
+        """위치별 변형값 (i % 10) / 100 (기본 차원이면 클래스 상수 재사용)"""
+        if self._FALLBACK_BIAS.size != self.dimension:
+            return (np.arange(self.dimension) % 10) / 100.0
+        return self._FALLBACK_BIAS
     
     def embed_batch(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
         """
@@ -190,15 +283,198 @@ class EmbeddingService:
             task_type: 임베딩 용도
         
         Returns:
-            벡터 리스트의 리스트
+            벡터 리스트의 리스트 (입력 순서 유지)
+        """
+        if not self._api_available:
+            return [self.embed(text, task_type) for text in texts]
+        
+        results, misses, miss_texts = self._prepare_batch(texts, task_type)
+        for chunk in self._split_batches(miss_texts):
+            vectors = self._embed_chunk_with_api([miss_texts[j] for j in chunk], task_type)
+            for j, vector in zip(chunk, vectors):
+                results[misses[j]] = vector
+        
+        return results
+    
+    async def aembed_batch(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
         """
-        return [self.embed(text, task_type) for text in texts]
+        여러 텍스트를 비동기 배치로 임베딩
+        
+        분할된 묶음들을 asyncio.gather로 동시에 요청한다.
+        동시 요청 수는 MAX_CONCURRENT_BATCHES로 제한 (Gemini 속도 제한 대응).
+        
+        Args:
+            texts: 변환할 텍스트 리스트
+            task_type: 임베딩 용도
+        
+        Returns:
+            벡터 리스트의 리스트 (입력 순서 유지)
+        """
+        if not self._api_available:
+            return [self.embed(text, task_type) for text in texts]
+        
+        results, misses, miss_texts = self._prepare_batch(texts, task_type)
+        chunks = self._split_batches(miss_texts)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        
+        async def run_chunk(chunk: List[int]) -> List[List[float]]:
+            async with semaphore:
+                return await self._aembed_chunk_with_api([miss_texts[j] for j in chunk], task_type)
+        
+        chunk_vectors = await asyncio.gather(*(run_chunk(c) for c in chunks), return_exceptions=True)
+        for chunk, vectors in zip(chunks, chunk_vectors):
+            if isinstance(vectors, BaseException):
+                print(f"❌ 비동기 배치 임베딩 실패: {vectors}")
+                vectors = [self._embed_fallback(miss_texts[j]) for j in chunk]
+            for j, vector in zip(chunk, vectors):
+                results[misses[j]] = vector
+        
+        return results
+    
+    def embed_batch_concurrent(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
+        """aembed_batch 동기 래퍼 (이벤트 루프 실행 중이면 별도 스레드에서 실행)"""
+        coro = self.aembed_batch(texts, task_type)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    def _prepare_batch(self, texts: List[str], task_type: str):
+        """
+        배치 입력 정리: 빈 텍스트는 영벡터, 캐시 히트는 즉시 채움
+        
+        Returns:
+            (결과 슬롯, 미스 인덱스, 미스 텍스트) 튜플
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        normalized: List[Optional[str]] = [None] * len(texts)
+        for i, text in enumerate(texts):
+            if not text or text.isspace():
+                results[i] = self._zero_vector()
+            else:
+                normalized[i] = self._normalize_text(text)
+        
+        # 캐시 미스 항목만 API로 전송
+        misses = self.find_uncached_texts(normalized, task_type, results)
+        return results, misses, [normalized[i] for i in misses]
+    
+    def find_uncached_texts(
+        self,
+        texts: List[Optional[str]],
+        task_type: str,
+        results: List[Optional[List[float]]]
+    ) -> List[int]:
+        """
+        캐시 히트 항목은 results에 채우고, 미스 항목의 인덱스만 반환
+        
+        None(빈 텍스트)인 항목은 건너뛴다.
+        """
+        misses = []
+        for i, text in enumerate(texts):
+            if text is None:
+                continue
+            cached = self._get_cached(text, task_type)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(i)
+        return misses
+    
+    def _split_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Gemini 요청 한도(4MB 페이로드)를 넘지 않도록 텍스트를 묶음 단위로 분할
+        
+        Returns:
+            묶음별 인덱스 리스트
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_bytes = 0
+        
+        for i, text in enumerate(texts):
+            size = len(text.encode('utf-8'))
+            if current and (current_bytes + size > self.MAX_BATCH_BYTES or len(current) >= self.MAX_BATCH_SIZE):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(i)
+            current_bytes += size
+        
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _embed_chunk_with_api(self, texts: List[str], task_type: str) -> List[List[float]]:
+        """한 묶음을 단일 API 호출로 임베딩 (실패 시 항목별 폴백)"""
+        try:
+            result = genai.embed_content(
+                model=self.model_name,
+                content=texts,
+                task_type=task_type
+            )
+            embeddings = result.get("embedding", [])
+        except Exception as e:
+            print(f"❌ Gemini 배치 Embedding API 오류: {e}")
+            embeddings = []
+        
+        return self._collect_chunk_result(texts, task_type, embeddings)
+    
+    async def _aembed_chunk_with_api(self, texts: List[str], task_type: str) -> List[List[float]]:
+        """한 묶음을 비동기 API 호출로 임베딩 (async 클라이언트 없으면 스레드 위임)"""
+        try:
+            if hasattr(genai, "embed_content_async"):
+                result = await genai.embed_content_async(
+                    model=self.model_name,
+                    content=texts,
+                    task_type=task_type
+                )
+            else:
+                result = await asyncio.to_thread(
+                    genai.embed_content,
+                    model=self.model_name,
+                    content=texts,
+                    task_type=task_type
+                )
+            embeddings = result.get("embedding", [])
+        except Exception as e:
+            print(f"❌ Gemini 비동기 배치 Embedding API 오류: {e}")
+            embeddings = []
+        
+        return self._collect_chunk_result(texts, task_type, embeddings)
+    
+    def _collect_chunk_result(
+        self,
+        texts: List[str],
+        task_type: str,
+        embeddings: List[List[float]]
+    ) -> List[List[float]]:
+        """배치 응답을 검증하고 캐시에 기록 (응답 불일치 시 폴백)"""
+        if len(embeddings) != len(texts):
+            if embeddings:
+                print(f"⚠️ 배치 응답 개수 불일치 ({len(embeddings)}/{len(texts)}). 폴백 사용.")
+            return [self._embed_fallback(text) for text in texts]
+        
+        if embeddings and len(embeddings[0]) != self.dimension:
+            print(f"ℹ️ 임베딩 차원: {len(embeddings[0])} (예상: {self.dimension})")
+            self.dimension = len(embeddings[0])
+        
+        self._store_cached_many(texts, task_type, embeddings)
+        return embeddings
+
+
+# 모듈 수준 인스턴스 (최초 접근 후에는 __new__/__init__ 재진입 없이 바로 반환)
+_SERVICE: Optional[EmbeddingService] = None
 
 
 # 싱글톤 인스턴스 접근 헬퍼
 def get_embedding_service() -> EmbeddingService:
     """전역 EmbeddingService 인스턴스 반환"""
-    return EmbeddingService()
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = EmbeddingService()
+    return _SERVICE
 
 
 def get_embedding(text: str, task_type: str = "retrieval_document") -> List[float]:
@@ -212,5 +488,4 @@ def get_embedding(text: str, task_type: str = "retrieval_document") -> List[floa
     Returns:
         벡터 리스트 (List[float])
     """
-    service = get_embedding_service()
-    return service.embed(text, task_type)
\ No newline at end of file
+    return (_SERVICE or get_embedding_service()).embed(text, task_type)
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+AIN Embedding Cache - 2계층 임베딩 캐시
+동일 텍스트에 대한 Gemini API 재호출을 막기 위한 영구 캐시.
+
+Architecture:
+    EmbeddingService.embed -> [1] 인메모리 LRU -> [2] SQLite (디스크) -> Gemini API
+                                       ↑ write-through ←──────────────────┘
+
+캐시 키는 SHA-256(model_name + task_type + 정규화 텍스트)이므로
+모델이 바뀌면 이전 모델의 벡터가 반환되지 않는다.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingDiskCache:
+    """
+    인메모리 LRU + SQLite 영구 캐시
+
+    - 1계층: OrderedDict 기반 LRU (프로세스 수명)
+    - 2계층: SQLite 테이블 (재시작 후에도 유지)
+    - 만료(expires_at)가 지정된 항목은 TTL 경과 후 자동 무효화
+    """
+
+    MAX_MEMORY_ITEMS = 4096
+    DEFAULT_DB_PATH = os.environ.get("EMBEDDING_CACHE_PATH", ".ain_cache/embeddings.sqlite3")
+
+    # 디스크 저장 정밀도: float32(기본) 또는 float16(용량 절반, 검색 순위에는 영향 미미)
+    SUPPORTED_DTYPES = ("float32", "float16")
+    DEFAULT_DTYPE = os.environ.get("EMBEDDING_CACHE_DTYPE", "float32")
+
+    def __init__(self, db_path: str = None, max_items: int = MAX_MEMORY_ITEMS, storage_dtype: str = None):
+        self._db_path = db_path or self.DEFAULT_DB_PATH
+        self._max_items = max_items
+        self._dtype = storage_dtype or self.DEFAULT_DTYPE
+        if self._dtype not in self.SUPPORTED_DTYPES:
+            print(f"⚠️ 지원하지 않는 캐시 dtype({self._dtype}). float32 사용.")
+            self._dtype = "float32"
+        self._memory: "OrderedDict[str, Tuple[List[float], Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect()
+
+    def _connect(self):
+        """SQLite 연결 및 테이블 생성 (실패 시 메모리 전용 모드)"""
+        try:
+            directory = os.path.dirname(self._db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, model TEXT, dim INT, vec BLOB, expires_at REAL, "
+                "dtype TEXT DEFAULT 'float32')"
+            )
+            # 구버전 스키마 마이그레이션 (dtype 컬럼 추가)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")}
+            if "dtype" not in columns:
+                self._conn.execute("ALTER TABLE embeddings ADD COLUMN dtype TEXT DEFAULT 'float32'")
+            self._conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ 임베딩 디스크 캐시 비활성화 (메모리 전용): {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(model_name: str, task_type: str, text: str) -> str:
+        """모델/용도/텍스트로 네임스페이스된 캐시 키 생성"""
+        raw = f"{model_name}\x00{task_type}\x00{text}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """LRU → SQLite 순으로 조회 (디스크 히트는 LRU로 승격)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                vector, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    return vector
+                del self._memory[key]
+
+            if self._conn is None:
+                return None
+
+            row = self._conn.execute(
+                "SELECT vec, expires_at, dtype FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            blob, expires_at, dtype = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            vector = np.frombuffer(blob, dtype=dtype or "float32").astype(np.float32).tolist()
+            self._remember(key, vector, expires_at)
+            return vector
+
+    def set(self, key: str, model_name: str, vector: List[float], ttl: Optional[float] = None):
+        """LRU와 SQLite에 동시 기록 (write-through)"""
+        self.set_many(model_name, [(key, vector, ttl)])
+
+    def set_many(self, model_name: str, entries: List[Tuple[str, List[float], Optional[float]]]):
+        """
+        여러 항목을 한 번에 기록 (executemany + 단일 커밋)
+
+        Args:
+            model_name: 임베딩 모델명
+            entries: (key, vector, ttl) 목록. ttl이 None이면 만료 없음
+        """
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            (key, model_name, len(vector), np.asarray(vector, dtype=self._dtype).tobytes(),
+             now + ttl if ttl is not None else None, self._dtype)
+            for key, vector, ttl in entries
+        ]
+        with self._lock:
+            for (key, vector, _), row in zip(entries, rows):
+                self._remember(key, vector, row[4])
+            if self._conn is None:
+                return
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, dim, vec, expires_at, dtype) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 임베딩 디스크 캐시 저장 실패: {e}")
+
+    def _remember(self, key: str, vector: List[float], expires_at: Optional[float]):
+        """인메모리 LRU 갱신 (호출자가 락 보유)"""
+        self._memory[key] = (vector, expires_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_items:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """양쪽 계층 모두 초기화"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            disk_size = 0
+            if self._conn is not None:
+                disk_size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return {
+                "memory_size": len(self._memory),
+                "max_memory_size": self._max_items,
+                "disk_size": disk_size,
+                "disk_enabled": self._conn is not None,
+                "storage_dtype": self._dtype,
+            }
@@ -3,14 +3,119 @@ GitHub API Helper
 """
 
 import subprocess
+import logging
+import re
+import shutil
+import base64
 import os
+import concurrent.futures
 from github import Github, Auth
 from .keys import get_github_token, get_config
 
+# 상세 진행 로그는 DEBUG 레벨 (AIN_GIT_DEBUG=1 이면 stderr로 출력, 기본은 포맷 비용 없이 생략)
+logger = logging.getLogger(__name__)
+if os.environ.get("AIN_GIT_DEBUG"):
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.DEBUG)
+
+# libgit2 바인딩 (graceful fallback → git CLI)
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+def parse_porcelain_z(output: bytes) -> list[tuple[str, str]]:
+    """
+    `git status --porcelain=v1 -z` 출력 파싱
+
+    NUL 구분이라 개행/공백이 포함된 파일명도 안전하다.
+    rename/copy(R/C) 항목은 뒤따르는 원본 경로 필드를 건너뛴다.
+
+    Returns:
+        [(XY 상태코드, 경로), ...]
+    """
+    entries = output.decode('utf-8', 'surrogateescape').split('\0')
+    parsed = []
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        xy, path = entry[:2], entry[3:]
+        if xy[0] in "RC":
+            i += 1
+        parsed.append((xy, path))
+    return parsed
+
+
+# `git ls-remote` 출력 첫 줄의 커밋 SHA (SHA-1 40자 / SHA-256 64자)
+_LS_REMOTE_RE = re.compile(r"\s*([0-9a-f]{40,64})\b")
+
+
+def parse_ls_remote_sha(output: str | None) -> str:
+    """`git ls-remote` 출력에서 첫 ref의 SHA 추출 (없으면 빈 문자열)"""
+    match = _LS_REMOTE_RE.match(output or "")
+    return match.group(1) if match else ""
+
+
+def read_head_sha(git_dir: str = ".git") -> str:
+    """
+    `git rev-parse HEAD` 대체: .git 파일을 직접 읽어 HEAD 커밋 SHA 반환 (프로세스 fork 없음)
+
+    detached HEAD, 심볼릭 ref(refs/heads/...), packed-refs, worktree(.git 파일)를 처리한다.
+    HEAD가 없거나(최초 커밋 전) 읽기 실패 시 빈 문자열.
+    """
+    try:
+        if os.path.isfile(git_dir):
+            with open(git_dir, 'r') as f:
+                git_dir = f.read().strip().split("gitdir:", 1)[1].strip()
+
+        with open(os.path.join(git_dir, "HEAD"), 'r') as f:
+            head = f.read().strip()
+        if not head.startswith("ref:"):
+            return head
+
+        ref = head[4:].strip()
+        # worktree의 경우 refs는 공용 디렉토리에 있음
+        common_dir = git_dir
+        commondir_file = os.path.join(git_dir, "commondir")
+        if os.path.exists(commondir_file):
+            with open(commondir_file, 'r') as f:
+                common_dir = os.path.join(git_dir, f.read().strip())
+
+        ref_path = os.path.join(common_dir, ref)
+        if os.path.exists(ref_path):
+            with open(ref_path, 'r') as f:
+                return f.read().strip()
+
+        packed = os.path.join(common_dir, "packed-refs")
+        if os.path.exists(packed):
+            with open(packed, 'r') as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+    except (OSError, IndexError):
+        pass
+    return ""
+
+
 class GitHubClient:
     """GitHub 클라이언트"""
     
+    # API push 시 blob 동시 업로드 수 (GitHub secondary rate limit 고려)
+    BLOB_UPLOAD_WORKERS = 16
+    
+    # 충돌 마커 (바이트 단위 검사)
+    CONFLICT_MARKERS = (b'<<<<<<<', b'=======', b'>>>>>>>')
+    
+    # git 전역 설정(safe.directory, credential.helper, user.*) 적용 여부 (프로세스당 1회)
+    _config_done = False
+    
     def __init__(self):
+        self._git_path = shutil.which("git")
         self.token = get_github_token()
         self.repo_name = get_config()["repo_name"]
         
@@ -21,6 +126,15 @@ class GitHubClient:
         else:
             self.github = None
             self.repo = None
+        
+        # GitHub 로그인/토큰 스코프 (프로세스 수명 동안 불변 → 최초 조회 성공 시 캐시)
+        self._user_login: str | None = None
+        self._scopes: list = []
+        if self.github:
+            try:
+                self._get_identity()
+            except Exception:
+                pass  # commit_and_push에서 재시도
     
     def commit_and_push(self, message: str, branch: str = "main") -> tuple[bool, str, str | None, dict]:
         """
@@ -29,8 +143,7 @@ class GitHubClient:
         Returns:
             (success: bool, message: str, commit_sha: str | None, debug_info: dict)
         """
-        import shutil
-        git_path = shutil.which("git")
+        git_path = self._git_path
         if not git_path:
             return False, "❌ git 미설치", None, {}
         
@@ -38,7 +151,7 @@ class GitHubClient:
         
         # 🔍 토큰 검증
         token_info = f"len={len(self.token) if self.token else 0}, prefix={self.token[:4] if self.token and len(self.token) > 4 else 'N/A'}"
-        print(f"🔑 Token info: {token_info}")
+        logger.debug("🔑 Token info: %s", token_info)
         debug["token_info"] = token_info
         
         if not self.token or len(self.token) < 10:
@@ -47,11 +160,10 @@ class GitHubClient:
         # 🔐 GitHub API로 토큰 권한 확인
         try:
             if self.github:
-                user = self.github.get_user()
-                scopes = self.github.oauth_scopes or []
-                debug["github_user"] = user.login
+                login, scopes = self._get_identity()
+                debug["github_user"] = login
                 debug["github_scopes"] = scopes
-                print(f"✅ GitHub API 인증 성공: {user.login}, scopes={scopes}")
+                logger.debug("✅ GitHub API 인증 성공: %s, scopes=%s", login, scopes)
                 
                 # repo 스코프 확인
                 if 'repo' not in scopes and 'public_repo' not in scopes:
@@ -62,13 +174,8 @@ class GitHubClient:
             print(f"⚠️ GitHub API 인증 실패: {api_err}")
 
         try:
-            # 1. 안전한 디렉토리 설정 (Docker/Railway 환경 대응 핵심!)
-            current_dir = os.getcwd()
-            subprocess.run([git_path, "config", "--global", "--add", "safe.directory", current_dir], check=True)
-            
-            # 2. Credential Helper 비활성화 (락 에러 방지)
-            subprocess.run([git_path, "config", "--global", "--unset", "credential.helper"], check=False)
-            subprocess.run([git_path, "config", "--global", "credential.helper", ""], check=True)
+            # 1~2. safe.directory / credential.helper 설정 (최초 1회)
+            self._ensure_git_config(git_path)
             
             # 3. .git 폴더가 없으면 init + remote 연결 (기존 파일 유지)
             remote_url = f"https://{self.token}@github.com/{self.repo_name}.git"
@@ -82,10 +189,6 @@ class GitHubClient:
                 # 원격 브랜치와 연결 (현재 변경사항 유지하면서)
                 subprocess.run([git_path, "branch", "--set-upstream-to", f"origin/{branch}"], check=False)
             
-            # 4. 유저 설정 (Global로 설정하여 안정성 확보)
-            subprocess.run([git_path, "config", "--global", "user.email", "ain@evolution.ai"], check=True)
-            subprocess.run([git_path, "config", "--global", "user.name", "AIN Core"], check=True)
-            
             # 5. 최신 상태로 pull (충돌 시 로컬 변경사항 우선 - ours 전략)
             pull_result = subprocess.run(
                 [git_path, "pull", remote_url, branch, "--no-rebase", "--strategy-option=ours"],
@@ -100,51 +203,9 @@ class GitHubClient:
                 subprocess.run([git_path, "checkout", "--ours", "."], check=False)
                 subprocess.run([git_path, "add", "."], check=False)
             
-            subprocess.run([git_path, "add", "."], check=True)
-            
-            # 📊 변경사항 확인 (디버그용)
-            diff_result = subprocess.run(
-                [git_path, "diff", "--cached", "--stat"],
-                capture_output=True, text=True
-            )
-            debug["diff_stat"] = diff_result.stdout.strip()[:500] if diff_result.stdout else "(no changes)"
-            debug["changed_files"] = diff_result.stdout.count('\n') if diff_result.stdout else 0
-            debug["stages"].append(f"diff: {debug['changed_files']} files")
-            
-            # 커밋 전 HEAD SHA 저장 (실패 시 빈 문자열)
-            try:
-                old_sha = subprocess.run(
-                    [git_path, "rev-parse", "HEAD"],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip()
-            except:
-                old_sha = ""
-            
-            result = subprocess.run(
-                [git_path, "commit", "-m", f"🧬 {message}"],
-                capture_output=True,
-                text=True
-            )
-            
-            if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
-                debug["stages"].append("nothing to commit")
-                return True, "변경사항 없음 (이미 최신 상태입니다)", None, debug
-            
-            # 커밋 후 HEAD SHA 확인 (실패 시 빈 문자열)
-            try:
-                new_sha = subprocess.run(
-                    [git_path, "rev-parse", "HEAD"],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip()
-            except:
-                new_sha = ""
-            
-            # 🚨 커밋이 실제로 생성되었는지 확인
-            if old_sha and new_sha and old_sha == new_sha:
-                debug["stages"].append("commit: SHA unchanged")
-                debug["commit_stdout"] = result.stdout[:200]
-                debug["commit_stderr"] = result.stderr[:200]
-                return True, "변경사항 없음 (커밋 생성 안됨)", None, debug
+            old_sha, new_sha, skip_reason = self._stage_and_commit(git_path, message, debug)
+            if skip_reason:
+                return True, skip_reason, None, debug
             
             if new_sha:
                 print(f"✅ 새 커밋 생성됨: {new_sha[:8]}")
@@ -159,8 +220,8 @@ class GitHubClient:
             )
             
             print(f"📤 푸시 결과: code={push_result.returncode}")
-            print(f"   stdout: {push_result.stdout[:300] if push_result.stdout else '(empty)'}")
-            print(f"   stderr: {push_result.stderr[:300] if push_result.stderr else '(empty)'}")
+            logger.debug("   stdout: %s", push_result.stdout[:300] if push_result.stdout else '(empty)')
+            logger.debug("   stderr: %s", push_result.stderr[:300] if push_result.stderr else '(empty)')
             debug["push_stdout"] = push_result.stdout[:300] if push_result.stdout else ""
             debug["push_stderr"] = push_result.stderr[:300] if push_result.stderr else ""
             
@@ -184,7 +245,7 @@ class GitHubClient:
                     [git_path, "ls-remote", remote_url, f"refs/heads/{branch}"],
                     capture_output=True, text=True, timeout=10
                 )
-                remote_head = ls_result.stdout.strip().split()[0] if ls_result.stdout.strip() else ""
+                remote_head = parse_ls_remote_sha(ls_result.stdout)
                 
                 if remote_head and new_sha and remote_head != new_sha:
                     print(f"⚠️ 원격 HEAD({remote_head[:8]})와 로컬({new_sha[:8]})이 다름! Force Push 시도...")
@@ -202,7 +263,7 @@ class GitHubClient:
                     # 🚀 Force Push 재시도 (최대 3회)
                     force_success = False
                     for attempt in range(1, 4):
-                        print(f"📤 Force Push 시도 {attempt}/3...")
+                        logger.debug("📤 Force Push 시도 %d/3...", attempt)
                         # --force-with-lease 대신 명시적 ref 지정
                         force_result = subprocess.run(
                             [git_path, "push", "--force", remote_url, f"{new_sha}:{branch}"],
@@ -217,9 +278,9 @@ class GitHubClient:
                                 capture_output=True, text=True
                             )
 
-                        print(f"   결과: code={force_result.returncode}")
+                        logger.debug("   결과: code=%d", force_result.returncode)
                         if force_result.stderr:
-                            print(f"   stderr: {force_result.stderr[:200]}")
+                            logger.debug("   stderr: %s", force_result.stderr[:200])
 
                         if force_result.returncode == 0:
                             force_success = True
@@ -240,7 +301,7 @@ class GitHubClient:
                             [git_path, "ls-remote", remote_url, f"refs/heads/{branch}"],
                             capture_output=True, text=True, timeout=10
                         )
-                        verify_head = verify.stdout.strip().split()[0] if verify.stdout.strip() else ""
+                        verify_head = parse_ls_remote_sha(verify.stdout)
                         if verify_head == new_sha:
                             print(f"✅ Force Push 성공! 원격 HEAD: {verify_head[:8]}")
                             debug["stages"].append(f"force-push: success ({new_sha[:8]})")
@@ -281,13 +342,7 @@ class GitHubClient:
 
             # 최종 SHA 확인 (이미 new_sha가 있으면 재사용)
             if not new_sha:
-                try:
-                    new_sha = subprocess.run(
-                        [git_path, "rev-parse", "HEAD"],
-                        capture_output=True, text=True, check=True
-                    ).stdout.strip()
-                except:
-                    new_sha = None
+                new_sha = read_head_sha() or None
             
             debug["stages"].append("success")
             return True, "✅ 동기화 성공 (Push 완료)", new_sha, debug
@@ -296,6 +351,128 @@ class GitHubClient:
             debug["stages"].append(f"error: {str(e)[:50]}")
             return False, f"❌ Git Push 실패: {str(e)}", None, debug
     
+    def _get_identity(self) -> tuple[str, list]:
+        """GitHub 로그인/토큰 스코프 조회 (성공 시 캐시, 실패 시 다음 호출에서 재시도)"""
+        if self._user_login is None:
+            login = self.github.get_user().login  # 실제 요청 발생 → 응답 헤더로 oauth_scopes 갱신
+            self._scopes = self.github.oauth_scopes or []
+            self._user_login = login
+        return self._user_login, self._scopes
+
+    def _ensure_git_config(self, git_path: str):
+        """
+        git 전역 설정 적용 (멱등 설정이므로 프로세스당 한 번만 실행)
+        
+        1. 안전한 디렉토리 설정 (Docker/Railway 환경 대응 핵심!)
+        2. Credential Helper 비활성화 (락 에러 방지)
+        4. 유저 설정 (Global로 설정하여 안정성 확보)
+        """
+        if GitHubClient._config_done:
+            return
+        
+        current_dir = os.getcwd()
+        subprocess.run([git_path, "config", "--global", "--add", "safe.directory", current_dir], check=True)
+        
+        subprocess.run([git_path, "config", "--global", "--unset", "credential.helper"], check=False)
+        subprocess.run([git_path, "config", "--global", "credential.helper", ""], check=True)
+        
+        subprocess.run([git_path, "config", "--global", "user.email", "ain@evolution.ai"], check=True)
+        subprocess.run([git_path, "config", "--global", "user.name", "AIN Core"], check=True)
+        
+        GitHubClient._config_done = True
+
+    def _stage_and_commit(self, git_path: str, message: str, debug: dict) -> tuple[str, str, str | None]:
+        """
+        스테이징 + 커밋 (pygit2 사용 가능하면 프로세스 내부에서 처리)
+
+        Returns:
+            (old_sha, new_sha, skip_reason) - 커밋이 생성되지 않았으면 skip_reason에 사유
+        """
+        if HAS_PYGIT2:
+            try:
+                return self._stage_and_commit_pygit2(message, debug)
+            except Exception as e:
+                print(f"⚠️ pygit2 커밋 실패, git CLI로 재시도: {e}")
+        return self._stage_and_commit_cli(git_path, message, debug)
+
+    def _stage_and_commit_pygit2(self, message: str, debug: dict) -> tuple[str, str, str | None]:
+        """libgit2로 add/diff/commit 수행 (git 프로세스 fork 없음)"""
+        repo = pygit2.Repository(os.getcwd())
+        index = repo.index
+
+        # git add . 과 동일: 신규/수정 파일 추가 + 삭제된 파일 제거
+        index.add_all()
+        for path, flags in repo.status().items():
+            if flags & pygit2.GIT_STATUS_WT_DELETED:
+                index.remove(path)
+        index.write()
+        tree = index.write_tree()
+
+        # 📊 변경사항 확인 (디버그용) - 빈 tree 기준이면 최초 커밋
+        if repo.head_is_unborn:
+            old_sha, parents = "", []
+            base_tree = repo.get(repo.TreeBuilder().write())
+        else:
+            head = repo.head.peel(pygit2.Commit)
+            old_sha, parents = str(head.id), [head.id]
+            base_tree = head.tree
+        stats = index.diff_to_tree(base_tree).stats
+        stat_text = stats.format(pygit2.GIT_DIFF_STATS_FULL, 80).strip()
+        debug["diff_stat"] = stat_text[:500] if stats.files_changed else "(no changes)"
+        debug["changed_files"] = stats.files_changed
+        debug["stages"].append(f"diff: {debug['changed_files']} files")
+
+        if stats.files_changed == 0:
+            debug["stages"].append("nothing to commit")
+            return old_sha, old_sha, "변경사항 없음 (이미 최신 상태입니다)"
+
+        signature = pygit2.Signature("AIN Core", "ain@evolution.ai")
+        new_oid = repo.create_commit("HEAD", signature, signature, f"🧬 {message}", tree, parents)
+        return old_sha, str(new_oid), None
+
+    def _stage_and_commit_cli(self, git_path: str, message: str, debug: dict) -> tuple[str, str, str | None]:
+        """git CLI로 add/diff/commit 수행 (pygit2 미설치 시 폴백)"""
+        subprocess.run([git_path, "add", "."], check=True)
+        
+        # 📊 변경사항 확인 (디버그용) - NUL 구분 porcelain 한 번으로 스테이징 목록 파악
+        status_result = subprocess.run(
+            [git_path, "status", "--porcelain=v1", "-z"],
+            capture_output=True
+        )
+        staged = [
+            (xy, path) for xy, path in parse_porcelain_z(status_result.stdout)
+            if xy[0] not in " ?!"
+        ]
+        diff_stat = "\n".join(f"{xy[0]} {path}" for xy, path in staged)
+        debug["diff_stat"] = diff_stat[:500] if staged else "(no changes)"
+        debug["changed_files"] = len(staged)
+        debug["stages"].append(f"diff: {debug['changed_files']} files")
+        
+        # 커밋 전 HEAD SHA 저장 (실패 시 빈 문자열)
+        old_sha = read_head_sha()
+        
+        result = subprocess.run(
+            [git_path, "commit", "-m", f"🧬 {message}"],
+            capture_output=True,
+            text=True
+        )
+        
+        if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
+            debug["stages"].append("nothing to commit")
+            return old_sha, old_sha, "변경사항 없음 (이미 최신 상태입니다)"
+        
+        # 커밋 후 HEAD SHA 확인 (실패 시 빈 문자열)
+        new_sha = read_head_sha()
+        
+        # 🚨 커밋이 실제로 생성되었는지 확인
+        if old_sha and new_sha and old_sha == new_sha:
+            debug["stages"].append("commit: SHA unchanged")
+            debug["commit_stdout"] = result.stdout[:200]
+            debug["commit_stderr"] = result.stderr[:200]
+            return old_sha, new_sha, "변경사항 없음 (커밋 생성 안됨)"
+        
+        return old_sha, new_sha, None
+    
     def _push_via_api(self, git_path: str, message: str, branch: str) -> str | None:
         """
         Git push 실패 시 GitHub Git Data API로 실제 커밋 생성
@@ -309,7 +486,6 @@ class GitHubClient:
                 return None
 
             import subprocess
-            import base64
             import os
 
             # 제외할 파일 패턴 (캐시, 설정, 바이너리)
@@ -321,15 +497,16 @@ class GitHubClient:
             # 1. 원격 HEAD SHA 먼저 가져오기 (API 사용 - 로컬 ref 무시)
             ref = self.repo.get_git_ref(f"heads/{branch}")
             current_head_sha = ref.object.sha
-            print(f"  📍 원격 HEAD (API): {current_head_sha[:8]}")
+            logger.debug("  📍 원격 HEAD (API): %s", current_head_sha[:8])
 
             # 2. 원격 HEAD 기준으로 변경된 파일 목록 가져오기
+            # (로컬 커밋 완료 후라 status로는 미푸시 커밋이 안 보임 → 원격 SHA 기준 diff 유지, -z로 파싱)
             diff_result = subprocess.run(
-                [git_path, "diff", "--name-only", current_head_sha],
-                capture_output=True, text=True
+                [git_path, "diff", "--name-only", "-z", current_head_sha],
+                capture_output=True
             )
-            all_changed = [f.strip() for f in diff_result.stdout.strip().split('\n') if f.strip()]
-            print(f"  📊 변경 파일: {len(all_changed)}개 (vs {current_head_sha[:8]})")
+            all_changed = [f for f in diff_result.stdout.decode('utf-8', 'surrogateescape').split('\0') if f]
+            logger.debug("  📊 변경 파일: %d개 (vs %s)", len(all_changed), current_head_sha[:8])
 
             # 제외 패턴 필터링
             changed_files = [
@@ -351,50 +528,15 @@ class GitHubClient:
             tree_elements = []
             skipped_reasons = {"not_found": 0, "conflict": 0, "binary": 0, "error": 0}
 
-            for filepath in changed_files:
-                try:
-                    # 파일 존재 확인
-                    if not os.path.exists(filepath):
-                        print(f"  ⚠️ {filepath}: 파일 없음 (삭제됨?)")
-                        skipped_reasons["not_found"] += 1
-                        continue
-
-                    # 바이너리 파일 체크
-                    try:
-                        with open(filepath, 'rb') as f:
-                            chunk = f.read(8192)
-                            if b'\x00' in chunk:
-                                print(f"  ⚠️ {filepath}: 바이너리 파일, 스킵")
-                                skipped_reasons["binary"] += 1
-                                continue
-                    except:
-                        pass
-
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # 충돌 마커 안전 검사
-                    if any(m in content for m in ['<<<<<<<', '=======', '>>>>>>>']):
-                        print(f"  🚫 {filepath}: 충돌 마커 감지됨, 스킵")
-                        skipped_reasons["conflict"] += 1
-                        continue
-
-                    # Blob 생성 (UTF-8 base64 인코딩)
-                    blob = self.repo.create_git_blob(content, "utf-8")
-
-                    tree_elements.append({
-                        "path": filepath,
-                        "mode": "100644",  # regular file
-                        "type": "blob",
-                        "sha": blob.sha
-                    })
-                    print(f"  📄 {filepath} → blob {blob.sha[:8]}")
-
-                except Exception as file_err:
-                    print(f"  ❌ {filepath}: {type(file_err).__name__}: {file_err}")
-                    skipped_reasons["error"] += 1
-
-            print(f"  📊 스킵 요약: {skipped_reasons}")
+            # blob 업로드는 네트워크 대기 위주 → 스레드로 병렬 처리 (map은 입력 순서 유지)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.BLOB_UPLOAD_WORKERS) as executor:
+                for status, element in executor.map(self._create_blob, changed_files):
+                    if element is not None:
+                        tree_elements.append(element)
+                    else:
+                        skipped_reasons[status] += 1
+
+            logger.debug("  📊 스킵 요약: %s", skipped_reasons)
 
             if not tree_elements:
                 print("⚠️ API push: 유효한 파일 없음")
@@ -412,7 +554,7 @@ class GitHubClient:
                 for elem in tree_elements
             ]
             new_tree = self.repo.create_git_tree(git_tree_elements, base_tree=self.repo.get_git_tree(base_tree_sha))
-            print(f"  🌳 새 Tree: {new_tree.sha[:8]}")
+            logger.debug("  🌳 새 Tree: %s", new_tree.sha[:8])
 
             # 6. 새 Commit 생성 (parent = 현재 원격 HEAD)
             new_commit = self.repo.create_git_commit(
@@ -420,11 +562,11 @@ class GitHubClient:
                 tree=new_tree,
                 parents=[head_commit]
             )
-            print(f"  ✨ 새 Commit: {new_commit.sha[:8]}")
+            logger.debug("  ✨ 새 Commit: %s", new_commit.sha[:8])
 
             # 7. Ref 업데이트 (원격 HEAD를 새 커밋으로)
             ref.edit(sha=new_commit.sha, force=True)
-            print(f"  🔗 Ref 업데이트: {branch} → {new_commit.sha[:8]}")
+            logger.debug("  🔗 Ref 업데이트: %s → %s", branch, new_commit.sha[:8])
 
             # 8. 검증
             updated_ref = self.repo.get_git_ref(f"heads/{branch}")
@@ -441,6 +583,48 @@ class GitHubClient:
             traceback.print_exc()
             return None
     
+    def _create_blob(self, filepath: str) -> tuple[str, dict | None]:
+        """
+        파일 하나를 GitHub blob으로 업로드 (스레드 풀에서 호출)
+
+        Returns:
+            ("ok", tree element) 또는 (스킵 사유, None)
+        """
+        try:
+            # 파일 존재 확인
+            if not os.path.exists(filepath):
+                logger.debug("  ⚠️ %s: 파일 없음 (삭제됨?)", filepath)
+                return "not_found", None
+
+            # 한 번만 바이트로 읽어 바이너리 체크 / 충돌 검사 / 업로드에 재사용
+            with open(filepath, 'rb') as f:
+                data = f.read()
+
+            # 바이너리 파일 체크
+            if b'\x00' in data[:8192]:
+                logger.debug("  ⚠️ %s: 바이너리 파일, 스킵", filepath)
+                return "binary", None
+
+            # 충돌 마커 안전 검사
+            if any(m in data for m in self.CONFLICT_MARKERS):
+                logger.debug("  🚫 %s: 충돌 마커 감지됨, 스킵", filepath)
+                return "conflict", None
+
+            # Blob 생성 (원본 바이트를 base64로 직접 전송 - UTF-8 재인코딩 생략)
+            blob = self.repo.create_git_blob(base64.b64encode(data).decode('ascii'), "base64")
+            logger.debug("  📄 %s → blob %s", filepath, blob.sha[:8])
+
+            return "ok", {
+                "path": filepath,
+                "mode": "100644",  # regular file
+                "type": "blob",
+                "sha": blob.sha
+            }
+
+        except Exception as file_err:
+            print(f"  ❌ {filepath}: {type(file_err).__name__}: {file_err}")
+            return "error", None
+
     def get_commit_url(self, sha: str) -> str:
         """커밋 URL 생성"""
         if not sha:
@@ -4,41 +4,64 @@ API Keys 중앙 관리
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
+
+# === Environment Snapshot ===
+# 환경변수는 프로세스 수명 동안 불변 → import 시 한 번만 읽어둔다
+# (테스트/개발 중 환경변수를 바꿨다면 _refresh_env() 호출)
+
+_ENV_NAMES = (
+    "OPENROUTER_API_KEY", "GITHUB_TOKEN", "TELEGRAM_TOKEN", "TELEGRAM_CHAT_ID",
+    "REPO_NAME", "REDIS_URL",
+)
+_ENV: dict = {}
+
+def _refresh_env():
+    """환경변수 스냅샷 재생성 + 파생 설정 캐시 초기화"""
+    _ENV.clear()
+    _ENV.update({name: os.getenv(name, "") for name in _ENV_NAMES})
+    get_telegram_config.cache_clear()
+    get_config.cache_clear()
 
 # === API Keys ===
 
 def get_openrouter_key() -> str:
     """OpenRouter API Key"""
-    return os.getenv("OPENROUTER_API_KEY", "")
+    return _ENV["OPENROUTER_API_KEY"]
 
 def get_github_token() -> str:
     """GitHub Personal Access Token"""
-    return os.getenv("GITHUB_TOKEN", "")
+    return _ENV["GITHUB_TOKEN"]
 
-def get_telegram_config() -> dict:
-    """Telegram Bot 설정"""
-    return {
-        "token": os.getenv("TELEGRAM_TOKEN", ""),
-        "chat_id": os.getenv("TELEGRAM_CHAT_ID", ""),
-    }
+@lru_cache(maxsize=1)
+def get_telegram_config() -> MappingProxyType:
+    """Telegram Bot 설정 (읽기 전용 - 캐시된 객체 공유)"""
+    return MappingProxyType({
+        "token": _ENV["TELEGRAM_TOKEN"],
+        "chat_id": _ENV["TELEGRAM_CHAT_ID"],
+    })
 
 # === Config Values ===
 
-def get_config() -> dict:
-    """시스템 설정값"""
-    return {
+@lru_cache(maxsize=1)
+def get_config() -> MappingProxyType:
+    """시스템 설정값 (읽기 전용 - 캐시된 객체 공유)"""
+    return MappingProxyType({
         "dreamer_model": "google/gemini-3-pro-preview", # [CRITICAL] DO NOT DOWNGRADE
         "coder_model": "anthropic/claude-opus-4.5",       # [CRITICAL] DO NOT DOWNGRADE
         "opus_45_model": "anthropic/claude-opus-4.5", 
-        "repo_name": os.getenv("REPO_NAME", ""),
+        "repo_name": _ENV["REPO_NAME"],
                 "evolution_interval": 3600,  # 1시간으로 절대 고정 (환경변수 무시)
-        "redis_url": os.getenv("REDIS_URL", ""),
-    }
+        "redis_url": _ENV["REDIS_URL"],
+    })
+
+_refresh_env()
 
 # === Validation ===
 
 def validate_required_keys() -> tuple[bool, list[str]]:
     """필수 환경변수 검증"""
     required = ["OPENROUTER_API_KEY", "GITHUB_TOKEN", "TELEGRAM_TOKEN", "REPO_NAME"]
-    missing = [key for key in required if not os.getenv(key)]
+    missing = [key for key in required if not _ENV.get(key)]
     return len(missing) == 0, missing
@@ -3,24 +3,122 @@ OpenRouter API Client
 blitz 프로젝트 형식 기반 안정적인 LLM 호출
 """
 
+import time
+import random
+import asyncio
+import concurrent.futures
+from typing import Iterator
 import requests
+from requests.adapters import HTTPAdapter
 from .keys import get_openrouter_key
 
+# HTTP/2 전송 및 비동기 배치 호출용 (선택적, 없으면 requests 세션 사용)
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401  httpx의 HTTP/2 지원 의존성
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# 요청 직렬화/응답 파싱 가속 (선택적, 없으면 stdlib json)
+try:
+    import orjson as _json
+    _dumps = _json.dumps  # bytes 반환 → UTF-8 인코딩 단계 생략
+except ImportError:
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# 전송 계층(requests/httpx) 공통 예외 묶음
+TIMEOUT_ERRORS = (requests.Timeout,) + ((httpx.TimeoutException,) if HAS_HTTPX else ())
+TRANSIENT_ERRORS = TIMEOUT_ERRORS + (requests.ConnectionError,) + ((httpx.TransportError,) if HAS_HTTPX else ())
+
 class OpenRouterClient:
     """OpenRouter API 클라이언트"""
     
     ENDPOINT = "https://openrouter.ai/api/v1/chat/completions"
     
+    # 재시도 대상 HTTP 상태 (rate limit + 서버 일시 장애)
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_BACKOFF = 30.0
+    
+    # 비동기 동시 호출 기본값 (OpenRouter rate limit 고려)
+    DEFAULT_CONCURRENCY = 8
+    
     def __init__(self, model: str = "google/gemini-3.0-flash"):
         self.model = model
         self.api_key = get_openrouter_key()
+        self._session = self._build_session()
+        self._http2_client = self._build_http2_client() if HAS_HTTPX else None
+        self._async_client = None  # chat_async 최초 호출 시 생성 (이벤트 루프에 묶임)
+    
+    def _build_session(self) -> requests.Session:
+        """
+        keep-alive 세션 생성 (TCP+TLS 연결 재사용)
+        
+        고정 헤더는 세션에 한 번만 설정한다.
+        재시도는 chat()의 지수 백오프 루프가 담당하므로 어댑터 재시도는 끈다 (중복 재시도 방지).
+        """
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/ain-lang/ain",
+            "X-Title": "AIN",
+        })
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+        return session
+    
+    def _build_http2_client(self) -> "httpx.Client":
+        """
+        동기 경로용 httpx 클라이언트 (HTTP/2면 한 연결에 여러 요청 멀티플렉싱)
+        
+        h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작한다.
+        """
+        return httpx.Client(
+            http2=HAS_HTTP2,
+            headers=dict(self._session.headers),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """비동기 클라이언트 (같은 루프 안에서 재사용 → HTTP/2 멀티플렉싱)"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=HAS_HTTP2,
+                headers=dict(self._session.headers),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._async_client
+    
+    def close(self):
+        """세션 종료 (연결 풀 반환)"""
+        self._session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+    
+    async def aclose(self):
+        """비동기 클라이언트 종료"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def chat(
         self,
         messages: list[dict],
         max_tokens: int = 4096,
         temperature: float = 0.7,
-        timeout: int = 60
+        timeout: int = 60,
+        connect_timeout: float = 5.0,
+        max_retries: int = 3
     ) -> dict:
         """
         채팅 완료 요청
@@ -29,18 +127,45 @@ class OpenRouterClient:
             messages: [{"role": "system"|"user"|"assistant", "content": "..."}]
             max_tokens: 최대 토큰 수
             temperature: 창의성 (0.0 ~ 1.0)
-            timeout: 타임아웃 (초)
+            timeout: 응답 읽기 타임아웃 (초) - LLM 추론 지연 허용
+            connect_timeout: 연결 타임아웃 (초) - 죽은 연결은 빨리 포기
+            max_retries: 타임아웃/연결 실패/429·5xx 시 최대 시도 횟수
         
         Returns:
             {"success": bool, "content": str, "usage": dict, "error": str|None}
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/ain-lang/ain",
-            "X-Title": "AIN",
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
         }
         
+        try:
+            response = self._post_with_retry(data, (connect_timeout, timeout), max_retries)
+            return self._parse_result(_json.loads(response.content))
+        except TIMEOUT_ERRORS:
+            return {"success": False, "content": "", "usage": {}, "error": "Request timeout"}
+        except Exception as e:
+            return {"success": False, "content": "", "usage": {}, "error": str(e)}
+    
+    async def chat_async(
+        self,
+        messages: list[dict],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        timeout: int = 60,
+        connect_timeout: float = 5.0,
+        max_retries: int = 3
+    ) -> dict:
+        """
+        chat()의 비동기 버전 (httpx.AsyncClient 사용)
+        
+        인자와 반환 형식은 chat()과 동일하다.
+        """
+        if not HAS_HTTPX:
+            return {"success": False, "content": "", "usage": {}, "error": "httpx not installed"}
+        
         data = {
             "model": self.model,
             "messages": messages,
@@ -49,62 +174,212 @@ class OpenRouterClient:
         }
         
         try:
-            response = requests.post(
-                self.ENDPOINT,
-                headers=headers,
-                json=data,
-                timeout=timeout
-            )
-            result = response.json()
-            
-            if "choices" not in result:
-                return {
-                    "success": False,
-                    "content": "",
-                    "usage": {},
-                    "error": f"API Error: {result}"
-                }
-
-            # content가 None, 빈 문자열, whitespace-only인 경우 처리
-            content = result["choices"][0]["message"].get("content")
-            finish_reason = result["choices"][0].get("finish_reason", "unknown")
-            usage = result.get("usage", {})
+            timeout_config = httpx.Timeout(timeout, connect=connect_timeout)
+            response = await self._apost_with_retry(data, timeout_config, max_retries)
+            return self._parse_result(_json.loads(response.content))
+        except httpx.TimeoutException:
+            return {"success": False, "content": "", "usage": {}, "error": "Request timeout"}
+        except Exception as e:
+            return {"success": False, "content": "", "usage": {}, "error": str(e)}
+    
+    async def chat_many(self, list_of_messages: list[list[dict]], concurrency: int = DEFAULT_CONCURRENCY, **kwargs) -> list[dict]:
+        """
+        여러 프롬프트를 동시에 요청 (세마포어로 동시 실행 수 제한)
+        
+        Args:
+            list_of_messages: chat()에 넘길 messages 목록
+            concurrency: 동시에 진행할 최대 요청 수
+            **kwargs: chat_async()에 그대로 전달
+        
+        Returns:
+            입력 순서와 같은 결과 목록
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def bounded(messages):
+            async with semaphore:
+                return await self.chat_async(messages, **kwargs)
+        
+        return await asyncio.gather(*[bounded(m) for m in list_of_messages])
+    
+    def chat_many_sync(self, list_of_messages: list[list[dict]], concurrency: int = DEFAULT_CONCURRENCY, **kwargs) -> list[dict]:
+        """chat_many 동기 래퍼 (이벤트 루프 실행 중이면 별도 스레드에서 실행)"""
+        async def run():
+            try:
+                return await self.chat_many(list_of_messages, concurrency, **kwargs)
+            finally:
+                # 비동기 클라이언트는 루프에 묶이므로 루프 종료 전에 닫는다
+                await self.aclose()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, run()).result()
+    
+    def _parse_result(self, result: dict) -> dict:
+        """OpenRouter 응답 JSON → chat() 반환 형식"""
+        if "choices" not in result:
+            return {
+                "success": False,
+                "content": "",
+                "usage": {},
+                "error": f"API Error: {result}"
+            }
 
-            # 빈 응답 체크 (None, "", "   " 모두 포함)
-            if not content or not content.strip():
-                # finish_reason별 상세 로깅
-                reason_msg = {
-                    "stop": "정상 완료인데 content 비어있음 (API 버그 가능성)",
-                    "length": "최대 토큰 도달로 content 잘림",
-                    "content_filter": "콘텐츠 필터링으로 차단됨",
-                    "error": "API 내부 에러",
-                }.get(finish_reason, f"알 수 없는 이유: {finish_reason}")
+        # content가 None, 빈 문자열, whitespace-only인 경우 처리
+        content = result["choices"][0]["message"].get("content")
+        finish_reason = result["choices"][0].get("finish_reason", "unknown")
+        usage = result.get("usage", {})
 
-                print(f"⚠️ OpenRouter 빈 응답:")
-                print(f"   - model: {self.model}")
-                print(f"   - finish_reason: {finish_reason} ({reason_msg})")
-                print(f"   - content type: {type(content).__name__}, repr: {repr(content)[:50]}")
-                if usage:
-                    print(f"   - 토큰: prompt={usage.get('prompt_tokens', '?')}, completion={usage.get('completion_tokens', '?')}")
+        # 빈 응답 체크 (None, "", "   " 모두 포함)
+        if not content or not content.strip():
+            # finish_reason별 상세 로깅
+            reason_msg = {
+                "stop": "정상 완료인데 content 비어있음 (API 버그 가능성)",
+                "length": "최대 토큰 도달로 content 잘림",
+                "content_filter": "콘텐츠 필터링으로 차단됨",
+                "error": "API 내부 에러",
+            }.get(finish_reason, f"알 수 없는 이유: {finish_reason}")
 
-                return {
-                    "success": False,
-                    "content": "",
-                    "usage": usage,
-                    "error": f"Empty content (finish_reason: {finish_reason}, {reason_msg})"
-                }
+            print(f"⚠️ OpenRouter 빈 응답:")
+            print(f"   - model: {self.model}")
+            print(f"   - finish_reason: {finish_reason} ({reason_msg})")
+            print(f"   - content type: {type(content).__name__}, repr: {repr(content)[:50]}")
+            if usage:
+                print(f"   - 토큰: prompt={usage.get('prompt_tokens', '?')}, completion={usage.get('completion_tokens', '?')}")
 
             return {
-                "success": True,
-                "content": content,
-                "usage": result.get("usage", {}),
-                "error": None
+                "success": False,
+                "content": "",
+                "usage": usage,
+                "error": f"Empty content (finish_reason: {finish_reason}, {reason_msg})"
             }
-            
-        except requests.Timeout:
-            return {"success": False, "content": "", "usage": {}, "error": "Request timeout"}
+
+        if usage:
+            print(f"📊 OpenRouter 토큰 ({self.model}): prompt={usage.get('prompt_tokens', '?')}, completion={usage.get('completion_tokens', '?')}")
+
+        return {
+            "success": True,
+            "content": content,
+            "usage": result.get("usage", {}),
+            "error": None
+        }
+    
+    def _post_with_retry(self, data: dict, timeout: tuple, max_retries: int):
+        """
+        지수 백오프(+지터) 재시도 POST
+        
+        httpx(HTTP/2)가 있으면 그것을, 없으면 requests 세션을 사용한다.
+        타임아웃/연결 실패는 재시도 후 마지막 예외를 던지고,
+        429/5xx는 마지막 응답을 그대로 반환해 호출자가 에러 본문을 보고할 수 있게 한다.
+        """
+        # 본문은 한 번만 직렬화 (재시도 시에도 같은 bytes 재사용, Content-Type은 세션 헤더)
+        body = _dumps(data)
+        if self._http2_client is not None:
+            connect_timeout, read_timeout = timeout
+            client = self._http2_client
+            timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+            body_kwargs = {"content": body}
+        else:
+            client = self._session
+            body_kwargs = {"data": body}
+        
+        attempts = max(1, max_retries)
+        for attempt in range(attempts):
+            last_try = attempt == attempts - 1
+            try:
+                response = client.post(self.ENDPOINT, timeout=timeout, **body_kwargs)
+                if response.status_code not in self.RETRY_STATUSES or last_try:
+                    return response
+                print(f"⚠️ OpenRouter HTTP {response.status_code}, 재시도 {attempt + 1}/{attempts - 1}")
+            except TRANSIENT_ERRORS as e:
+                if last_try:
+                    raise
+                print(f"⚠️ OpenRouter {type(e).__name__}, 재시도 {attempt + 1}/{attempts - 1}")
+            time.sleep(self._backoff(attempt))
+    
+    async def _apost_with_retry(self, data: dict, timeout: "httpx.Timeout", max_retries: int) -> "httpx.Response":
+        """_post_with_retry의 비동기 버전"""
+        client = self._get_async_client()
+        body = _dumps(data)
+        attempts = max(1, max_retries)
+        for attempt in range(attempts):
+            last_try = attempt == attempts - 1
+            try:
+                response = await client.post(self.ENDPOINT, content=body, timeout=timeout)
+                if response.status_code not in self.RETRY_STATUSES or last_try:
+                    return response
+                print(f"⚠️ OpenRouter HTTP {response.status_code}, 재시도 {attempt + 1}/{attempts - 1}")
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                if last_try:
+                    raise
+                print(f"⚠️ OpenRouter {type(e).__name__}, 재시도 {attempt + 1}/{attempts - 1}")
+            await asyncio.sleep(self._backoff(attempt))
+    
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + 지터 (상한 MAX_BACKOFF)"""
+        return min(self.MAX_BACKOFF, 0.5 * (2 ** attempt)) + random.random() * 0.25
+    
+    def chat_stream(
+        self,
+        messages: list[dict],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        timeout: int = 60,
+        connect_timeout: float = 5.0
+    ) -> Iterator[str]:
+        """
+        스트리밍 채팅 (SSE) - 토큰 조각이 도착하는 대로 yield
+        
+        전체 응답 본문을 메모리에 모으지 않으므로 긴 응답/동시 호출 시 피크 메모리가 낮다.
+        timeout은 청크 사이 최대 대기 시간으로 적용된다.
+        실패 시 경고를 출력하고 조용히 종료한다 (이미 yield한 조각은 유효).
+        
+        Usage:
+            for piece in client.chat_stream(messages):
+                print(piece, end="", flush=True)
+        """
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        
+        try:
+            with self._session.post(
+                self.ENDPOINT, data=_dumps(data), timeout=(connect_timeout, timeout), stream=True
+            ) as response:
+                if response.status_code != 200:
+                    print(f"⚠️ OpenRouter 스트림 HTTP {response.status_code}: {response.text[:200]}")
+                    return
+                
+                for line in response.iter_lines(chunk_size=1024):
+                    # SSE: 빈 줄/주석(": OPENROUTER PROCESSING")은 건너뜀
+                    if not line.startswith(b"data: "):
+                        continue
+                    payload = line[6:]
+                    if payload == b"[DONE]":
+                        return
+                    
+                    chunk = _json.loads(payload)
+                    if "error" in chunk:
+                        print(f"⚠️ OpenRouter 스트림 에러: {chunk['error']}")
+                        return
+                    
+                    choices = chunk.get("choices")
+                    if choices:
+                        piece = choices[0].get("delta", {}).get("content")
+                        if piece:
+                            yield piece
+        except TIMEOUT_ERRORS:
+            print("⚠️ OpenRouter 스트림 타임아웃")
         except Exception as e:
-            return {"success": False, "content": "", "usage": {}, "error": str(e)}
+            print(f"⚠️ OpenRouter 스트림 실패: {e}")
     
     def simple_chat(self, system_prompt: str, user_message: str, **kwargs) -> str:
         """간단한 채팅 (system + user 메시지)"""
@@ -1,7 +1,42 @@
 import redis
 import json
+import threading
 from api.keys import get_config
 
+# orjson: C 구현 JSON (stdlib 대비 2~5배 빠름, dumps가 bytes 반환 → Redis에 그대로 기록)
+try:
+    import orjson
+
+    def _dumps(value) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# 프로세스 전역 연결 풀 (URL별 1개, 모든 RedisClient 인스턴스가 공유)
+_POOLS: dict = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(url: str) -> redis.ConnectionPool:
+    """URL별 공유 ConnectionPool 반환 (최초 호출 시 생성, 실제 소켓은 첫 명령 시 연결)"""
+    with _POOL_LOCK:
+        pool = _POOLS.get(url)
+        if pool is None:
+            # 외부 Redis 연결 안정성을 위해 retry 설정 추가
+            pool = redis.ConnectionPool.from_url(
+                url,
+                decode_responses=True,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                max_connections=16,
+                health_check_interval=30
+            )
+            _POOLS[url] = pool
+        return pool
+
 class RedisClient:
     """
     AIN State Manager (Redis):
@@ -11,30 +46,33 @@ class RedisClient:
     def __init__(self):
         config = get_config()
         self.redis_url = config.get("redis_url")
-        self.client = None
+        self._client = None  # 첫 상태 접근 시 생성 (client 프로퍼티)
         
-        if self.redis_url:
+        if not self.redis_url:
+            print("ℹ️ REDIS_URL이 설정되지 않았습니다. 파일 기반 상태 관리를 유지합니다.")
+
+    @property
+    def client(self):
+        """공유 풀 기반 Redis 클라이언트 (지연 생성, URL 미설정/실패 시 None)"""
+        if self._client is None and self.redis_url:
             try:
-                # 외부 Redis 연결 안정성을 위해 retry 설정 추가
-                self.client = redis.from_url(
-                    self.redis_url, 
-                    decode_responses=True,
-                    socket_timeout=5,
-                    retry_on_timeout=True,
-                    health_check_interval=30
-                )
-                print("🔌 외부 Redis 연결 성공 (상태 관리용)")
+                self._client = redis.Redis(connection_pool=_get_pool(self.redis_url))
+                print("🔌 외부 Redis 연결 준비 완료 (상태 관리용, 공유 풀)")
             except Exception as e:
                 print(f"⚠️ Redis 연결 실패: {e}")
-        else:
-            print("ℹ️ REDIS_URL이 설정되지 않았습니다. 파일 기반 상태 관리를 유지합니다.")
+                self.redis_url = None  # 잘못된 URL로 매번 재시도하지 않음
+        return self._client
+
+    @staticmethod
+    def _state_key(key: str) -> str:
+        return f"ain:state:{key}"
 
     def set_state(self, key: str, value: any):
         """상태 저장"""
         if not self.client: return False
         try:
-            serialized = json.dumps(value)
-            self.client.set(f"ain:state:{key}", serialized)
+            serialized = _dumps(value)
+            self.client.set(self._state_key(key), serialized)
             return True
         except Exception as e:
             print(f"❌ Redis 저장 에러 ({key}): {e}")
@@ -44,14 +82,42 @@ class RedisClient:
         """상태 인출"""
         if not self.client: return default
         try:
-            data = self.client.get(f"ain:state:{key}")
+            data = self.client.get(self._state_key(key))
             if data:
-                return json.loads(data)
+                return _loads(data)
             return default
         except Exception as e:
             print(f"❌ Redis 인출 에러 ({key}): {e}")
             return default
 
+    def set_many(self, mapping: dict) -> bool:
+        """여러 상태를 파이프라인으로 한 번에 저장 (N번 왕복 → 1번)"""
+        if not self.client: return False
+        if not mapping: return True
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(self._state_key(key), _dumps(value))
+                pipe.execute()
+            return True
+        except Exception as e:
+            print(f"❌ Redis 일괄 저장 에러 ({', '.join(mapping)}): {e}")
+            return False
+
+    def get_many(self, keys: list, default=None) -> dict:
+        """여러 상태를 MGET으로 한 번에 인출 (없는 키는 default)"""
+        if not self.client or not keys:
+            return {key: default for key in keys}
+        try:
+            values = self.client.mget([self._state_key(key) for key in keys])
+            return {
+                key: _loads(data) if data else default
+                for key, data in zip(keys, values)
+            }
+        except Exception as e:
+            print(f"❌ Redis 일괄 인출 에러 ({', '.join(keys)}): {e}")
+            return {key: default for key in keys}
+
     def set_burst_mode(self, end_time_iso: str, interval: int):
         """버스트 모드 전용 상태 저장"""
         state = {
@@ -24,6 +24,12 @@ Migration Guide:
 import warnings
 from typing import Any, Dict, List, Optional
 
+try:
+    import pyarrow as pa
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
 # Deprecation Warning 발생
 warnings.warn(
     "api/surrealdb.py is deprecated. Use database/surreal_bridge.py instead. "
@@ -46,6 +52,17 @@ except ImportError:
     print("⚠️ database.surreal_bridge 임포트 실패. Legacy 모드로 작동합니다.")
 
 
+def _typed_array(values: List[Any], arrow_type: "pa.DataType") -> "pa.Array":
+    """
+    캐시된 타입으로 Arrow 배열 생성 (타입 불일치 시 ArrowInvalid/ArrowTypeError)
+    
+    정수 타입은 Python float를 조용히 버림 변환하므로 추론 후 safe cast로 검사한다.
+    """
+    if pa.types.is_integer(arrow_type):
+        return pa.array(values).cast(arrow_type)
+    return pa.array(values, type=arrow_type)
+
+
 class SurrealDBClient:
     """
     DEPRECATED: Legacy SurrealDB Client
@@ -74,6 +91,9 @@ class SurrealDBClient:
         self.ns = namespace
         self.db = database
         
+        # 테이블별 Arrow 스키마 캐시 (반복 호출 시 타입 추론 생략)
+        self._schema_cache: Dict[str, "pa.Schema"] = {}
+        
         # Bridge 인스턴스 획득
         if HAS_BRIDGE:
             self._bridge = get_bridge()
@@ -119,22 +139,65 @@ class SurrealDBClient:
         Returns:
             생성된 레코드 정보
         """
+        result = self.create_many(table, [data])
+        if result["error"]:
+            return result
+        return {"result": data, "error": None}
+    
+    def create_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        schema: Optional["pa.Schema"] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 레코드를 한 번의 배치로 생성
+        
+        행 목록(AoS)을 컬럼 목록(SoA)으로 전치해 Arrow Table 하나로 만들고
+        push_batch를 한 번만 호출한다. 첫 호출에서 추론한 스키마를 테이블별로
+        캐시하여 이후 호출은 타입 추론 없이 typed array로 생성한다.
+        
+        Args:
+            table: 테이블 이름
+            rows: 저장할 데이터 목록
+            schema: 사용할 Arrow 스키마 (없으면 캐시 → 추론 순)
+            
+        Returns:
+            {"result": 저장된 행 수, "error": str|None}
+        """
         if not self._bridge:
             return {"error": "Bridge not available", "result": None}
+        if not HAS_ARROW:
+            return {"error": "pyarrow not installed", "result": None}
+        if not rows:
+            return {"result": 0, "error": None}
         
         try:
-            # Bridge의 push_batch를 사용하여 단일 레코드 저장
-            import pyarrow as pa
+            # AoS → SoA (모든 행의 키를 등장 순서대로 합집합)
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            cols = {key: [row.get(key) for row in rows] for key in columns}
+            
+            table_data = None
+            schema = schema or self._schema_cache.get(table)
+            if schema is not None and schema.names == columns:
+                try:
+                    table_data = pa.table(
+                        {key: _typed_array(cols[key], schema.field(key).type) for key in columns},
+                        schema=schema
+                    )
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass  # 타입이 달라진 데이터 → 재추론
             
-            # 데이터를 Arrow Table로 변환
-            columns = list(data.keys())
-            arrays = [pa.array([v]) for v in data.values()]
-            table_data = pa.table(dict(zip(columns, arrays)))
+            if table_data is None:
+                table_data = pa.table(cols)
+                # null 타입 필드가 있는 스키마는 이후 값을 받을 수 없으므로 캐시하지 않음
+                if not any(pa.types.is_null(field.type) for field in table_data.schema):
+                    self._schema_cache[table] = table_data.schema
             
-            success = self._bridge.push_batch(table_data, table)
+            success = self._bridge.push_batch_sync(table_data, table)
             
             if success:
-                return {"result": data, "error": None}
+                return {"result": len(rows), "error": None}
             else:
                 return {"error": "Push failed", "result": None}
                 
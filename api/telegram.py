@@ -2,19 +2,49 @@
 Telegram Bot API Helper
 """
 
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from .keys import get_telegram_config
 
+# MarkdownV2 예약 문자 (모듈 로드 시 한 번만 생성)
+_MD_CHARS = ('\\', '_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!')
+
+# 이스케이프 테이블 (str.translate 한 번으로 처리)
+_MD_ESCAPE = str.maketrans({c: '\\' + c for c in _MD_CHARS})
+
+
+def escape_markdown(s: str) -> str:
+    """MarkdownV2 특수문자 이스케이프"""
+    return s.translate(_MD_ESCAPE)
+
+
 class TelegramBot:
     """텔레그램 봇 클라이언트"""
     
     BASE_URL = "https://api.telegram.org/bot"
     
+    # 메시지 포맷 (Telegram 4096자 제한 대비 여유)
+    PREFIX = "🤖 AIN: "
+    LIMIT = 3900
+    TRUNCATED_SUFFIX = "\n... (메시지 잘림)"
+    
+    # 429 응답 시 Retry-After를 따르되 메인 루프를 너무 오래 막지 않도록 상한
+    MAX_RETRY_AFTER = 60
+    
     def __init__(self):
         config = get_telegram_config()
         self.token = config["token"]
         self.chat_id = config["chat_id"]
         self.enabled = bool(self.token and self.chat_id)
+        
+        # 요청 URL은 토큰이 고정이므로 한 번만 생성
+        self._send_url = f"{self.BASE_URL}{self.token}/sendMessage"
+        self._updates_url = f"{self.BASE_URL}{self.token}/getUpdates"
+        
+        # keep-alive 세션 (getUpdates 롱폴링마다 TLS 재연결 방지)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=8))
     
     def send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
         """
@@ -23,41 +53,59 @@ class TelegramBot:
         if not self.enabled:
             return False
         
-        url = f"{self.BASE_URL}{self.token}/sendMessage"
+        # 텍스트 길이 제한 + 접두사를 한 번의 포맷으로 조립
+        suffix = ""
+        if len(text) > self.LIMIT:
+            text = text[:self.LIMIT]
+            suffix = self.TRUNCATED_SUFFIX
+        plain_body = f"{self.PREFIX}{text}{suffix}"
         
-        # 텍스트 길이 제한 (Telegram 4096자 제한)
-        if len(text) > 3900:
-            text = text[:3900] + "\n... (메시지 잘림)"
-        
-        # 마크다운 특수문자 이스케이프 (문제 방지)
-        def escape_markdown(s: str) -> str:
-            """마크다운 특수문자 이스케이프"""
-            chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-            for char in chars:
-                s = s.replace(char, '\\' + char)
-            return s
+        # MarkdownV2는 예약 문자를 모두 이스케이프해야 파싱 에러가 나지 않음
+        # (기본 Markdown 모드는 **굵게**/`코드` 서식을 그대로 살린다, 접두사는 이스케이프 제외)
+        if parse_mode == "MarkdownV2":
+            body = f"{self.PREFIX}{escape_markdown(text)}{escape_markdown(suffix)}"
+        else:
+            body = plain_body
         
         payload = {
             "chat_id": self.chat_id,
-            "text": f"🤖 AIN: {text}",
+            "text": body,
             "parse_mode": parse_mode,
             "disable_web_page_preview": True
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(self._send_url, json=payload, timeout=10)
+            if response.status_code == 200:
+                return True
             
-            # 마크다운 파싱 에러 시 일반 텍스트로 재시도
-            if response.status_code != 200:
+            try:
+                error = response.json()
+            except ValueError:
+                error = {}
+            description = error.get("description", "")
+            
+            # Rate limit: Telegram이 알려준 만큼 기다린 뒤 실패 반환 (재전송으로 한도 소모 금지)
+            if response.status_code == 429:
+                retry_after = error.get("parameters", {}).get("retry_after") or response.headers.get("Retry-After", 0)
+                wait = min(int(retry_after), self.MAX_RETRY_AFTER)
+                print(f"⚠️ 텔레그램 rate limit: {wait}초 대기")
+                time.sleep(wait)
+                return False
+            
+            # 마크다운 파싱 에러일 때만 일반 텍스트로 재시도 (401/403 등은 재시도해도 동일)
+            if response.status_code == 400 and "can't parse" in description.lower():
                 # parse_mode 제거하고 재시도
                 payload_plain = {
                     "chat_id": self.chat_id,
-                    "text": f"🤖 AIN: {text}",
+                    "text": plain_body,
                     "disable_web_page_preview": True
                 }
-                response = requests.post(url, json=payload_plain, timeout=10)
+                response = self._session.post(self._send_url, json=payload_plain, timeout=10)
+                return response.status_code == 200
             
-            return response.status_code == 200
+            print(f"⚠️ 텔레그램 전송 실패 (HTTP {response.status_code}): {description}")
+            return False
         except Exception as e:
             print(f"⚠️ 텔레그램 전송 실패: {e}")
             return False
@@ -67,11 +115,10 @@ class TelegramBot:
         if not self.enabled:
             return []
         
-        url = f"{self.BASE_URL}{self.token}/getUpdates"
         params = {"offset": offset + 1, "timeout": timeout}
         
         try:
-            response = requests.get(url, params=params, timeout=timeout + 10)
+            response = self._session.get(self._updates_url, params=params, timeout=timeout + 10)
             if response.status_code == 200:
                 return response.json().get("result", [])
         except:
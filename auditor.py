@@ -1,4 +1,5 @@
-import importlib
+import sys
+import importlib.util
 import shutil
 from api.keys import validate_required_keys
 
@@ -28,6 +29,26 @@ class Auditor:
             "PyArrow": "Zero-Copy 메모리 파이프라인",
             "Mojo": "초고속 연산 가속기"
         }
+        # 스택 설치 여부 캐시 (감사마다 재탐색/재임포트 방지)
+        self._stack_cache: dict[str, bool] = {}
+
+    def _is_installed(self, name: str, module: str) -> bool:
+        """
+        모듈 설치 여부 확인 (결과는 인스턴스에 캐시)
+
+        import_module 대신 find_spec으로 존재만 확인하여
+        pyarrow/lancedb 같은 무거운 네이티브 확장을 로드하지 않는다.
+        """
+        if name in self._stack_cache:
+            return self._stack_cache[name]
+
+        installed = module in sys.modules or importlib.util.find_spec(module) is not None
+        # Mojo는 pip 패키지 또는 CLI 바이너리로 체크
+        if not installed and name == "Mojo":
+            installed = shutil.which("mojo") is not None
+
+        self._stack_cache[name] = installed
+        return installed
 
     def audit_resources(self):
         """환경 변수 및 필수 라이브러리 체크"""
@@ -46,66 +67,49 @@ class Auditor:
 
         # 2. 비전 대비 기술 스택 체크
         for name, module in self.vision_stack.items():
-            if name == "Mojo":
-                # Mojo는 pip 패키지 또는 CLI로 체크
-                try:
-                    importlib.import_module("mojo")
-                    report["installed_stack"].append(name)
-                except ImportError:
-                    # CLI 바이너리로도 체크
-                    if shutil.which("mojo"):
-                        report["installed_stack"].append(name)
-                    else:
-                        report["missing_stack"].append(name)
-                        if report["status"] == "OK": 
-                            report["status"] = "WARNING"
+            if self._is_installed(name, module):
+                report["installed_stack"].append(name)
             else:
-                try:
-                    importlib.import_module(module)
-                    report["installed_stack"].append(name)
-                except ImportError:
-                    report["missing_stack"].append(name)
-                    if report["status"] == "OK": 
-                        report["status"] = "WARNING"
+                report["missing_stack"].append(name)
+                if report["status"] == "OK": 
+                    report["status"] = "WARNING"
 
         return report
 
     def format_request_message(self, report):
         """주인님께 보낼 상태 메시지 작성"""
+        roles = self.stack_roles
+        cmds = self.install_commands
         
         # 모든 것이 OK일 때
         if report["status"] == "OK":
-            msg = "🎉 **AIN 자원 감사 완료!**\n\n"
-            msg += "✅ **설치된 기술 스택:**\n"
+            parts = ["🎉 **AIN 자원 감사 완료!**\n\n", "✅ **설치된 기술 스택:**\n"]
             for stack in report["installed_stack"]:
-                role = self.stack_roles.get(stack, "")
-                msg += f"  • {stack}: {role}\n"
-            msg += "\n🚀 모든 시스템이 정상입니다! 진화 준비 완료!"
-            return msg
+                parts.append(f"  • {stack}: {roles.get(stack, '')}\n")
+            parts.append("\n🚀 모든 시스템이 정상입니다! 진화 준비 완료!")
+            return "".join(parts)
 
         # 일부 누락된 경우
-        msg = "📊 **AIN 자원 감사 결과**\n\n"
+        parts = ["📊 **AIN 자원 감사 결과**\n\n"]
         
         # 설치된 것들
         if report["installed_stack"]:
-            msg += "✅ **설치됨:**\n"
+            parts.append("✅ **설치됨:**\n")
             for stack in report["installed_stack"]:
-                role = self.stack_roles.get(stack, "")
-                msg += f"  • {stack}: {role}\n"
-            msg += "\n"
+                parts.append(f"  • {stack}: {roles.get(stack, '')}\n")
+            parts.append("\n")
         
         # 환경 변수 누락
         if report["missing_env"]:
-            msg += f"🔑 **환경 변수 필요:**\n  `{', '.join(report['missing_env'])}`\n\n"
+            parts.append(f"🔑 **환경 변수 필요:**\n  `{', '.join(report['missing_env'])}`\n\n")
         
         # 스택 누락
         if report["missing_stack"]:
-            msg += "⚠️ **미설치 (선택사항):**\n"
+            parts.append("⚠️ **미설치 (선택사항):**\n")
             for stack in report["missing_stack"]:
-                role = self.stack_roles.get(stack, "")
-                cmd = self.install_commands.get(stack, "")
-                msg += f"  • {stack}: {role}\n"
+                cmd = cmds.get(stack, "")
+                parts.append(f"  • {stack}: {roles.get(stack, '')}\n")
                 if cmd and "Dockerfile" not in cmd:
-                    msg += f"    └─ `{cmd}`\n"
+                    parts.append(f"    └─ `{cmd}`\n")
         
-        return msg
\ No newline at end of file
+        return "".join(parts)
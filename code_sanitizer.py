@@ -34,6 +34,17 @@ OMISSION_PATTERNS = [
     r'#\s*truncated',              # # truncated
 ]
 
+# 사전 컴파일 패턴 (줄 단위 Python 루프 대신 C 레벨 스캔)
+# ======= 구분선: strip() 후 정확히 '=======' 인 독립 줄
+_SEPARATOR_RE = re.compile(r'^[^\S\n]*=======[^\S\n]*$', re.MULTILINE)
+# diff 줄: strip() 후 '+ ' 또는 '- '로 시작하는 줄
+_DIFF_LINE_RE = re.compile(r'^[^\S\n]*[+-] [^\n]*\S', re.MULTILINE)
+
+
+def _has_conflict_marker(code: str) -> bool:
+    """충돌 마커 존재 여부 ('<<<<<<<'/'>>>>>>>'는 substring, '======='는 독립 줄)"""
+    return '<<<<<<<' in code or '>>>>>>>' in code or _SEPARATOR_RE.search(code) is not None
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 🔧 메인 함수 - 코드 정리
@@ -78,66 +89,51 @@ def sanitize_code_output(code_output: str, verbose: bool = True) -> Tuple[str, d
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 2: Git 충돌 마커 자동 제거 (더 포괄적인 검사)
+    # - 마커가 하나도 없으면 (대부분의 출력) 줄 단위 스캔 자체를 건너뜀
+    # - 분리한 줄 목록은 Step 4에서 재사용 (split/join 왕복 최소화)
     # ─────────────────────────────────────────────────────────────────────────
-    lines = code_output.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        stripped = line.strip()
-        should_remove = False
+    lines = None
+    has_marker = _has_conflict_marker(code_output)
+    if has_marker:
+        lines = code_output.split('\n')
+        cleaned_lines = []
         
-        # 충돌 시작/끝 마커 건너뛰기 (줄 어디에 있든)
-        if '<<<<<<<' in line or '>>>>>>>' in line:
-            if verbose:
-                print(f"🔧 [Sanitizer] 충돌 마커 제거: {stripped[:40]}...")
-            result["removed_lines"] += 1
-            should_remove = True
-        
-        # ======= 구분선 건너뛰기 (정확히 7개 = 만, 문서 데코레이션 제외)
-        elif stripped == '=======':
-            if verbose:
-                print("🔧 [Sanitizer] 충돌 구분선 제거")
-            result["removed_lines"] += 1
-            should_remove = True
+        for line in lines:
+            # 충돌 시작/끝 마커 건너뛰기 (줄 어디에 있든)
+            if '<<<<<<<' in line or '>>>>>>>' in line:
+                if verbose:
+                    print(f"🔧 [Sanitizer] 충돌 마커 제거: {line.strip()[:40]}...")
+                result["removed_lines"] += 1
+            
+            # ======= 구분선 건너뛰기 (정확히 7개 = 만, 문서 데코레이션 제외)
+            elif line.strip() == '=======':
+                if verbose:
+                    print("🔧 [Sanitizer] 충돌 구분선 제거")
+                result["removed_lines"] += 1
+            
+            else:
+                cleaned_lines.append(line)
         
-        # 줄 전체가 충돌 마커인 경우
-        elif stripped in ['<<<<<<<', '=======', '>>>>>>>']:
+        if result["removed_lines"] > 0:
             if verbose:
-                print(f"🔧 [Sanitizer] 순수 충돌 마커 제거: {stripped}")
-            result["removed_lines"] += 1
-            should_remove = True
-        
-        if not should_remove:
-            cleaned_lines.append(line)
-    
-    if result["removed_lines"] > 0:
-        code_output = '\n'.join(cleaned_lines)
-        result["cleaned"] = True
-        if verbose:
-            print(f"🔧 [Sanitizer] 충돌 마커 제거 완료: {len(lines)} -> {len(cleaned_lines)} 줄")
+                print(f"🔧 [Sanitizer] 충돌 마커 제거 완료: {len(lines)} -> {len(cleaned_lines)} 줄")
+            lines = cleaned_lines
+            code_output = '\n'.join(lines)
+            result["cleaned"] = True
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 3: 잔여 충돌 마커 감지 (개선됨)
     # - '<<<<<<<'와 '>>>>>>>'는 substring으로 감지 (false positive 거의 없음)
     # - '======='는 정확히 7개 =만 있는 독립 줄로만 감지 (문서 데코레이션과 구분)
     # ─────────────────────────────────────────────────────────────────────────
-    has_angle_markers = '<<<<<<<' in code_output or '>>>>>>>' in code_output
-    has_separator = any(
-        line.strip() == '======='
-        for line in code_output.split('\n')
-    )
-    result["has_conflict"] = has_angle_markers or has_separator
+    # (마커가 없던 출력은 다시 스캔할 필요 없음)
+    result["has_conflict"] = has_marker and _has_conflict_marker(code_output)
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 4: Diff 형식 감지 및 자동 변환
     # ─────────────────────────────────────────────────────────────────────────
-    current_lines = code_output.split('\n')
-    diff_indicators = [
-        l for l in current_lines 
-        if l.strip().startswith('+ ') or l.strip().startswith('- ')
-    ]
-    result["diff_count"] = len(diff_indicators)
-    has_diff_format = len(diff_indicators) >= 1 or '@@ ' in code_output
+    result["diff_count"] = len(_DIFF_LINE_RE.findall(code_output))
+    has_diff_format = result["diff_count"] >= 1 or '@@ ' in code_output
     
     # 🔧 Diff 형식 자동 변환 (강화된 버전)
     if has_diff_format:
@@ -146,17 +142,17 @@ def sanitize_code_output(code_output: str, verbose: bool = True) -> Tuple[str, d
         diff_converted = 0
         diff_removed = 0
 
-        for line in current_lines:
+        for line in lines if lines is not None else code_output.split('\n'):
+            stripped = line.strip()
+
             # 코드 블록 시작/끝 감지
-            if line.strip().startswith('```'):
+            if stripped.startswith('```'):
                 in_code_block = not in_code_block
                 converted_lines.append(line)
                 continue
 
             # 코드 블록 내부에서 diff 변환
             if in_code_block:
-                stripped = line.strip()
-
                 # @@ 마커 제거
                 if stripped.startswith('@@') and '@@' in stripped[2:]:
                     diff_removed += 1
@@ -164,18 +160,14 @@ def sanitize_code_output(code_output: str, verbose: bool = True) -> Tuple[str, d
 
                 # + 로 시작하는 줄: prefix 제거 (들여쓰기 보존)
                 # 패턴: "    + code" 또는 "+ code" 또는 "+\tcode"
-                if stripped.startswith('+ ') or stripped.startswith('+\t'):
+                if stripped.startswith(('+ ', '+\t')):
                     # 들여쓰기 찾기: line에서 '+'의 위치 찾아서 그 이후 부분 추출
                     plus_idx = line.find('+')
-                    if plus_idx >= 0:
-                        # '+' 제거하고 나머지 (공백 포함) 유지
-                        new_line = line[:plus_idx] + line[plus_idx + 1:]
-                        # 맨 앞 공백 하나 제거 (+ 뒤의 공백)
-                        if new_line[plus_idx:plus_idx + 1] == ' ':
-                            new_line = new_line[:plus_idx] + new_line[plus_idx + 1:]
-                        converted_lines.append(new_line)
-                        diff_converted += 1
-                        continue
+                    # '+'와 바로 뒤 공백 하나를 한 번의 슬라이스로 제거 (탭은 유지)
+                    skip = 2 if line[plus_idx + 1:plus_idx + 2] == ' ' else 1
+                    converted_lines.append(line[:plus_idx] + line[plus_idx + skip:])
+                    diff_converted += 1
+                    continue
                 elif stripped == '+':  # 빈 줄 추가
                     converted_lines.append('')
                     diff_converted += 1
@@ -190,7 +182,6 @@ def sanitize_code_output(code_output: str, verbose: bool = True) -> Tuple[str, d
                 converted_lines.append(line)
             else:
                 # 코드 블록 외부에서도 명백한 diff 패턴 제거
-                stripped = line.strip()
                 if stripped.startswith('@@') and '@@' in stripped[2:]:
                     diff_removed += 1
                     continue
@@ -205,12 +196,7 @@ def sanitize_code_output(code_output: str, verbose: bool = True) -> Tuple[str, d
                 print(f"🔧 [Sanitizer] Diff 형식 자동 변환: +{diff_converted}줄 변환, -{diff_removed}줄 제거")
     
     # 변환 후 다시 감지
-    final_lines = code_output.split('\n')
-    remaining_diff = [
-        l for l in final_lines 
-        if l.strip().startswith('+ ') or l.strip().startswith('- ')
-    ]
-    result["has_diff"] = len(remaining_diff) >= 1 or '@@ ' in code_output
+    result["has_diff"] = _DIFF_LINE_RE.search(code_output) is not None or '@@ ' in code_output
     
     # ─────────────────────────────────────────────────────────────────────────
     # Step 6: 구문 오류 자가 치유 (Unterminated String Literal 등)
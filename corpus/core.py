@@ -1,17 +1,19 @@
 """
 Corpus Core: CorpusCallosum 기본 초기화 및 연결 관리
 """
+import os
+import importlib.util
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 
-try:
+# 서드파티 의존성은 spec 존재 여부만으로 판별 (미설치 시 예외 발생/포착 비용 없음)
+HAS_ARROW = importlib.util.find_spec("pyarrow") is not None
+if HAS_ARROW:
     import pyarrow as pa
-    HAS_ARROW = True
-except ImportError:
-    HAS_ARROW = False
 
+# 내부 모듈은 파일이 있어도 하위 의존성 임포트가 실패할 수 있으므로 try/except 유지
 try:
-    from database.surreal_bridge import SurrealArrowBridge
+    from database.surreal_bridge import SurrealArrowBridge, SurrealBridgePool
     HAS_BRIDGE = True
 except ImportError:
     HAS_BRIDGE = False
@@ -30,20 +32,44 @@ except ImportError:
     LanceBridge = None
 
 
+# Arrow 스키마 (인스턴스마다 재생성하지 않도록 모듈 로드 시 1회 구성)
+if HAS_ARROW:
+    _CONTEXT_SCHEMA = pa.schema([
+        ('source', pa.string()),
+        ('key', pa.string()),
+        ('value', pa.string()),
+        ('timestamp', pa.timestamp('ms'))
+    ])
+    
+    if HAS_SCHEMA:
+        _FACT_SCHEMA = get_node_schema()
+    else:
+        _FACT_SCHEMA = pa.schema([
+            ('id', pa.string()),
+            ('label', pa.string()),
+            ('data_json', pa.string()),
+            ('edges_count', pa.int32()),
+            ('timestamp', pa.timestamp('ms'))
+        ])
+
+
 class CorpusCallosumCore:
     """CorpusCallosum 기본 클래스"""
     
     EMBEDDING_DIM = 384
+    LAST_TABLE_PATH = os.getenv("AIN_LAST_TABLE_PATH", ".ain_cache/last_table.arrow")
     
     def __init__(self, fact_core, nexus):
         self.left_brain = fact_core
         self.right_brain = nexus
         
-        # SurrealArrowBridge
+        # SurrealArrowBridge 커넥션 풀 (동시 push/pull용, bridge는 primary 연결)
+        self.bridge_pool: Optional[SurrealBridgePool] = None
         self.bridge: Optional[SurrealArrowBridge] = None
         if HAS_BRIDGE:
-            self.bridge = SurrealArrowBridge()
-            print("🔗 CorpusCallosum: SurrealArrowBridge 초기화 완료")
+            self.bridge_pool = SurrealBridgePool()
+            self.bridge = self.bridge_pool.primary
+            print(f"🔗 CorpusCallosum: SurrealBridgePool 초기화 완료 (size={self.bridge_pool.size})")
         
         # LanceBridge (Vector Memory)
         self.vector_bridge: Optional[LanceBridge] = None
@@ -65,35 +91,34 @@ class CorpusCallosumCore:
         self._sync_count: int = 0
         self._last_synced_evolution_index: int = 0
         
-        # 캐시
+        # 캐시 (마지막 동기화 테이블은 디스크에 두고 memory-map으로 접근 → RSS 미점유)
         self._last_batch = None
-        self._last_table = None
+        self._last_table_path: Optional[str] = None
         
-        # 스키마 설정
+        # FactCore → Arrow 변환 캐시 (format_fact_for_surreal)
+        self._fact_table_cache = None
+        self._fact_row_cache: Dict[str, tuple] = {}  # label → (node, edges_count, data_json)
+        self._dirty_node_labels: Set[str] = set()
+        self._fact_calls_since_refresh: int = 0
+        self._json_pool = None  # 대량 직렬화용 ProcessPoolExecutor (지연 생성)
+        
+        # 변경 없는 테이블 재전송 방지 (sync_pulse)
+        self._last_push_fingerprints: Dict[str, bytes] = {}  # table_name → 지문
+        self._last_history_marker: Optional[tuple] = None  # (기록 수, 마지막 timestamp)
+        
+        # bridge_to_arrow 스키마 캐시 (키 구성 → 추론된 스키마)
+        self._arrow_schema_cache: Dict[tuple, Any] = {}
+        
+        # 스키마 설정 (모듈 상수 공유)
         if HAS_ARROW:
-            self.context_schema = pa.schema([
-                ('source', pa.string()),
-                ('key', pa.string()),
-                ('value', pa.string()),
-                ('timestamp', pa.timestamp('ms'))
-            ])
-            
-            if HAS_SCHEMA:
-                self.fact_schema = get_node_schema()
-            else:
-                self.fact_schema = pa.schema([
-                    ('id', pa.string()),
-                    ('label', pa.string()),
-                    ('data_json', pa.string()),
-                    ('edges_count', pa.int32()),
-                    ('timestamp', pa.timestamp('ms'))
-                ])
+            self.context_schema = _CONTEXT_SCHEMA
+            self.fact_schema = _FACT_SCHEMA
     
     async def initialize_bridge(self) -> bool:
         """브릿지 연결 초기화"""
-        if self.bridge:
+        if self.bridge_pool:
             try:
-                self._bridge_connected = await self.bridge.connect()
+                self._bridge_connected = await self.bridge_pool.connect()
                 if self._bridge_connected:
                     print("✅ CorpusCallosum: SurrealDB 브릿지 연결 성공")
                 else:
@@ -114,6 +139,29 @@ class CorpusCallosumCore:
             "last_synced_evolution_index": self._last_synced_evolution_index,
         }
     
+    def _store_last_table(self, table):
+        """마지막 동기화 테이블을 Arrow IPC(Feather v2) 파일로 기록 (원자적 교체)"""
+        path = self.LAST_TABLE_PATH
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+            self._last_table_path = path
+        except (OSError, pa.ArrowException) as e:
+            print(f"⚠️ 마지막 동기화 테이블 기록 실패: {e}")
+
+    @property
+    def _last_table(self):
+        """마지막 동기화 테이블 (memory-map, zero-copy 읽기)"""
+        if not HAS_ARROW or not self._last_table_path or not os.path.exists(self._last_table_path):
+            return None
+        return pa.ipc.open_file(pa.memory_map(self._last_table_path, 'r')).read_all()
+
     def get_bridge_status(self) -> Dict[str, Any]:
         """브릿지 상태 정보"""
         return {
@@ -2,14 +2,22 @@
 Corpus Hydration: 부팅 시 DB에서 기억 복원
 """
 import json
-import asyncio
 from typing import Optional
 
 try:
     import pyarrow as pa
     HAS_ARROW = True
+    # 노드 복원에 필요한 컬럼만 (load_batch_from_arrow가 읽는 필드, 인출 시 타입 추론 생략)
+    NODE_HYDRATION_SCHEMA = pa.schema([("label", pa.string()), ("data_json", pa.string())])
 except ImportError:
     HAS_ARROW = False
+    NODE_HYDRATION_SCHEMA = None
+
+# JSON 디코딩 가속 (선택적, orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class HydrationMixin:
@@ -23,18 +31,38 @@ class HydrationMixin:
             "vector_db": False
         }
         
-        if self._bridge_connected and self.bridge:
+        if self._bridge_connected and self.bridge_pool:
             try:
-                node_table = await self._pull_nodes_from_db()
-                if node_table and node_table.num_rows > 0:
-                    self.left_brain.load_from_arrow(node_table)
-                    hydration_results["surreal_nodes"] = True
-                
-                edge_table = await self._pull_edges_from_db()
-                if edge_table and edge_table.num_rows > 0:
+                if hasattr(self.bridge, 'pull_batch_stream') and hasattr(self.left_brain, 'load_batch_from_arrow'):
+                    # 스트리밍: 배치 단위로 받아 바로 주입 (전체 테이블 미적재)
+                    node_rows = 0
+                    async with self.bridge_pool.acquire() as bridge:
+                        if not await self._is_empty_table(bridge, "node"):
+                            async for batch in bridge.pull_batch_stream("node", schema=NODE_HYDRATION_SCHEMA):
+                                node_rows += self.left_brain.load_batch_from_arrow(batch)
+                    if node_rows > 0:
+                        print(f"✅ FactCore: {node_rows}개 노드 복원 완료")
+                        hydration_results["surreal_nodes"] = True
+                    
                     if hasattr(self.left_brain, 'load_edges_from_arrow'):
-                        self.left_brain.load_edges_from_arrow(edge_table)
-                        hydration_results["surreal_edges"] = True
+                        edge_rows = 0
+                        async with self.bridge_pool.acquire() as bridge:
+                            if not await self._is_empty_table(bridge, "relation"):
+                                async for batch in bridge.pull_batch_stream("relation"):
+                                    self.left_brain.load_edges_from_arrow(batch)
+                                    edge_rows += batch.num_rows
+                        hydration_results["surreal_edges"] = edge_rows > 0
+                else:
+                    node_table = await self._pull_nodes_from_db()
+                    if node_table and node_table.num_rows > 0:
+                        self.left_brain.load_from_arrow(node_table)
+                        hydration_results["surreal_nodes"] = True
+                    
+                    edge_table = await self._pull_edges_from_db()
+                    if edge_table and edge_table.num_rows > 0:
+                        if hasattr(self.left_brain, 'load_edges_from_arrow'):
+                            self.left_brain.load_edges_from_arrow(edge_table)
+                            hydration_results["surreal_edges"] = True
                 
                 print(f"✨ SurrealDB Hydration 완료")
                     
@@ -58,32 +86,37 @@ class HydrationMixin:
         
         return success_count > 0
 
+    @staticmethod
+    async def _is_empty_table(bridge, table_name: str) -> bool:
+        """COUNT 선조회로 빈 테이블이면 True (전체 SELECT 왕복 생략, 조회 실패 시 False)"""
+        if not hasattr(bridge, 'count_rows'):
+            return False
+        return await bridge.count_rows(table_name) == 0
+
     async def _pull_nodes_from_db(self):
         """SurrealDB에서 노드 가져오기"""
-        if not self.bridge:
+        if not self.bridge_pool:
             return None
         
         try:
-            return await asyncio.to_thread(
-                self.bridge.pull_batch,
-                "SELECT * FROM node",
-                "node"
-            )
+            async with self.bridge_pool.acquire() as bridge:
+                if await self._is_empty_table(bridge, "node"):
+                    return None
+                return await bridge.pull_batch("SELECT * FROM node", "node", schema=NODE_HYDRATION_SCHEMA)
         except Exception as e:
             print(f"❌ DB Node Pull 실패: {e}")
             return None
 
     async def _pull_edges_from_db(self):
         """SurrealDB에서 엣지 가져오기"""
-        if not self.bridge:
+        if not self.bridge_pool:
             return None
         
         try:
-            return await asyncio.to_thread(
-                self.bridge.pull_batch,
-                "SELECT * FROM relation",
-                "relation"
-            )
+            async with self.bridge_pool.acquire() as bridge:
+                if await self._is_empty_table(bridge, "relation"):
+                    return None
+                return await bridge.pull_batch("SELECT * FROM relation", "relation")
         except Exception as e:
             print(f"❌ DB Edge Pull 실패: {e}")
             return None
@@ -105,28 +138,38 @@ class HydrationMixin:
     def _manual_inject(self, table) -> bool:
         """Arrow Table을 수동으로 파싱하여 FactCore에 주입"""
         try:
-            records = table.to_pylist()
+            from fact_core import KnowledgeNode
             
-            for record in records:
-                label = record.get('label', '')
-                data_json = record.get('data_json', '{}')
-                
+            # 행마다 dict를 만들지 않고 필요한 컬럼만 파이썬 리스트로 변환
+            num_rows = table.num_rows
+            names = table.column_names
+            labels = table.column('label').to_pylist() if 'label' in names else [''] * num_rows
+            data_jsons = table.column('data_json').to_pylist() if 'data_json' in names else ['{}'] * num_rows
+            
+            # 루프 안의 속성 체인 조회를 지역 변수로 끌어올림
+            nodes = self.left_brain.nodes
+            facts = self.left_brain.facts
+            loads = _json_loads
+            decode_error = json.JSONDecodeError
+            
+            for label, data_json in zip(labels, data_jsons):
                 if not label:
                     continue
                 
-                try:
-                    data = json.loads(data_json) if data_json else {}
-                except json.JSONDecodeError:
+                if not data_json or data_json == '{}':
                     data = {}
+                else:
+                    try:
+                        data = loads(data_json)
+                    except decode_error:
+                        data = {}
                 
-                from fact_core import KnowledgeNode
-                node = KnowledgeNode(label, data)
-                self.left_brain.nodes[label] = node
+                nodes[label] = KnowledgeNode(label, data)
                 
                 if isinstance(data, dict) and data:
-                    self.left_brain.facts[label] = data
+                    facts[label] = data
             
-            print(f"✅ Manual Inject: {len(records)}개 레코드 처리됨")
+            print(f"✅ Manual Inject: {num_rows}개 레코드 처리됨")
             return True
             
         except Exception as e:
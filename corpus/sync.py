@@ -6,6 +6,8 @@ import asyncio
 from datetime import datetime
 from typing import List, Dict, Optional
 
+import numpy as np
+
 try:
     import pyarrow as pa
     HAS_ARROW = True
@@ -25,29 +27,24 @@ class SyncMixin:
     async def sync_pulse(self) -> bool:
         """실행 주기마다 상태를 Arrow Batch로 직렬화하여 영구 저장"""
         sync_start = datetime.now()
-        results = []
         
         try:
-            # 좌뇌 동기화: FactCore → SurrealDB
-            if self._bridge_connected and self.bridge:
-                fact_result = await self._sync_fact_nodes()
-                results.append(("FactCore→SurrealDB", fact_result))
-            else:
-                results.append(("FactCore→SurrealDB", False))
-            
-            # 좌뇌 동기화: Nexus → SurrealDB
-            if self._bridge_connected and self.bridge:
-                nexus_result = await self._sync_nexus_memory()
-                results.append(("Nexus→SurrealDB", nexus_result))
-            else:
-                results.append(("Nexus→SurrealDB", False))
+            # 세 대상(SurrealDB 노드/기록, LanceDB)은 서로 독립 → 동시에 실행
+            bridge_ready = bool(self._bridge_connected and self.bridge_pool)
+            vector_ready = bool(self._vector_connected and self.vector_bridge)
+            plan = [
+                ("FactCore→SurrealDB", bridge_ready, self._sync_fact_nodes),
+                ("Nexus→SurrealDB", bridge_ready, self._sync_nexus_memory),
+                ("Evolution→LanceDB", vector_ready, self._sync_semantic_memory),
+            ]
             
-            # 우뇌 동기화: Evolution → LanceDB
-            if self._vector_connected and self.vector_bridge:
-                semantic_result = await self._sync_semantic_memory()
-                results.append(("Evolution→LanceDB", semantic_result))
-            else:
-                results.append(("Evolution→LanceDB", False))
+            active = [(name, sync) for name, ready, sync in plan if ready]
+            outcomes = await asyncio.gather(*(sync() for _, sync in active), return_exceptions=True)
+            done = {
+                name: (not isinstance(outcome, BaseException)) and bool(outcome)
+                for (name, _), outcome in zip(active, outcomes)
+            }
+            results = [(name, done.get(name, False)) for name, _, _ in plan]
             
             self._last_sync_time = sync_start
             self._sync_count += 1
@@ -71,14 +68,15 @@ class SyncMixin:
                 node_table = self.format_fact_for_surreal()
                 
             if node_table and node_table.num_rows > 0:
-                await asyncio.to_thread(self.bridge.push_batch_sync, node_table, "node")
-                print(f"  └─ FactCore Nodes: {node_table.num_rows}개 동기화됨")
+                if await self._push_if_changed(node_table, "node"):
+                    print(f"  └─ FactCore Nodes: {node_table.num_rows}개 동기화됨")
+                    await asyncio.to_thread(self._store_last_table, node_table)
             
             if HAS_SERIALIZER:
                 edge_table = GraphSerializer.edges_to_table(self.left_brain.nodes)
                 if edge_table and edge_table.num_rows > 0:
-                    await asyncio.to_thread(self.bridge.push_batch_sync, edge_table, "relation")
-                    print(f"  └─ FactCore Edges: {edge_table.num_rows}개 동기화됨")
+                    if await self._push_if_changed(edge_table, "relation"):
+                        print(f"  └─ FactCore Edges: {edge_table.num_rows}개 동기화됨")
             
             return True
             
@@ -97,10 +95,17 @@ class SyncMixin:
             if not history:
                 return True
             
+            # 기록은 append-only → 길이와 마지막 timestamp가 같으면 변경 없음
+            marker = (len(history), str(history[-1].get('timestamp', '')))
+            if marker == self._last_history_marker:
+                return True
+            
             history_table = self._history_to_arrow(history)
             if history_table and history_table.num_rows > 0:
-                await asyncio.to_thread(self.bridge.push_batch_sync, history_table, "evolution_history")
-                print(f"  └─ Nexus History: {history_table.num_rows}개 동기화됨")
+                pushed = await self.bridge_pool.push_batch(history_table, "evolution_history")
+                if pushed:
+                    self._last_history_marker = marker
+                    print(f"  └─ Nexus History: {history_table.num_rows}개 동기화됨")
             
             return True
             
@@ -108,6 +113,37 @@ class SyncMixin:
             print(f"❌ Nexus 메모리 동기화 실패: {e}")
             return False
 
+    @staticmethod
+    def _table_fingerprint(table, skip_columns=("timestamp",)) -> bytes:
+        """
+        Arrow 버퍼를 그대로 해싱한 테이블 지문
+        
+        매 호출마다 바뀌는 timestamp 컬럼은 제외 → 내용이 같으면 같은 지문.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(table.num_rows).encode())
+        for name, column in zip(table.column_names, table.columns):
+            if name in skip_columns:
+                continue
+            digest.update(name.encode())
+            for chunk in column.chunks:
+                for buf in chunk.buffers():
+                    if buf is not None:
+                        digest.update(buf)
+        return digest.digest()
+
+    async def _push_if_changed(self, table, table_name: str) -> bool:
+        """직전 push와 지문이 같으면 건너뜀 → push에 성공했으면 True"""
+        fingerprint = self._table_fingerprint(table)
+        if self._last_push_fingerprints.get(table_name) == fingerprint:
+            return False
+        
+        # 풀 멤버 연결로 배치를 분산 저장 (연결이 묶인 이 이벤트 루프에서 실행)
+        pushed = await self.bridge_pool.push_batch(table, table_name)
+        if pushed:
+            self._last_push_fingerprints[table_name] = fingerprint
+        return bool(pushed)
+
     async def _sync_semantic_memory(self) -> bool:
         """진화 기록을 LanceDB에 벡터화하여 저장"""
         if not self.vector_bridge or not self._vector_connected:
@@ -127,39 +163,27 @@ class SyncMixin:
             if not new_records:
                 return True
             
-            success_count = 0
+            # 1단계: 설명이 있는 기록만 모아 텍스트/메타데이터 목록 구성
+            texts = []
+            metas = []
             for record in new_records:
-                try:
-                    description = record.get('description', '')
-                    if not description:
-                        continue
-                    
-                    metadata = {
-                        "timestamp": record.get('timestamp', ''),
-                        "type": record.get('type', 'EVOLUTION'),
-                        "action": record.get('action', 'Unknown'),
-                        "file": record.get('file', ''),
-                        "status": record.get('status', 'unknown'),
-                    }
-                    
-                    if hasattr(self.right_brain, '_generate_embedding'):
-                        vector = self.right_brain._generate_embedding(description)
-                    else:
-                        vector = self._generate_placeholder_embedding(description)
-                    
-                    stored = self.vector_bridge.add_memory(
-                        text=description,
-                        vector=vector,
-                        memory_type="evolution",
-                        source="evolution_history",
-                        metadata=metadata
-                    )
-                    
-                    if stored:
-                        success_count += 1
-                        
-                except Exception as e:
+                description = record.get('description', '')
+                if not description:
                     continue
+                texts.append(description)
+                metas.append({
+                    "timestamp": record.get('timestamp', ''),
+                    "type": record.get('type', 'EVOLUTION'),
+                    "action": record.get('action', 'Unknown'),
+                    "file": record.get('file', ''),
+                    "status": record.get('status', 'unknown'),
+                })
+            
+            # 2단계: 임베딩 일괄 생성 → 3단계: 한 번의 append로 저장
+            # (블로킹 작업이므로 스레드에서 실행해 다른 동기화 작업과 겹치게 함)
+            success_count = 0
+            if texts:
+                success_count = await asyncio.to_thread(self._store_semantic_batch, texts, metas)
             
             self._last_synced_evolution_index = len(full_history)
             print(f"  └─ Semantic Memory: {success_count}/{len(new_records)}개 벡터화 완료")
@@ -169,21 +193,60 @@ class SyncMixin:
             print(f"❌ Semantic Memory 동기화 실패: {e}")
             return False
 
-    def _generate_placeholder_embedding(self, text: str) -> List[float]:
-        """Placeholder 임베딩 생성"""
-        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    def _store_semantic_batch(self, texts: List[str], metas: List[Dict]) -> int:
+        """임베딩 생성 후 LanceDB에 저장 → 저장된 기억 수"""
+        vectors = self._generate_embeddings(texts)
+        if hasattr(self.vector_bridge, 'add_memories'):
+            return self.vector_bridge.add_memories([
+                {
+                    "text": text,
+                    "vector": vector,
+                    "memory_type": "evolution",
+                    "source": "evolution_history",
+                    "metadata": metadata,
+                }
+                for text, vector, metadata in zip(texts, vectors, metas)
+            ])
         
-        vector = []
-        for i in range(0, min(len(text_hash), self.EMBEDDING_DIM * 2), 2):
-            byte_val = int(text_hash[i:i+2], 16)
-            normalized = (byte_val - 128) / 128.0
-            vector.append(normalized)
-        
-        while len(vector) < self.EMBEDDING_DIM:
-            idx = len(vector) % len(vector) if vector else 0
-            vector.append(vector[idx] * 0.9 if vector else 0.0)
+        success_count = 0
+        for text, vector, metadata in zip(texts, vectors, metas):
+            try:
+                if self.vector_bridge.add_memory(
+                    text=text,
+                    vector=vector,
+                    memory_type="evolution",
+                    source="evolution_history",
+                    metadata=metadata
+                ):
+                    success_count += 1
+            except Exception:
+                continue
+        return success_count
+
+    def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        텍스트 목록 임베딩 (우뇌의 임베딩 API → Placeholder 순)
+        """
+        if hasattr(self.right_brain, '_generate_embedding'):
+            return [self.right_brain._generate_embedding(text) for text in texts]
+        return self._generate_placeholder_embeddings(texts).tolist()
+
+    def _generate_placeholder_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Placeholder 임베딩 일괄 생성 → (len(texts), EMBEDDING_DIM) float32 행렬"""
+        buf = b"".join(
+            hashlib.shake_128(text.encode('utf-8')).digest(self.EMBEDDING_DIM) for text in texts
+        )
+        matrix = np.frombuffer(buf, dtype=np.uint8).reshape(len(texts), self.EMBEDDING_DIM)
+        return (matrix.astype(np.float32) - 128.0) / 128.0
+
+    def _generate_placeholder_embedding(self, text: str) -> List[float]:
+        """
+        Placeholder 임베딩 생성
         
-        return vector[:self.EMBEDDING_DIM]
+        SHAKE-128 가변 길이 다이제스트로 EMBEDDING_DIM 바이트를 한 번에 뽑아
+        [-1, 1) 범위로 사상한다 (차원마다 독립적인 해시 바이트, 같은 텍스트 → 같은 벡터).
+        """
+        return self._generate_placeholder_embeddings([text])[0].tolist()
 
     def sync_facts_to_surreal(self) -> bool:
         """FactCore 동기화 (동기 버전)"""
@@ -1,16 +1,41 @@
 """
 Corpus Transform: Arrow 변환 및 Context Synthesis
 """
+import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import chain
 from typing import List, Dict, Optional
 
 try:
     import pyarrow as pa
-    import pandas as pd
+    import pyarrow.compute as pc
     HAS_ARROW = True
 except ImportError:
     HAS_ARROW = False
 
+try:
+    from database.serializer import dumps_json
+except ImportError:
+    def dumps_json(value, default=None) -> str:
+        return json.dumps(value, ensure_ascii=False, default=default)
+
+def _dump_chunk(data_list: List) -> List[str]:
+    """노드 data 묶음 직렬화 (ProcessPoolExecutor 워커에서 실행되므로 모듈 레벨 함수)"""
+    return [dumps_json(data) for data in data_list]
+
+
+# evolution_history 동기화 컬럼 (_history_to_arrow 전용, error 컬럼 제외)
+HISTORY_SYNC_SCHEMA = pa.schema([
+    ('timestamp', pa.string()),
+    ('type', pa.string()),
+    ('action', pa.string()),
+    ('file', pa.string()),
+    ('description', pa.string()),
+    ('status', pa.string()),
+]) if HAS_ARROW else None
+
 
 class TransformMixin:
     """변환 믹스인 - CorpusCallosum에서 사용"""
@@ -53,45 +78,140 @@ class TransformMixin:
         
         return "\n".join(context_parts)
 
-    def bridge_to_arrow(self, data: List[Dict]):
-        """범용 데이터를 Arrow Table로 변환"""
+    def bridge_to_arrow(self, data: List[Dict], schema=None):
+        """
+        범용 데이터를 Arrow Table로 변환
+        
+        schema를 넘기거나, 같은 키 구성으로 이전에 추론한 스키마가 있으면
+        전체 행 스캔(타입 추론) 없이 바로 변환한다.
+        """
         if not data or not HAS_ARROW:
             return None
         
         try:
-            return pa.Table.from_pylist(data)
+            key = tuple(data[0].keys())
+            schema = schema or self._arrow_schema_cache.get(key)
+            if schema is not None:
+                try:
+                    return pa.Table.from_pylist(data, schema=schema)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass  # 타입이 달라진 데이터 → 재추론
+            
+            table = pa.Table.from_pylist(data)
+            if not any(pa.types.is_null(field.type) for field in table.schema):
+                self._arrow_schema_cache[key] = table.schema
+            return table
         except Exception as e:
             print(f"❌ Arrow 변환 실패: {e}")
             return None
 
+    # 노드 객체 교체 없이 data가 제자리 수정된 경우를 위한 주기적 전체 재직렬화 간격
+    FACT_FULL_REFRESH_INTERVAL = 10
+
+    def mark_node_dirty(self, label: str):
+        """노드 data를 제자리 수정했을 때 호출 → 다음 변환에서 해당 노드만 재직렬화"""
+        self._dirty_node_labels.add(label)
+
+    # 재직렬화 대상이 이 수 이상이면 프로세스 풀로 분산 (미만은 풀 오버헤드가 더 큼)
+    PARALLEL_DUMPS_THRESHOLD = 10_000
+    # 워커가 1개면 pickle 왕복 비용만 추가되므로 병렬화하지 않음
+    JSON_POOL_WORKERS = (os.cpu_count() or 1) // 2
+
+    def _get_json_pool(self) -> ProcessPoolExecutor:
+        """직렬화용 프로세스 풀 (최초 사용 시 생성)"""
+        if self._json_pool is None:
+            self._json_pool = ProcessPoolExecutor(max_workers=self.JSON_POOL_WORKERS)
+        return self._json_pool
+
+    def close_json_pool(self):
+        """직렬화용 프로세스 풀 종료 (생성된 적 없으면 무시)"""
+        if self._json_pool is not None:
+            self._json_pool.shutdown()
+            self._json_pool = None
+
+    def _dump_node_data(self, data_list: List) -> List[str]:
+        """
+        노드 data 목록을 JSON 문자열 목록으로 직렬화 (입력 순서 유지)
+        
+        대량일 때만 워커 수만큼 나눠 프로세스 풀에서 병렬 처리한다 (GIL 우회).
+        """
+        if len(data_list) < self.PARALLEL_DUMPS_THRESHOLD or self.JSON_POOL_WORKERS < 2:
+            return _dump_chunk(data_list)
+        
+        try:
+            pool = self._get_json_pool()
+            size = -(-len(data_list) // self.JSON_POOL_WORKERS)
+            chunks = [data_list[i:i + size] for i in range(0, len(data_list), size)]
+            return list(chain.from_iterable(pool.map(_dump_chunk, chunks)))
+        except Exception as e:
+            print(f"⚠️ 병렬 직렬화 실패, 단일 프로세스로 진행: {e}")
+            return _dump_chunk(data_list)
+
     def format_fact_for_surreal(self):
-        """FactCore 데이터를 Arrow Table로 변환"""
+        """
+        FactCore 데이터를 Arrow Table로 변환
+        
+        노드별 직렬화 결과를 캐시하여 바뀐 노드만 직렬화한다 (dumps_json).
+        변경 감지: 노드 객체 교체(save_facts 재빌드 포함), 엣지 수 변화, mark_node_dirty 호출.
+        아무것도 바뀌지 않았으면 이전 테이블에서 timestamp 컬럼만 교체해 재사용한다.
+        """
         if not HAS_ARROW:
             return None
         
         try:
-            now = pd.Timestamp.now().floor('ms')
-            data = []
+            now = pa.scalar(datetime.now(), type=pa.timestamp('ms'))  # ms 단위로 절삭
+            nodes = self.left_brain.nodes
             
-            for label, node in self.left_brain.nodes.items():
-                data.append({
-                    'id': label,
-                    'label': label,
-                    'data_json': json.dumps(node.data, ensure_ascii=False),
-                    'edges_count': len(node.edges),
-                    'timestamp': now
-                })
-            
-            if not data:
+            if not nodes:
                 return None
             
-            return pa.table({
-                'id': [d['id'] for d in data],
-                'label': [d['label'] for d in data],
-                'data_json': [d['data_json'] for d in data],
-                'edges_count': [d['edges_count'] for d in data],
-                'timestamp': pa.array([d['timestamp'] for d in data], type=pa.timestamp('ms'))
-            })
+            # 주기적으로 전체 캐시 무효화 (제자리 수정 누락 대비)
+            self._fact_calls_since_refresh += 1
+            if self._fact_calls_since_refresh >= self.FACT_FULL_REFRESH_INTERVAL:
+                self._fact_row_cache.clear()
+                self._fact_calls_since_refresh = 0
+            
+            old_cache = self._fact_row_cache
+            dirty = self._dirty_node_labels
+            new_cache = {}
+            changed = len(old_cache) != len(nodes)
+            
+            stale = []
+            for label, node in nodes.items():
+                entry = old_cache.get(label)
+                if entry is None or entry[0] is not node or entry[1] != len(node.edges) or label in dirty:
+                    stale.append(label)
+                new_cache[label] = entry  # stale 항목은 아래에서 교체
+            
+            if stale:
+                dumped = self._dump_node_data([nodes[label].data for label in stale])
+                for label, data_json in zip(stale, dumped):
+                    node = nodes[label]
+                    new_cache[label] = (node, len(node.edges), data_json)
+                changed = True
+            
+            self._fact_row_cache = new_cache
+            self._dirty_node_labels = set()
+            
+            timestamps = pa.repeat(now, len(new_cache))
+            cached_table = self._fact_table_cache
+            if not changed and cached_table is not None:
+                table = cached_table.set_column(
+                    cached_table.schema.get_field_index('timestamp'), 'timestamp', timestamps
+                )
+            else:
+                labels = list(new_cache)
+                entries = list(new_cache.values())
+                table = pa.table({
+                    'id': labels,
+                    'label': labels,
+                    'data_json': [e[2] for e in entries],
+                    'edges_count': [e[1] for e in entries],
+                    'timestamp': timestamps
+                })
+            
+            self._fact_table_cache = table
+            return table
             
         except Exception as e:
             print(f"❌ FactCore → Arrow 변환 실패: {e}")
@@ -103,14 +223,26 @@ class TransformMixin:
             return None
         
         try:
-            return pa.table({
-                'timestamp': [str(h.get('timestamp', '')) for h in history],
-                'type': [str(h.get('type', '')) for h in history],
-                'action': [str(h.get('action', '')) for h in history],
-                'file': [str(h.get('file', '')) for h in history],
-                'description': [str(h.get('description', ''))[:1000] for h in history],
-                'status': [str(h.get('status', '')) for h in history],
-            })
+            # 한 번의 순회로 컬럼을 모으고, 고정 스키마로 타입 추론 생략
+            ts, tp, ac, fi, de, st = [], [], [], [], [], []
+            for h in history:
+                ts.append(str(h.get('timestamp', '')))
+                tp.append(str(h.get('type', '')))
+                ac.append(str(h.get('action', '')))
+                fi.append(str(h.get('file', '')))
+                de.append(str(h.get('description', '')))
+                st.append(str(h.get('status', '')))
+            
+            batch = pa.RecordBatch.from_pydict({
+                'timestamp': ts,
+                'type': tp,
+                'action': ac,
+                'file': fi,
+                # 1000자 절삭은 행마다 파이썬 슬라이스 대신 Arrow 커널 한 번으로
+                'description': pc.utf8_slice_codeunits(pa.array(de, type=pa.string()), 0, 1000),
+                'status': st,
+            }, schema=HISTORY_SYNC_SCHEMA)
+            return pa.Table.from_batches([batch])
         except Exception as e:
             print(f"❌ History → Arrow 변환 실패: {e}")
             return None
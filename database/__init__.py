@@ -5,6 +5,7 @@ AIN Database Layer Package
 
 주요 컴포넌트:
 - SurrealArrowBridge: SurrealDB ↔ Arrow 양방향 브릿지 (SSOT)
+- SurrealBridgePool: 동시 push/pull용 SurrealArrowBridge 커넥션 풀
 - ArrowBufferManager: 메모리 효율적 버퍼 관리
 - ZeroCopyBufferExposer: C Data Interface 기반 Zero-Copy
 - ArrowDiskSpiller: 대용량 데이터 디스크 스필링
@@ -32,6 +33,7 @@ DEPRECATED (이 패키지로 대체됨):
 # Core Bridge (SSOT) - 항상 사용 가능
 from .surreal_bridge import (
     SurrealArrowBridge,
+    SurrealBridgePool,
     ArrowBufferManager,
     get_bridge,
     get_connected_bridge,
@@ -70,6 +72,7 @@ except ImportError:
 __all__ = [
     # Core (필수)
     "SurrealArrowBridge",
+    "SurrealBridgePool",
     "ArrowBufferManager",
     "get_bridge",
     "get_connected_bridge",
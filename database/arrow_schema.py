@@ -14,7 +14,10 @@ Step 3 Evolution - Full-Cycle Persistence:
 import pyarrow as pa
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from types import MappingProxyType
+import functools
 import json
+import threading
 
 
 # =============================================================================
@@ -183,35 +186,51 @@ def history_record_to_dict(record: Dict[str, Any]) -> Dict[str, Any]:
 # Schema Registry (Singleton Pattern)
 # =============================================================================
 
+@functools.cache
+def _build_schemas() -> "MappingProxyType[str, pa.Schema]":
+    """기본 스키마 묶음 (프로세스당 한 번만 생성, 읽기 전용)"""
+    return MappingProxyType({
+        "node": get_node_schema(),
+        "history": get_history_schema(),
+        "interaction": get_interaction_schema(),
+        "metrics": get_metrics_schema(),
+        "system_state": get_system_state_schema(),
+    })
+
+
 class SchemaRegistry:
     """
     모든 스키마에 대한 중앙 집중식 레지스트리
+    
+    기본 스키마는 읽기 전용(_baseline), 런타임 등록 스키마는 _custom에 보관한다.
     """
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._schemas = {
-                "node": get_node_schema(),
-                "history": get_history_schema(),
-                "interaction": get_interaction_schema(),
-                "metrics": get_metrics_schema(),
-                "system_state": get_system_state_schema(),
-            }
+            with cls._lock:
+                # 동시 기동 시 한 스레드만 생성 (double-checked locking)
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._baseline = _build_schemas()
+                    instance._custom = {}
+                    cls._instance = instance
         return cls._instance
     
     def get(self, name: str) -> Optional[pa.Schema]:
         """스키마 이름으로 조회"""
-        return self._schemas.get(name)
+        schema = self._custom.get(name)
+        return schema if schema is not None else self._baseline.get(name)
     
     def register(self, name: str, schema: pa.Schema):
         """커스텀 스키마 등록"""
-        self._schemas[name] = schema
+        with self._lock:
+            self._custom[name] = schema
     
     def list_schemas(self) -> List[str]:
         """등록된 모든 스키마 이름 반환"""
-        return list(self._schemas.keys())
+        return list(self._baseline) + [name for name in self._custom if name not in self._baseline]
 
 
 def get_schema_registry() -> SchemaRegistry:
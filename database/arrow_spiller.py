@@ -1,6 +1,6 @@
 import pyarrow as pa
-import pyarrow.os_get_handle
 import os
+from typing import Dict, Tuple
 
 class ArrowDiskSpiller:
     """
@@ -10,22 +10,70 @@ class ArrowDiskSpiller:
     def __init__(self, storage_path="/tmp/ain_arrow_spill"):
         self.storage_path = storage_path
         os.makedirs(storage_path, exist_ok=True)
+        # table_name → (OSFile, RecordBatchStreamWriter). 배치마다 파일을 다시 열지 않고 이어 씀
+        self._writers: Dict[str, Tuple[pa.NativeFile, pa.ipc.RecordBatchStreamWriter]] = {}
+
+    def _stream_path(self, table_name: str) -> str:
+        """추가 기록용 IPC 스트림 파일 경로"""
+        return os.path.join(self.storage_path, f"{table_name}.arrows")
+
+    def _file_path(self, table_name: str) -> str:
+        """finalize 후 랜덤 액세스용 IPC 파일 경로"""
+        return os.path.join(self.storage_path, f"{table_name}.arrow")
 
     def spill_batch(self, table_name: str, batch: pa.RecordBatch):
         """RecordBatch를 디스크에 직렬화하여 저장 (Memory-Mapped 준비)"""
-        file_path = os.path.join(self.storage_path, f"{table_name}.arrow")
+        file_path = self._stream_path(table_name)
+        
+        entry = self._writers.get(table_name)
+        if entry is None:
+            # 첫 배치에서만 스트림을 연다 (이전 실행의 스트림 뒤에 스키마를 다시 쓰면 깨지므로 새로 시작)
+            sink = pa.OSFile(file_path, 'wb')
+            entry = (sink, pa.ipc.new_stream(sink, batch.schema))
+            self._writers[table_name] = entry
         
-        # 파일 시스템에 Arrow IPC 스트림으로 기록
-        with pa.OSFile(file_path, 'wb') as f:
-            with pa.ipc.new_file(f, batch.schema) as writer:
-                writer.write_batch(batch)
+        # Arrow IPC 스트림에 배치만 추가 (footer/스키마 재기록 없음)
+        entry[1].write_batch(batch)
         return file_path
 
+    def finalize(self, table_name: str, as_file: bool = False):
+        """
+        스트림 기록 종료 (EOS 기록 후 닫기)
+        
+        as_file=True면 스트림을 랜덤 액세스용 IPC 파일 포맷으로 다시 쓰고 스트림 파일은 지운다.
+        """
+        entry = self._writers.pop(table_name, None)
+        if entry is not None:
+            sink, writer = entry
+            writer.close()
+            sink.close()
+        
+        stream_path = self._stream_path(table_name)
+        if not as_file or not os.path.exists(stream_path):
+            return
+        
+        with pa.memory_map(stream_path, 'r') as source:
+            reader = pa.ipc.open_stream(source)
+            with pa.OSFile(self._file_path(table_name), 'wb') as f:
+                with pa.ipc.new_file(f, reader.schema) as writer:
+                    for batch in reader:
+                        writer.write_batch(batch)
+        os.remove(stream_path)
+
+    def close(self):
+        """열린 모든 스트림 종료"""
+        for table_name in list(self._writers):
+            self.finalize(table_name)
+
     def mmap_load(self, table_name: str) -> pa.Table:
         """디스크에 저장된 Arrow 데이터를 메모리 맵으로 연결 (Zero-Copy Read)"""
-        file_path = os.path.join(self.storage_path, f"{table_name}.arrow")
-        source = pa.memory_map(file_path, 'r')
-        # 데이터를 메모리로 복사하지 않고 주소값만 참조
+        stream_path = self._stream_path(table_name)
+        # 데이터를 메모리로 복사하지 않고 주소값만 참조 (스트림도 mmap이 모든 버퍼를 뒷받침)
+        if os.path.exists(stream_path):
+            # 기록 중인 스트림도 이미 쓴 배치까지는 읽을 수 있음
+            return pa.ipc.open_stream(pa.memory_map(stream_path, 'r')).read_all()
+        
+        source = pa.memory_map(self._file_path(table_name), 'r')
         return pa.ipc.RecordBatchFileReader(source).read_all()
 
     def sync_surreal_to_mmap(self, table_name: str, surreal_client):
@@ -1,46 +1,86 @@
 import ctypes
 import pyarrow as pa
-from typing import Tuple
+from typing import Dict, Tuple
+
+# release 콜백: void (*release)(struct ArrowXxx*)
+_RELEASE_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+
+class ArrowSchemaStruct(ctypes.Structure):
+    """Arrow C Data Interface: ArrowSchema 구조체 정의"""
 
 class ArrowArrayStruct(ctypes.Structure):
     """Arrow C Data Interface: ArrowArray 구조체 정의"""
-    _fields_ = [
-        ("length", ctypes.c_int64),
-        ("null_count", ctypes.c_int64),
-        ("offset", ctypes.c_int64),
-        ("n_buffers", ctypes.c_int64),
-        ("n_children", ctypes.c_int64),
-        ("buffers", ctypes.POINTER(ctypes.c_void_p)),
-        ("children", ctypes.POINTER(ctypes.POINTER(None))), # Recursive Pointer
-        ("dictionary", ctypes.c_void_p),
-        ("release", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
-        ("private_data", ctypes.c_void_p),
-    ]
+
+# 자기 참조 필드(children/dictionary)가 있어 클래스 선언 후 _fields_ 지정 (C 헤더와 동일한 레이아웃)
+ArrowSchemaStruct._fields_ = [
+    ("format", ctypes.c_char_p),
+    ("name", ctypes.c_char_p),
+    ("metadata", ctypes.c_char_p),
+    ("flags", ctypes.c_int64),
+    ("n_children", ctypes.c_int64),
+    ("children", ctypes.POINTER(ctypes.POINTER(ArrowSchemaStruct))),  # struct ArrowSchema**
+    ("dictionary", ctypes.POINTER(ArrowSchemaStruct)),
+    ("release", _RELEASE_FUNC),
+    ("private_data", ctypes.c_void_p),
+]
+
+ArrowArrayStruct._fields_ = [
+    ("length", ctypes.c_int64),
+    ("null_count", ctypes.c_int64),
+    ("offset", ctypes.c_int64),
+    ("n_buffers", ctypes.c_int64),
+    ("n_children", ctypes.c_int64),
+    ("buffers", ctypes.POINTER(ctypes.c_void_p)),
+    ("children", ctypes.POINTER(ctypes.POINTER(ArrowArrayStruct))),  # struct ArrowArray**
+    ("dictionary", ctypes.POINTER(ArrowArrayStruct)),
+    ("release", _RELEASE_FUNC),
+    ("private_data", ctypes.c_void_p),
+]
 
 class CDataBridge:
     """
     SurrealDB(Rust)에서 생성된 메모리 주소를 Arrow Python 객체로 
     Zero-copy 바인딩하는 핵심 브릿지.
     """
+    # allocate_placeholder로 만든 구조체 (주소 → 객체). import 전까지 GC되지 않도록 보관
+    _placeholders: Dict[int, ctypes.Structure] = {}
+
     @staticmethod
     def wrap_raw_pointers(array_ptr: int, schema_ptr: int) -> pa.Array:
         """
         메모리 주소(Pointer)를 받아 pyarrow.Array로 즉시 변환.
         SurrealDB의 RELATION(in, out) 정보를 포함하는 StructArray 처리에 최적화.
         """
-        # C Data Interface를 통해 전달된 포인터를 pyarrow로 Import
-        # 이 과정에서 실제 데이터 복사는 발생하지 않으며 포인터만 매핑됨
-        c_array = pa.foreign_ptr_to_array(array_ptr, schema_ptr)
-        return c_array
+        # C Data Interface import: 버퍼는 복사 없이 매핑되고,
+        # 구조체 소유권(release 콜백)은 pyarrow로 이전되어 Array 해제 시 호출됨
+        try:
+            return pa.Array._import_from_c(array_ptr, schema_ptr)
+        finally:
+            CDataBridge._placeholders.pop(array_ptr, None)
+            CDataBridge._placeholders.pop(schema_ptr, None)
+
+    @staticmethod
+    def wrap_schema_pointer(schema_ptr: int) -> pa.Schema:
+        """ArrowSchema 포인터만 별도로 pyarrow.Schema로 변환"""
+        try:
+            return pa.Schema._import_from_c(schema_ptr)
+        finally:
+            CDataBridge._placeholders.pop(schema_ptr, None)
 
     @staticmethod
     def allocate_placeholder() -> Tuple[int, int]:
         """
         SurrealDB FFI 호출 전, 데이터를 담을 빈 C 구조체 메모리 할당.
+        
+        ctypes 구조체로 할당하므로 C ABI 정렬이 보장되고, release=NULL로 초기화된다.
+        구조체는 wrap_raw_pointers/wrap_schema_pointer가 import할 때까지 보관된다.
         """
-        schema = ctypes.create_string_buffer(80) # ArrowSchema size
-        array = ctypes.create_string_buffer(128) # ArrowArray size
-        return ctypes.addressof(schema), ctypes.addressof(array)
+        schema = ArrowSchemaStruct()
+        array = ArrowArrayStruct()
+        schema_ptr, array_ptr = ctypes.addressof(schema), ctypes.addressof(array)
+        CDataBridge._placeholders[schema_ptr] = schema
+        CDataBridge._placeholders[array_ptr] = array
+        return schema_ptr, array_ptr
 
 # AIN Core는 이 브릿지를 통해 SurrealDB의 대용량 Graph Edge 데이터를 
 # Python 객체 생성 오버헤드 없이 즉시 Arrow Table로 변환하여 분석에 투입함.
\ No newline at end of file
@@ -23,12 +23,15 @@ Usage:
 """
 
 import hashlib
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 # API Embedding Service 임포트
 try:
-    from api.embedding import EmbeddingService, get_embedding, HAS_GENAI
+    from api.embedding import EmbeddingService, get_embedding, get_embedding_service, HAS_GENAI
     HAS_EMBEDDING = True
 except ImportError:
     HAS_EMBEDDING = False
@@ -44,6 +47,15 @@ except ImportError:
     LanceBridge = None
 
 
+def text_digest(text: str) -> bytes:
+    """
+    텍스트 32바이트 다이제스트 (캐시 키와 폴백 벡터가 공유 → 텍스트당 해시 1회)
+    
+    폴백 벡터가 LanceDB에 저장돼 있을 수 있으므로 기존과 같은 SHA-256을 유지한다.
+    """
+    return hashlib.sha256(text.encode('utf-8')).digest()
+
+
 class EmbeddingCache:
     """
     임베딩 캐시 - 동일 텍스트에 대한 중복 API 호출 방지
@@ -55,39 +67,44 @@ class EmbeddingCache:
     MAX_CACHE_SIZE = 1000  # 최대 캐시 항목 수
     
     def __init__(self):
-        self._cache: Dict[str, List[float]] = {}
-        self._access_order: List[str] = []  # LRU 추적
+        # 삽입/접근 순서 = LRU 순서 (move_to_end / popitem 모두 O(1))
+        # 벡터는 float32 ndarray로 보관 (384차원 기준 list 약 10KB → 1.5KB)
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
     
-    def _compute_key(self, text: str) -> str:
-        """텍스트의 해시 키 생성"""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+    def _compute_key(self, text: str, digest: Optional[bytes] = None) -> bytes:
+        """텍스트의 해시 키 생성 (text_digest 앞 8바이트, 이미 계산한 digest가 있으면 재사용)"""
+        return (digest or text_digest(text))[:8]
     
-    def get(self, text: str) -> Optional[List[float]]:
+    def get(self, text: str, digest: Optional[bytes] = None) -> Optional[np.ndarray]:
         """캐시에서 벡터 조회"""
-        key = self._compute_key(text)
-        if key in self._cache:
+        key = self._compute_key(text, digest)
+        vector = self._cache.get(key)
+        if vector is not None:
             # LRU 업데이트
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
-        return None
+            self._cache.move_to_end(key)
+        return vector
     
-    def set(self, text: str, vector: List[float]):
-        """캐시에 벡터 저장"""
-        key = self._compute_key(text)
+    def set(self, text: str, vector: np.ndarray, digest: Optional[bytes] = None):
+        """
+        캐시에 벡터 저장
         
-        # 캐시 크기 제한 (LRU 방출)
-        if len(self._cache) >= self.MAX_CACHE_SIZE:
-            oldest_key = self._access_order.pop(0)
-            del self._cache[oldest_key]
+        get()은 같은 배열 객체를 반환하므로 읽기 전용으로 고정한다
+        (호출자의 v /= norm 같은 제자리 연산이 캐시를 오염시키지 않도록, 수정하려면 copy()).
+        """
+        key = self._compute_key(text, digest)
+        
+        cached = np.asarray(vector, dtype=np.float32)
+        cached.flags.writeable = False
+        self._cache[key] = cached
+        self._cache.move_to_end(key)
         
-        self._cache[key] = vector
-        self._access_order.append(key)
+        # 캐시 크기 제한 (LRU 방출)
+        if len(self._cache) > self.MAX_CACHE_SIZE:
+            self._cache.popitem(last=False)
     
     def clear(self):
         """캐시 초기화"""
         self._cache.clear()
-        self._access_order.clear()
     
     def stats(self) -> Dict[str, int]:
         """캐시 통계"""
@@ -128,8 +145,7 @@ class DatabaseEmbeddingService:
         self._embedding_service: Optional[EmbeddingService] = None
         if HAS_EMBEDDING:
             try:
-                from api.embedding import EmbeddingService
-                self._embedding_service = EmbeddingService()
+                self._embedding_service = get_embedding_service()
             except Exception as e:
                 print(f"⚠️ EmbeddingService 초기화 실패: {e}")
         
@@ -165,7 +181,7 @@ class DatabaseEmbeddingService:
         """LanceBridge 연결 여부"""
         return self._lance_bridge is not None and self._lance_bridge.is_connected
     
-    def embed(self, text: str, use_cache: bool = True) -> List[float]:
+    def embed(self, text: str, use_cache: bool = True) -> np.ndarray:
         """
         단일 텍스트를 벡터로 변환
         
@@ -174,57 +190,53 @@ class DatabaseEmbeddingService:
             use_cache: 캐시 사용 여부
         
         Returns:
-            임베딩 벡터 (VECTOR_DIM 차원)
+            임베딩 벡터 (float32 ndarray, 캐시 사용 시 읽기 전용)
         """
         self._stats["total_requests"] += 1
+        # 다이제스트는 한 번만 계산 (캐시 키 + 폴백 벡터 공용)
+        digest = text_digest(text)
         
         # 캐시 확인
         if use_cache:
-            cached = self._cache.get(text)
+            cached = self._cache.get(text, digest)
             if cached is not None:
                 self._stats["cache_hits"] += 1
                 return cached
         
         # API 호출
-        vector = self._call_embedding_api(text)
+        vector = self._call_embedding_api(text, digest)
         
         # 캐시 저장
-        if use_cache and vector:
-            self._cache.set(text, vector)
+        if use_cache and vector.size:
+            self._cache.set(text, vector, digest)
         
         return vector
     
-    def _call_embedding_api(self, text: str) -> List[float]:
+    def _call_embedding_api(self, text: str, digest: Optional[bytes] = None) -> np.ndarray:
         """실제 임베딩 API 호출"""
         self._stats["api_calls"] += 1
         
         if self._embedding_service:
             try:
-                return self._embedding_service.embed(text)
+                return np.asarray(self._embedding_service.embed(text), dtype=np.float32)
             except Exception as e:
                 print(f"⚠️ 임베딩 API 호출 실패: {e}")
         
         # 폴백: 해시 기반 의사 벡터
-        return self._generate_fallback_vector(text)
+        return self._generate_fallback_vector(digest or text_digest(text))
     
-    def _generate_fallback_vector(self, text: str) -> List[float]:
-        """API 실패 시 해시 기반 의사 벡터 생성"""
-        import hashlib
-        hash_bytes = hashlib.sha256(text.encode('utf-8')).digest()
-        
-        vector = []
-        for i in range(self.VECTOR_DIM):
-            byte_idx = i % len(hash_bytes)
-            value = (hash_bytes[byte_idx] / 255.0) * 2 - 1  # -1 ~ 1 범위
-            vector.append(value)
-        
-        return vector
+    def _generate_fallback_vector(self, digest: bytes) -> np.ndarray:
+        """API 실패 시 해시 기반 의사 벡터 생성 (32바이트 다이제스트를 VECTOR_DIM까지 반복)"""
+        hash_bytes = np.frombuffer(digest, dtype=np.uint8)
+        repeats = -(-self.VECTOR_DIM // hash_bytes.size)
+        tiled = np.tile(hash_bytes, repeats)[:self.VECTOR_DIM]
+        return (tiled * np.float32(2.0 / 255.0) - np.float32(1.0)).astype(np.float32)  # -1 ~ 1 범위
     
     def batch_embed(
         self, 
         texts: List[str], 
         use_cache: bool = True
-    ) -> List[List[float]]:
+    ) -> List[np.ndarray]:
         """
         여러 텍스트를 배치로 벡터 변환
         
@@ -235,41 +247,67 @@ class DatabaseEmbeddingService:
             use_cache: 캐시 사용 여부
         
         Returns:
-            임베딩 벡터 목록 (입력 순서 유지)
+            임베딩 벡터(float32 ndarray, 읽기 전용) 목록 (입력 순서 유지)
         """
-        results: List[Optional[List[float]]] = [None] * len(texts)
-        texts_to_embed: List[Tuple[int, str]] = []  # (index, text)
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        texts_to_embed: Dict[str, List[int]] = {}  # text → 결과 인덱스들 (중복 텍스트는 한 번만 변환)
+        digests: Dict[str, bytes] = {}  # text → 다이제스트 (캐시 키/폴백 벡터 공용)
         
         # 1단계: 캐시 확인
         for i, text in enumerate(texts):
             self._stats["total_requests"] += 1
+            digest = digests.get(text)
+            if digest is None:
+                digest = digests[text] = text_digest(text)
             
             if use_cache:
-                cached = self._cache.get(text)
+                cached = self._cache.get(text, digest)
                 if cached is not None:
                     self._stats["cache_hits"] += 1
                     results[i] = cached
                     continue
             
-            texts_to_embed.append((i, text))
+            texts_to_embed.setdefault(text, []).append(i)
+        
+        # 2단계: 캐시 미스된 고유 텍스트를 한 번의 배치 API 호출로 변환
+        miss_texts = list(texts_to_embed)
+        vectors = self._call_embedding_api_batch(miss_texts, digests) if miss_texts else []
         
-        # 2단계: 캐시 미스된 항목 API 호출
-        for idx, text in texts_to_embed:
-            vector = self._call_embedding_api(text)
-            results[idx] = vector
+        for text, vector in zip(miss_texts, vectors):
+            # 중복 텍스트의 결과 인덱스들이 같은 배열을 공유하므로 읽기 전용으로 고정
+            vector.flags.writeable = False
+            for idx in texts_to_embed[text]:
+                results[idx] = vector
             
             if use_cache:
-                self._cache.set(text, vector)
+                self._cache.set(text, vector, digests[text])
         
         return results
     
+    def _call_embedding_api_batch(
+        self,
+        texts: List[str],
+        digests: Optional[Dict[str, bytes]] = None
+    ) -> List[np.ndarray]:
+        """배치 임베딩 API 호출 (실패 시 텍스트별 호출로 폴백)"""
+        if self._embedding_service and hasattr(self._embedding_service, 'embed_batch'):
+            self._stats["api_calls"] += 1
+            try:
+                vectors = self._embedding_service.embed_batch(texts)
+                return [np.asarray(vector, dtype=np.float32) for vector in vectors]
+            except Exception as e:
+                print(f"⚠️ 배치 임베딩 API 호출 실패: {e}")
+        
+        digests = digests or {}
+        return [self._call_embedding_api(text, digests.get(text)) for text in texts]
+    
     def embed_and_store(
         self,
         text: str,
         memory_type: str = "semantic",
         source: str = "embedding_service",
         metadata: Optional[Dict[str, Any]] = None
-    ) -> Tuple[List[float], bool]:
+    ) -> Tuple[np.ndarray, bool]:
         """
         텍스트를 벡터로 변환하고 LanceDB에 저장
         
@@ -368,7 +406,7 @@ def embed_and_store(
     text: str,
     memory_type: str = "semantic",
     source: str = "quick_embed"
-) -> Tuple[List[float], bool]:
+) -> Tuple[np.ndarray, bool]:
     """
     빠른 임베딩 + 저장 헬퍼 함수
     
@@ -2,7 +2,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import numpy as np
 import pyarrow as pa
 from database.zero_copy import ZeroCopyBufferExposer
 from database.surreal_bridge import ArrowBufferManager
@@ -35,20 +34,26 @@ class BridgeIntegrationTest:
         SurrealDB에서 인출된 Edge 데이터를 Arrow RecordBatch로 변환 (Zero-Copy)
         raw_edge_data: List[Dict] 형태의 SurrealDB 결과물
         """
-        # 1. 데이터 레이아웃 정의 (Source ID, Target ID, Relation Hash)
-        # 물리적 메모리 정렬을 위해 고정 크기 바이너리 또는 정수형 변환
-        source_indices = np.array([hash(d['in']) for d in raw_edge_data], dtype=np.int64)
-        target_indices = np.array([hash(d['out']) for d in raw_edge_data], dtype=np.int64)
+        # 1. 데이터 레이아웃 정의 (Source/Target ID → 딕셔너리 인코딩)
+        # 인덱스는 0..K 연속 int32 (Python hash() 루프 없이 C에서 인코딩, 원래 라벨은 딕셔너리에 보존)
+        source_ids = pa.array((d['in'] for d in raw_edge_data), type=pa.string()).dictionary_encode()
+        target_ids = pa.array((d['out'] for d in raw_edge_data), type=pa.string()).dictionary_encode()
         
-        # 2. C Data Interface를 통한 Zero-Copy Buffer 노출
-        source_buf = self.exposer.expose_numpy_buffer(source_indices)
-        target_buf = self.exposer.expose_numpy_buffer(target_indices)
+        # 2. C Data Interface를 통한 Zero-Copy Buffer 노출 (인덱스 버퍼 직접)
+        source_buf = self.exposer.expose_numpy_buffer(source_ids.indices.buffers()[1])
+        target_buf = self.exposer.expose_numpy_buffer(target_ids.indices.buffers()[1])
         
         # 3. Arrow RecordBatch 재구성 (복사 없음)
         batch = pa.RecordBatch.from_arrays(
             [
-                pa.Array.from_buffers(pa.int64(), len(source_indices), [None, source_buf]),
-                pa.Array.from_buffers(pa.int64(), len(target_indices), [None, target_buf])
+                pa.DictionaryArray.from_arrays(
+                    pa.Array.from_buffers(pa.int32(), len(source_ids), [source_ids.indices.buffers()[0], source_buf]),
+                    source_ids.dictionary
+                ),
+                pa.DictionaryArray.from_arrays(
+                    pa.Array.from_buffers(pa.int32(), len(target_ids), [target_ids.indices.buffers()[0], target_buf]),
+                    target_ids.dictionary
+                )
             ],
             names=["source_id", "target_id"]
         )
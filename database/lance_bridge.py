@@ -9,13 +9,17 @@ Architecture:
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 
+import numpy as np
+
 # LanceDB & Arrow imports with graceful fallback
 try:
     import lancedb
     import pyarrow as pa
+    import pyarrow.compute as pc
+    from database.serializer import dumps_json, loads_json
     LANCE_AVAILABLE = True
 except ImportError:
     LANCE_AVAILABLE = False
@@ -35,6 +39,17 @@ class LanceBridge:
     # 벡터 차원 (Gemini text-embedding-004 기준)
     VECTOR_DIM = 768
     
+    # 벡터를 제외한 기억 레코드 컬럼 (조회 시 vector 미적재)
+    RECORD_COLUMNS = ["id", "text", "memory_type", "source", "timestamp", "metadata"]
+    
+    # ANN 인덱스 (IVF_PQ): 이 행 수부터 생성, 행 수가 두 배가 되면 재생성
+    INDEX_MIN_ROWS = 1000
+    
+    # 검색/인덱스 공통 거리 함수 (소비 측은 cosine distance 0~2 범위를 가정)
+    SEARCH_METRIC = "cosine"
+    # IVF 탐색 파티션 수 (재현율 ↔ 지연 트레이드오프, 인덱스 없으면 무시됨)
+    SEARCH_NPROBES = 10
+    
     # 기본 저장 경로
     DEFAULT_DB_PATH = os.environ.get("LANCEDB_PATH", "/data/lancedb")
     
@@ -53,6 +68,9 @@ class LanceBridge:
         self._db = None
         self._table = None
         self._connected = False
+        self._indexed_rows = 0  # 마지막 인덱스 생성(시도) 시점의 행 수 (0 = 인덱스 없음)
+        # 기록용 스키마 (한 번만 생성해 모든 write에서 재사용 → 타입 추론 없음)
+        self._schema = self._build_schema() if LANCE_AVAILABLE else None
         
         if LANCE_AVAILABLE:
             self._connect()
@@ -88,6 +106,8 @@ class LanceBridge:
                 # 차원 불일치 확인 → 마이그레이션
                 if not self._check_and_migrate_schema():
                     self._create_memory_table()
+                elif self._has_vector_index():
+                    self._indexed_rows = self._table.count_rows()
             
             self._connected = True
             print(f"✅ LanceDB 연결 성공: {self._db_path}")
@@ -98,10 +118,9 @@ class LanceBridge:
             self._connected = False
             return False
     
-    def _create_memory_table(self):
-        """메모리 테이블 스키마 정의 및 생성"""
-        # PyArrow 스키마 정의
-        schema = pa.schema([
+    def _build_schema(self) -> "pa.Schema":
+        """memory_bank 테이블 스키마 정의"""
+        return pa.schema([
             ("id", pa.string()),
             ("text", pa.string()),
             ("vector", pa.list_(pa.float32(), self.VECTOR_DIM)),
@@ -110,17 +129,23 @@ class LanceBridge:
             ("timestamp", pa.string()),
             ("metadata", pa.string()),  # JSON 직렬화된 추가 정보
         ])
-        
+
+    def _create_memory_table(self):
+        """메모리 테이블 스키마 정의 및 생성"""
         # 초기 더미 데이터로 테이블 생성 (LanceDB 요구사항)
-        initial_data = pa.table({
-            "id": ["init_0"],
-            "text": ["AIN Memory System Initialized"],
-            "vector": [[0.0] * self.VECTOR_DIM],
-            "memory_type": ["system"],
-            "source": ["lance_bridge"],
-            "timestamp": [datetime.now().isoformat()],
-            "metadata": ["{}"],
-        })
+        # 벡터는 float32 버퍼에서 FixedSizeListArray로 바로 생성 (Python float 리스트 변환 없음)
+        zero_vector = pa.FixedSizeListArray.from_arrays(
+            pa.array(np.zeros(self.VECTOR_DIM, dtype=np.float32)), self.VECTOR_DIM
+        )
+        initial_data = pa.Table.from_arrays([
+            pa.array(["init_0"]),
+            pa.array(["AIN Memory System Initialized"]),
+            zero_vector,
+            pa.array(["system"]),
+            pa.array(["lance_bridge"]),
+            pa.array([datetime.now().isoformat()]),
+            pa.array(["{}"]),
+        ], schema=self._schema)
         
         self._table = self._db.create_table("memory_bank", initial_data)
         print("📦 memory_bank 테이블 생성 완료")
@@ -137,10 +162,10 @@ class LanceBridge:
             if hasattr(vector_field.type, 'list_size'):
                 existing_dim = vector_field.type.list_size
             else:
-                # 첫 번째 레코드로 확인
-                df = self._table.to_pandas()
-                if len(df) > 0:
-                    existing_dim = len(df.iloc[0]["vector"])
+                # 가변 길이 list (구버전 테이블): 첫 번째 레코드의 vector 컬럼만 읽어서 확인
+                column = self._read_first_vector()
+                if len(column) > 0:
+                    existing_dim = len(column[0].as_py())
                 else:
                     return True  # 빈 테이블, OK
 
@@ -155,6 +180,50 @@ class LanceBridge:
             print(f"⚠️ 스키마 확인 실패: {e}")
             return True  # 에러 시 그대로 유지
 
+    def _read_first_vector(self) -> "pa.ChunkedArray":
+        """vector 컬럼 1행만 읽기 (전체 테이블 materialize 방지)"""
+        try:
+            # Lance 데이터셋의 컬럼 projection + limit 읽기 (pylance 필요)
+            return self._table.to_lance().to_table(columns=["vector"], limit=1).column("vector")
+        except Exception:
+            return self._table.search().select(["vector"]).limit(1).to_arrow().column("vector")
+
+    def _has_vector_index(self) -> bool:
+        """vector 컬럼에 인덱스가 이미 있는지 확인 (구버전 API 미지원 시 False)"""
+        try:
+            return any("vector" in getattr(index, "columns", []) for index in self._table.list_indices())
+        except Exception:
+            return False
+
+    def _ensure_vector_index(self):
+        """
+        행 수가 임계값을 넘으면 IVF_PQ 인덱스 생성 (이후 행 수가 두 배가 될 때마다 재생성).
+        
+        인덱스 없이는 search가 전체 벡터를 훑는 flat scan이 된다.
+        인덱스 이후 추가된 행은 LanceDB가 flat scan으로 합쳐 검색하므로 결과 누락은 없다.
+        metric은 search_memory와 같은 SEARCH_METRIC을 사용해 거리 값의 의미를 유지한다.
+        """
+        try:
+            rows = self._table.count_rows()
+        except Exception:
+            return
+        if rows < self.INDEX_MIN_ROWS or (self._indexed_rows and rows < self._indexed_rows * 2):
+            return
+        
+        # 실패해도 기록 → 매 add마다 재시도하지 않고 다음 두 배 시점에 재시도
+        self._indexed_rows = rows
+        try:
+            self._table.create_index(
+                metric=self.SEARCH_METRIC,
+                vector_column_name="vector",
+                num_partitions=min(256, max(1, int(rows ** 0.5))),
+                num_sub_vectors=self.VECTOR_DIM // 16,
+                replace=True,
+            )
+            print(f"🗂️ memory_bank 벡터 인덱스 생성: {rows}행 (IVF_PQ)")
+        except Exception as e:
+            print(f"⚠️ 벡터 인덱스 생성 실패 (flat scan 유지): {e}")
+
     @property
     def is_connected(self) -> bool:
         return self._connected and self._db is not None
@@ -162,7 +231,7 @@ class LanceBridge:
     def add_memory(
         self,
         text: str,
-        vector: List[float],
+        vector: Union[List[float], np.ndarray],
         memory_type: str = "episodic",
         source: str = "unknown",
         metadata: Dict[str, Any] = None
@@ -184,43 +253,76 @@ class LanceBridge:
             print("⚠️ LanceDB 미연결. 메모리 저장 스킵.")
             return False
         
+        # 벡터 차원 검증 (패딩/트렁케이션은 add_memories에서 처리)
+        if len(vector) != self.VECTOR_DIM:
+            print(f"⚠️ 벡터 차원 불일치: {len(vector)} != {self.VECTOR_DIM}")
+        
+        return self.add_memories([{
+            "text": text,
+            "vector": vector,
+            "memory_type": memory_type,
+            "source": source,
+            "metadata": metadata,
+        }]) == 1
+    
+    def add_memories(self, records: List[Dict[str, Any]]) -> int:
+        """
+        여러 기억을 한 번의 테이블 append로 저장한다 (행마다 add 호출 방지).
+        
+        Args:
+            records: {"text", "vector", "memory_type", "source", "metadata"} 딕셔너리 목록
+                     (memory_type/source/metadata는 선택, 기본값은 add_memory와 동일)
+        
+        Returns:
+            저장된 기억 수 (실패 시 0)
+        """
+        if not self.is_connected:
+            print("⚠️ LanceDB 미연결. 메모리 저장 스킵.")
+            return 0
+        if not records:
+            return 0
+        
         try:
-            import json
-            
-            # 벡터 차원 검증
-            if len(vector) != self.VECTOR_DIM:
-                print(f"⚠️ 벡터 차원 불일치: {len(vector)} != {self.VECTOR_DIM}")
-                # 패딩 또는 트렁케이션
-                if len(vector) < self.VECTOR_DIM:
-                    vector = vector + [0.0] * (self.VECTOR_DIM - len(vector))
-                else:
-                    vector = vector[:self.VECTOR_DIM]
+            # 벡터를 (N, VECTOR_DIM) float32 행렬로 모음 (부족분 0 패딩, 초과분 절단)
+            vectors = np.zeros((len(records), self.VECTOR_DIM), dtype=np.float32)
+            for i, record in enumerate(records):
+                vector = np.asarray(record["vector"], dtype=np.float32)[:self.VECTOR_DIM]
+                vectors[i, :len(vector)] = vector
+            vector_column = pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), self.VECTOR_DIM)
             
-            # 새 레코드 생성
-            memory_id = f"mem_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            stamp = datetime.now()
+            id_prefix = f"mem_{stamp.strftime('%Y%m%d_%H%M%S_%f')}"
+            timestamp = stamp.isoformat()
+            # 단건은 기존 add_memory ID 형식 유지 (접미사 없음)
+            ids = [id_prefix] if len(records) == 1 else [f"{id_prefix}_{i}" for i in range(len(records))]
             
-            new_data = pa.table({
-                "id": [memory_id],
-                "text": [text],
-                "vector": [vector],
-                "memory_type": [memory_type],
-                "source": [source],
-                "timestamp": [datetime.now().isoformat()],
-                "metadata": [json.dumps(metadata or {}, ensure_ascii=False)],
-            })
+            # 타입을 지정해 배열을 바로 생성하고 캐시된 스키마로 조립 (타입 추론 없음)
+            string = pa.string()
+            new_data = pa.Table.from_arrays([
+                pa.array(ids, type=string),
+                pa.array([r["text"] for r in records], type=string),
+                vector_column,
+                pa.array([r.get("memory_type", "episodic") for r in records], type=string),
+                pa.array([r.get("source", "unknown") for r in records], type=string),
+                pa.repeat(pa.scalar(timestamp, type=string), len(records)),
+                pa.array([dumps_json(r.get("metadata") or {}) for r in records], type=string),
+            ], schema=self._schema)
             
-            # 테이블에 추가
             self._table.add(new_data)
-            print(f"💾 기억 저장: {memory_id} ({len(text)} chars)")
-            return True
+            self._ensure_vector_index()
+            if len(records) == 1:
+                print(f"💾 기억 저장: {ids[0]} ({len(records[0]['text'])} chars)")
+            else:
+                print(f"💾 기억 일괄 저장: {len(records)}개")
+            return len(records)
             
         except Exception as e:
-            print(f"❌ 기억 저장 실패: {e}")
-            return False
+            print(f"❌ 기억 일괄 저장 실패: {e}")
+            return 0
     
     def search_memory(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         limit: int = 5,
         memory_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -239,36 +341,30 @@ class LanceBridge:
             return []
         
         try:
-            import json
+            # 벡터 차원 맞추기 (list/ndarray 모두 float32 배열로)
+            query_vector = np.asarray(query_vector, dtype=np.float32)[:self.VECTOR_DIM]
+            if query_vector.size < self.VECTOR_DIM:
+                query_vector = np.pad(query_vector, (0, self.VECTOR_DIM - query_vector.size))
             
-            # 벡터 차원 맞추기
-            if len(query_vector) != self.VECTOR_DIM:
-                if len(query_vector) < self.VECTOR_DIM:
-                    query_vector = query_vector + [0.0] * (self.VECTOR_DIM - len(query_vector))
-                else:
-                    query_vector = query_vector[:self.VECTOR_DIM]
-            
-            # ANN 검색 실행
-            results = self._table.search(query_vector).limit(limit).to_pandas()
+            # ANN 검색 실행 (유형 필터는 LanceDB 프리필터로, vector 컬럼은 결과에서 제외)
+            query = (
+                self._table.search(query_vector)
+                .metric(self.SEARCH_METRIC)
+                .nprobes(self.SEARCH_NPROBES)
+                .select(self.RECORD_COLUMNS)
+                .limit(limit)
+            )
+            if memory_type:
+                escaped = memory_type.replace("'", "''")
+                query = query.where(f"memory_type = '{escaped}'", prefilter=True)
+            results = query.to_arrow()
             
             # 결과 변환
             memories = []
-            for _, row in results.iterrows():
-                memory = {
-                    "id": row["id"],
-                    "text": row["text"],
-                    "memory_type": row["memory_type"],
-                    "source": row["source"],
-                    "timestamp": row["timestamp"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                    "distance": row.get("_distance", 0.0),
-                }
-                
-                # 필터링 적용
-                if memory_type and memory["memory_type"] != memory_type:
-                    continue
-                    
-                memories.append(memory)
+            for row in results.to_pylist():
+                row["metadata"] = loads_json(row["metadata"]) if row["metadata"] else {}
+                row["distance"] = row.pop("_distance", 0.0)
+                memories.append(row)
             
             return memories
             
@@ -282,22 +378,25 @@ class LanceBridge:
             return []
         
         try:
-            import json
+            total = self._table.count_rows()
+            if total == 0 or limit <= 0:
+                return []
+            
+            # vector 컬럼(행당 수 KB)은 읽지 않고 메타 컬럼만 Arrow로 조회
+            try:
+                table = self._table.search().select(self.RECORD_COLUMNS).limit(total).to_arrow()
+            except Exception:
+                table = self._table.to_arrow().select(self.RECORD_COLUMNS)  # 구버전 LanceDB 폴백
             
-            # 전체 데이터에서 최근 N개 추출
-            df = self._table.to_pandas()
-            df = df.sort_values("timestamp", ascending=False).head(limit)
+            # timestamp는 ISO 문자열 → 사전순 = 시간순, 상위 N개만 선택 (전체 정렬 불필요)
+            indices = pc.select_k_unstable(
+                table, k=min(limit, table.num_rows), sort_keys=[("timestamp", "descending")]
+            )
             
             memories = []
-            for _, row in df.iterrows():
-                memories.append({
-                    "id": row["id"],
-                    "text": row["text"],
-                    "memory_type": row["memory_type"],
-                    "source": row["source"],
-                    "timestamp": row["timestamp"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                })
+            for row in table.take(indices).to_pylist():
+                row["metadata"] = loads_json(row["metadata"]) if row["metadata"] else {}
+                memories.append(row)
             
             return memories
             
@@ -310,7 +409,7 @@ class LanceBridge:
         if not self.is_connected:
             return 0
         try:
-            return len(self._table.to_pandas())
+            return self._table.count_rows()
         except:
             return 0
     
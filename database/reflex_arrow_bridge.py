@@ -11,9 +11,13 @@ Architecture:
 
 import json
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from database.serializer import dumps_json, loads_json
+
 # Schema Registry 연동 시도
 try:
     from database.arrow_schema import get_schema_registry
@@ -22,16 +26,22 @@ except ImportError:
     HAS_REGISTRY = False
 
 
+# 저카디널리티 문자열 컬럼 타입 (type, handler_type)
+REFLEX_CATEGORY_TYPE = pa.dictionary(pa.int8(), pa.string())
+
+
 def get_reflex_schema() -> pa.Schema:
     """
     ReflexSchema: 반사 행동 데이터 스키마
     ReflexRegistry 및 learned_reflexes.json 구조와 호환
+    
+    type/handler_type은 고유값이 몇 개뿐이라 int8 딕셔너리 인코딩 (값당 1바이트, 최대 127종)
     """
     return pa.schema([
         pa.field("id", pa.string(), nullable=False),
-        pa.field("type", pa.string(), nullable=False),
+        pa.field("type", REFLEX_CATEGORY_TYPE, nullable=False),
         pa.field("pattern", pa.string()),
-        pa.field("handler_type", pa.string()),
+        pa.field("handler_type", REFLEX_CATEGORY_TYPE),
         pa.field("created_at", pa.timestamp("ms")),
         pa.field("confidence", pa.float32()),
         pa.field("usage_count", pa.int32()),
@@ -61,6 +71,8 @@ class ReflexArrowBridge:
     
     def __init__(self):
         self.schema = get_reflex_schema()
+        # 타입별 필터 Expression 캐시 (반복 조회 시 재생성 생략)
+        self._type_filters: Dict[str, ds.Expression] = {}
         self._register_schema()
 
     def _register_schema(self):
@@ -116,64 +128,55 @@ class ReflexArrowBridge:
         if not reflexes:
             return self._create_empty_table()
 
-        ids = []
-        types = []
-        patterns = []
-        handlers = []
-        created_ats = []
-        confidences = []
-        usage_counts = []
-        metadata_jsons = []
-
-        for r in reflexes:
-            ids.append(str(r.get("name", r.get("id", "unknown"))))
-            types.append(str(r.get("type", "unknown")))
-            patterns.append(str(r.get("pattern", "")))
-            handlers.append(str(r.get("handler_type", "default")))
-            
-            ts = r.get("created_at")
-            parsed_ts = self._parse_timestamp(ts)
-            created_ats.append(parsed_ts)
-            
-            conf = r.get("confidence")
-            if conf is not None:
-                try:
-                    confidences.append(float(conf))
-                except (ValueError, TypeError):
-                    confidences.append(0.0)
-            else:
-                confidences.append(0.0)
-            
-            count = r.get("usage_count")
-            if count is not None:
-                try:
-                    usage_counts.append(int(count))
-                except (ValueError, TypeError):
-                    usage_counts.append(0)
-            else:
-                usage_counts.append(0)
-            
-            metadata = r.get("metadata", {})
-            if isinstance(metadata, dict):
-                metadata_jsons.append(json.dumps(metadata, ensure_ascii=False))
-            elif isinstance(metadata, str):
-                metadata_jsons.append(metadata)
-            else:
-                metadata_jsons.append("{}")
-
-        table = pa.table({
-            "id": pa.array(ids, type=pa.string()),
-            "type": pa.array(types, type=pa.string()),
-            "pattern": pa.array(patterns, type=pa.string()),
-            "handler_type": pa.array(handlers, type=pa.string()),
-            "created_at": pa.array(created_ats, type=pa.timestamp("ms")),
-            "confidence": pa.array(confidences, type=pa.float32()),
-            "usage_count": pa.array(usage_counts, type=pa.int32()),
-            "metadata_json": pa.array(metadata_jsons, type=pa.string()),
-        })
+        # 컬럼 단위로 한 번에 수집 → 타입 변환은 Arrow(C++)에 위임
+        table = pa.Table.from_arrays([
+            pa.array([str(r.get("name", r.get("id", "unknown"))) for r in reflexes], type=pa.string()),
+            pa.array([str(r.get("type", "unknown")) for r in reflexes], type=REFLEX_CATEGORY_TYPE),
+            pa.array([str(r.get("pattern", "")) for r in reflexes], type=pa.string()),
+            pa.array([str(r.get("handler_type", "default")) for r in reflexes], type=REFLEX_CATEGORY_TYPE),
+            self._timestamp_array([r.get("created_at") for r in reflexes]),
+            self._numeric_array([r.get("confidence") for r in reflexes], pa.float32(), float),
+            self._numeric_array([r.get("usage_count") for r in reflexes], pa.int32(), int),
+            pa.array([self._metadata_to_json(r.get("metadata", {})) for r in reflexes], type=pa.string()),
+        ], schema=self.schema)
 
         return table
 
+    def _timestamp_array(self, values: List[Any]) -> pa.Array:
+        """created_at 값 목록 → timestamp[ms] 배열 (ISO 문자열은 Arrow 파서로 일괄 변환)"""
+        if all(v is None or isinstance(v, str) for v in values):
+            try:
+                # us로 파싱 후 ms로 절단 (isoformat() 기본 마이크로초 정밀도 허용)
+                parsed = pc.cast(pa.array(values, type=pa.string()), pa.timestamp("us"))
+                return parsed.cast(pa.timestamp("ms"), safe=False)
+            except pa.ArrowInvalid:
+                pass  # 타임존 오프셋/비정형 문자열 → 행 단위 파싱
+        return pa.array([self._parse_timestamp(v) for v in values], type=pa.timestamp("ms"))
+
+    @staticmethod
+    def _numeric_array(values: List[Any], arrow_type: pa.DataType, convert) -> pa.Array:
+        """숫자 값 목록 → Arrow 배열 (None/변환 실패는 0)"""
+        try:
+            return pc.fill_null(pa.array(values, type=arrow_type), 0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            pass  # 문자열 숫자 등 → 행 단위 변환
+        coerced = []
+        for value in values:
+            try:
+                coerced.append(convert(value) if value is not None else 0)
+            except (ValueError, TypeError):
+                coerced.append(0)
+        return pa.array(coerced, type=arrow_type)
+
+    @staticmethod
+    def _metadata_to_json(metadata: Any) -> str:
+        """metadata → JSON 문자열 (dict는 직렬화, 문자열은 그대로)"""
+        if isinstance(metadata, dict):
+            return dumps_json(metadata)
+        if isinstance(metadata, str):
+            return metadata
+        return "{}"
+
     def convert_from_arrow(self, table: pa.Table) -> List[Dict[str, Any]]:
         """
         Arrow Table을 Reflex 딕셔너리 리스트로 역변환
@@ -188,20 +191,21 @@ class ReflexArrowBridge:
             return []
 
         reflexes = []
-        df = table.to_pydict()
 
-        for i in range(table.num_rows):
+        # 행 단위 dict를 C 레벨에서 한 번에 생성 (컬럼별 인덱싱 없음)
+        for row in table.to_pylist():
             reflex = {
-                "name": df["id"][i],
-                "id": df["id"][i],
-                "type": df["type"][i],
-                "pattern": df["pattern"][i],
-                "handler_type": df["handler_type"][i],
-                "confidence": df["confidence"][i],
-                "usage_count": df["usage_count"][i],
+                "name": row["id"],
+                "id": row["id"],
+                "type": row["type"],
+                "pattern": row["pattern"],
+                "handler_type": row["handler_type"],
+                "confidence": row["confidence"],
+                "usage_count": row["usage_count"],
             }
             
-            ts = df["created_at"][i]
+            # timestamp 컬럼은 to_pylist에서 이미 datetime
+            ts = row["created_at"]
             if ts is not None:
                 if hasattr(ts, "isoformat"):
                     reflex["created_at"] = ts.isoformat()
@@ -210,10 +214,10 @@ class ReflexArrowBridge:
             else:
                 reflex["created_at"] = None
             
-            metadata_str = df["metadata_json"][i]
+            metadata_str = row["metadata_json"]
             if metadata_str:
                 try:
-                    reflex["metadata"] = json.loads(metadata_str)
+                    reflex["metadata"] = loads_json(metadata_str)
                 except json.JSONDecodeError:
                     reflex["metadata"] = {}
             else:
@@ -238,7 +242,8 @@ class ReflexArrowBridge:
             return self._create_empty_table()
         if len(valid_tables) == 1:
             return valid_tables[0]
-        return pa.concat_tables(valid_tables)
+        # 청크만 이어 붙임 (컬럼 버퍼 복사 없음), 스키마 승격 없이 불일치는 즉시 에러
+        return pa.concat_tables(valid_tables, promote_options="none")
 
     def filter_by_type(self, table: pa.Table, reflex_type: str) -> pa.Table:
         """
@@ -254,9 +259,12 @@ class ReflexArrowBridge:
         if table is None or table.num_rows == 0:
             return self._create_empty_table()
 
-        import pyarrow.compute as pc
-        mask = pc.equal(table.column("type"), reflex_type)
-        return table.filter(mask)
+        # Expression 필터를 Dataset 스캐너로 적용 (중간 boolean 마스크 없이 스캔 중 필터)
+        # type은 딕셔너리 컬럼이라 문자열 비교는 딕셔너리에서 한 번, 행 비교는 int8 인덱스로 수행됨
+        expression = self._type_filters.get(reflex_type)
+        if expression is None:
+            expression = self._type_filters[reflex_type] = ds.field("type") == reflex_type
+        return ds.dataset(table).to_table(filter=expression)
 
     def get_statistics(self, table: pa.Table) -> Dict[str, Any]:
         """
@@ -276,19 +284,15 @@ class ReflexArrowBridge:
                 "total_usage": 0,
             }
 
-        import pyarrow.compute as pc
-
-        type_counts = {}
-        types = table.column("type").to_pylist()
-        for t in types:
-            type_counts[t] = type_counts.get(t, 0) + 1
-
-        confidences = table.column("confidence").to_pylist()
-        valid_confidences = [c for c in confidences if c is not None]
-        avg_confidence = sum(valid_confidences) / len(valid_confidences) if valid_confidences else 0.0
+        # 집계는 Arrow compute 커널로 (Python 객체는 고유 타입 수만큼만 생성)
+        type_counts = {
+            entry["values"]: entry["counts"]
+            for entry in pc.value_counts(table.column("type")).to_pylist()
+        }
 
-        usage_counts = table.column("usage_count").to_pylist()
-        total_usage = sum(u for u in usage_counts if u is not None)
+        # mean/sum은 null을 무시, 전부 null이면 None
+        avg_confidence = pc.mean(table.column("confidence")).as_py() or 0.0
+        total_usage = pc.sum(table.column("usage_count")).as_py() or 0
 
         return {
             "total_count": table.num_rows,
@@ -1,8 +1,46 @@
 import json
-import pandas as pd
 import pyarrow as pa
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+# JSON 직렬화 가속 (선택적): orjson은 C 구현 + UTF-8 그대로 출력 (ensure_ascii=False와 동일)
+# corpus/transform.py와 surreal/lance/reflex 브릿지가 이 함수들을 공유한다.
+# orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스라 호출부 예외 처리는 그대로 유지된다.
+try:
+    import orjson
+
+    loads_json = orjson.loads
+
+    def dumps_json(value, default=None) -> str:
+        """JSON 문자열로 직렬화 (default: 직렬화 불가 값 변환 함수, 예: str)"""
+        try:
+            return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson이 거부하는 값(64비트 초과 정수 등)은 표준 json으로
+            return json.dumps(value, ensure_ascii=False, default=default)
+except ImportError:
+    loads_json = json.loads
+
+    def dumps_json(value, default=None) -> str:
+        """JSON 문자열로 직렬화 (default: 직렬화 불가 값 변환 함수, 예: str)"""
+        return json.dumps(value, ensure_ascii=False, default=default)
+
+# 노드/엣지 테이블 스키마 (변환 때마다 타입 추론하지 않도록 고정)
+NODE_TABLE_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("label", pa.string()),
+    ("data_json", pa.string()),
+    ("edges_count", pa.int64()),
+    ("timestamp", pa.timestamp('ms')),
+])
+
+EDGE_TABLE_SCHEMA = pa.schema([
+    ("out", pa.string()),
+    ("in", pa.string()),
+    ("relation", pa.string()),
+    ("data_json", pa.string()),
+])
+
 class GraphSerializer:
     """
     AIN Step 3: Graph-to-Arrow Serialization Engine
@@ -12,61 +50,44 @@ class GraphSerializer:
     @staticmethod
     def nodes_to_table(nodes: Dict[str, Any]) -> pa.Table:
         """노드 딕셔너리를 Arrow Table로 변환"""
-        data = []
-        now = pd.Timestamp.now().floor('ms')
+        # 컬럼 리스트를 한 번의 순회로 바로 채움 (행 dict 생성 후 재전치 없음)
+        labels = []
+        data_jsons = []
+        edges_counts = []
         
         for label, node in nodes.items():
-            data.append({
-                "id": label,
-                "label": label,
-                "data_json": json.dumps(node.data, ensure_ascii=False),
-                "edges_count": len(node.edges),
-                "timestamp": now
-            })
-            
-        if not data:
-            # 빈 테이블 스키마 정의
-            return pa.table({
-                'id': pa.array([], type=pa.string()),
-                'label': pa.array([], type=pa.string()),
-                'data_json': pa.array([], type=pa.string()),
-                'edges_count': pa.array([], type=pa.int64()),
-                'timestamp': pa.array([], type=pa.timestamp('ms'))
-            })
-            
-        return pa.table({
-            'id': [d['id'] for d in data],
-            'label': [d['label'] for d in data],
-            'data_json': [d['data_json'] for d in data],
-            'edges_count': [d['edges_count'] for d in data],
-            'timestamp': pa.array([d['timestamp'] for d in data], type=pa.timestamp('ms'))
-        })
+            labels.append(label)
+            data_jsons.append(dumps_json(node.data))
+            edges_counts.append(len(node.edges))
+        
+        label_array = pa.array(labels, type=pa.string())
+        now = pa.scalar(datetime.now(), type=pa.timestamp('ms'))
+        
+        return pa.Table.from_arrays([
+            label_array,  # id == label
+            label_array,
+            pa.array(data_jsons, type=pa.string()),
+            pa.array(edges_counts, type=pa.int64()),
+            pa.repeat(now, len(labels)),
+        ], schema=NODE_TABLE_SCHEMA)
 
     @staticmethod
     def edges_to_table(nodes: Dict[str, Any]) -> pa.Table:
         """노드들 사이의 관계(Edge)를 Arrow Table로 변환"""
-        edges = []
+        outs = []
+        ins = []
+        relations = []
         
         for out_label, node in nodes.items():
+            out_id = f"node:{out_label}"
             for relation, in_label in node.edges:
-                edges.append({
-                    "out": f"node:{out_label}",
-                    "in": f"node:{in_label}",
-                    "relation": relation,
-                    "data_json": "{}" # 추가 관계 속성 필요 시 확장
-                })
-                
-        if not edges:
-            return pa.table({
-                'out': pa.array([], type=pa.string()),
-                'in': pa.array([], type=pa.string()),
-                'relation': pa.array([], type=pa.string()),
-                'data_json': pa.array([], type=pa.string())
-            })
-            
-        return pa.table({
-            'out': [e['out'] for e in edges],
-            'in': [e['in'] for e in edges],
-            'relation': [e['relation'] for e in edges],
-            'data_json': [e['data_json'] for d in edges] # 오타 수정 d->e
-        })
+                outs.append(out_id)
+                ins.append(f"node:{in_label}")
+                relations.append(relation)
+        
+        return pa.Table.from_arrays([
+            pa.array(outs, type=pa.string()),
+            pa.array(ins, type=pa.string()),
+            pa.array(relations, type=pa.string()),
+            pa.repeat(pa.scalar("{}"), len(outs)),  # 추가 관계 속성 필요 시 확장
+        ], schema=EDGE_TABLE_SCHEMA)
@@ -14,18 +14,20 @@ Features:
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Union, Callable, Tuple
 from contextlib import asynccontextmanager
 import threading
+from collections import deque
 
 import pyarrow as pa
 import pyarrow.ipc as ipc
 import pandas as pd
 import numpy as np
 
+from database.serializer import dumps_json
+
 # SurrealDB 클라이언트 - 동적 임포트 (SDK 1.0+ uses AsyncSurreal)
 try:
     from surrealdb import AsyncSurreal as Surreal  # SDK 1.0 호환
@@ -46,6 +48,38 @@ except ImportError:
     HAS_SPILLER = False
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_isoformat(value: Any) -> Optional[str]:
+    """datetime/date/time → ISO 문자열 (null 유지)"""
+    return value.isoformat() if value is not None else None
+
+
+def _nan_to_none(value: Any) -> Optional[float]:
+    """NaN → None (SurrealDB/JSON에 NaN 없음)"""
+    return None if value is None or value != value else value
+
+
+def _result_records(result: Any) -> List[Dict]:
+    """
+    SurrealDB query 응답 → 레코드 목록
+    
+    구버전 [{"result": [...], "status": "OK"}], 레코드 리스트,
+    SDK 1.0+의 레코드 dict 그대로 반환 형태를 모두 처리한다.
+    """
+    records = []
+    for res in result or []:
+        if isinstance(res, dict) and 'result' in res:
+            records.extend(res['result'] or [])
+        elif isinstance(res, list):
+            records.extend(res)
+        elif isinstance(res, dict):
+            records.append(res)
+    return records
+
+
 # =============================================================================
 # Arrow Buffer Manager (Memory-Efficient Batch Processing)
 # =============================================================================
@@ -54,43 +88,49 @@ class ArrowBufferManager:
     """
     Arrow 데이터의 메모리 효율적 관리자.
     배치 단위로 데이터를 축적하고 임계점 도달 시 플러시.
+    
+    add_batch는 락 없이 deque.append(원자적)와 카운터 단일 대입만 수행하고,
+    락은 버퍼를 비우는 get_and_clear에서만 사용한다 (드레인 간 직렬화).
+    동시 추가 시 카운터는 근사값일 수 있으나 플러시 신호 용도로는 충분하다.
     """
     
     def __init__(self, capacity: int = 1000, flush_threshold: float = 0.8):
         self.capacity = capacity
         self.flush_threshold = flush_threshold
-        self._buffers: Dict[str, List[pa.RecordBatch]] = {}
+        self._buffers: Dict[str, deque] = {}
         self._row_counts: Dict[str, int] = {}
-        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
     
     def add_batch(self, table_name: str, batch: pa.RecordBatch) -> bool:
         """배치 추가. 임계점 도달 시 True 반환 (플러시 필요 신호)"""
-        with self._lock:
-            if table_name not in self._buffers:
-                self._buffers[table_name] = []
-                self._row_counts[table_name] = 0
-            
-            self._buffers[table_name].append(batch)
-            self._row_counts[table_name] += batch.num_rows
-            
-            return self._row_counts[table_name] >= self.capacity * self.flush_threshold
+        self._buffers.setdefault(table_name, deque()).append(batch)
+        rows = self._row_counts.get(table_name, 0) + batch.num_rows
+        self._row_counts[table_name] = rows
+        return rows >= self.capacity * self.flush_threshold
     
     def get_and_clear(self, table_name: str) -> Optional[pa.Table]:
         """축적된 배치를 Table로 병합 후 버퍼 클리어"""
-        with self._lock:
-            if table_name not in self._buffers or not self._buffers[table_name]:
-                return None
-            
-            batches = self._buffers[table_name]
-            self._buffers[table_name] = []
+        buffer = self._buffers.get(table_name)
+        if not buffer:
+            return None
+        
+        # popleft 단위로 꺼내므로 드레인 중 추가된 배치는 이번 또는 다음 플러시에 포함 (유실 없음)
+        batches = []
+        with self._drain_lock:
             self._row_counts[table_name] = 0
-            
-            return pa.Table.from_batches(batches)
+            while True:
+                try:
+                    batches.append(buffer.popleft())
+                except IndexError:
+                    break
+        
+        if not batches:
+            return None
+        return pa.Table.from_batches(batches)
     
     def get_stats(self) -> Dict[str, int]:
         """현재 버퍼 상태 반환"""
-        with self._lock:
-            return dict(self._row_counts)
+        return dict(self._row_counts)
 
 
 # =============================================================================
@@ -115,6 +155,9 @@ class SurrealArrowBridge:
     DEFAULT_USER = os.getenv("SURREAL_USER", "root")
     DEFAULT_PASS = os.getenv("SURREAL_PASS", "root")
     
+    # push_batch 한 번의 UPSERT/INSERT 요청에 담는 행 수
+    INSERT_BATCH_SIZE = 100
+    
     def __init__(self, url: str = None, namespace: str = None, database: str = None):
         self.url = url or self.DEFAULT_URL
         self.namespace = namespace or self.DEFAULT_NS
@@ -129,7 +172,11 @@ class SurrealArrowBridge:
         self._lock = asyncio.Lock()
         
         # 메모리 모드용 인메모리 스토리지
-        self._memory_store: Dict[str, List[Dict[str, Any]]] = {}
+        # (Arrow RecordBatch 그대로 보관 → 행 dict 변환 없이 push/pull)
+        self._memory_store: Dict[str, List[pa.RecordBatch]] = {}
+        
+        # Arrow 스키마별 컬럼 변환기 캐시 (INSERT 전처리 타입 판별을 스키마당 한 번만)
+        self._converters: Dict[pa.Schema, List[Tuple[str, Callable[[Any], Any]]]] = {}
         
         # 버퍼 매니저
         self.buffer_manager = ArrowBufferManager()
@@ -206,85 +253,147 @@ class SurrealArrowBridge:
             print("⚠️ 저장할 데이터가 없습니다.")
             return False
         
-        # Arrow Table → Python Dict 리스트 변환
-        records = arrow_table.to_pylist()
-        
         if self.memory_mode:
-            return self._push_to_memory(records, table_name)
+            return self._push_batches_to_memory(arrow_table.to_batches(), table_name)
         
-        return await self._push_to_surreal(records, table_name)
+        return await self._push_to_surreal(arrow_table, table_name)
     
-    async def _push_to_surreal(self, records: List[Dict], table_name: str) -> bool:
-        """SurrealDB에 실제 저장"""
+    async def _push_to_surreal(
+        self,
+        arrow_table: pa.Table,
+        table_name: str,
+        insert: Optional[Callable] = None
+    ) -> bool:
+        """
+        SurrealDB에 실제 저장
+        
+        테이블 전체를 한 번에 dict 리스트로 만들지 않고 INSERT_BATCH_SIZE 행의
+        RecordBatch 단위로 나눠, 각 배치 작업 안에서만 행으로 변환한다.
+        insert: 배치 실행 함수 (기본은 이 브릿지 연결, SurrealBridgePool은 멤버 연결로 분산)
+        """
         if not self._client:
             print("⚠️ DB 클라이언트 없음. 메모리 저장으로 대체.")
-            return self._push_to_memory(records, table_name)
+            return self._push_batches_to_memory(arrow_table.to_batches(), table_name)
         
         try:
             # 배치 처리: asyncio.gather로 병렬 실행
-            batch_size = 100
-            tasks = []
-            
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                task = self._insert_batch(table_name, batch)
-                tasks.append(task)
+            converters = self._converters_for(arrow_table.schema)
+            batches = [b for b in arrow_table.to_batches(max_chunksize=self.INSERT_BATCH_SIZE) if b.num_rows]
+            insert = insert or self._insert_record_batch
+            tasks = [insert(table_name, batch, converters) for batch in batches]
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # 에러 체크
-            errors = [r for r in results if isinstance(r, Exception)]
-            if errors:
-                print(f"⚠️ 일부 배치 저장 실패: {len(errors)}/{len(tasks)}")
-                # 실패한 데이터는 메모리에 백업
-                for err_idx, err in enumerate(errors):
-                    if err_idx < len(records):
-                        self._push_to_memory([records[err_idx]], f"{table_name}_failed")
+            failed = [batch for batch, result in zip(batches, results) if isinstance(result, Exception)]
+            if failed:
+                print(f"⚠️ 일부 배치 저장 실패: {len(failed)}/{len(tasks)}")
+                # 실패한 배치의 데이터는 메모리에 백업
+                self._push_batches_to_memory(failed, f"{table_name}_failed")
             
-            success_count = len(results) - len(errors)
-            print(f"✅ SurrealDB 저장: {success_count * batch_size} rows → {table_name}")
-            return len(errors) == 0
+            stored_rows = arrow_table.num_rows - sum(batch.num_rows for batch in failed)
+            print(f"✅ SurrealDB 저장: {stored_rows} rows → {table_name}")
+            return not failed
             
         except Exception as e:
             print(f"❌ SurrealDB 저장 실패: {e}")
             # 전체 실패 시 메모리 백업
-            return self._push_to_memory(records, table_name)
+            return self._push_batches_to_memory(arrow_table.to_batches(), table_name)
+    
+    async def _insert_record_batch(
+        self,
+        table_name: str,
+        batch: pa.RecordBatch,
+        converters: List[Tuple[str, Callable[[Any], Any]]]
+    ) -> bool:
+        """RecordBatch 하나를 행으로 변환해 _insert_batch 실행 (변환은 이 배치 범위로 한정)"""
+        return await self._insert_batch(table_name, batch.to_pylist(), converters)
     
-    async def _insert_batch(self, table_name: str, batch: List[Dict]) -> bool:
-        """단일 배치 UPSERT 실행 (존재하면 업데이트, 없으면 생성)"""
+    async def _insert_batch(
+        self,
+        table_name: str,
+        batch: List[Dict],
+        converters: Optional[List[Tuple[str, Callable[[Any], Any]]]] = None
+    ) -> bool:
+        """
+        단일 배치 UPSERT 실행 (존재하면 업데이트, 없으면 생성)
+        
+        id가 있는 레코드는 UPSERT 문을 이어 붙여 쿼리 1회(왕복 1회)로,
+        id가 없는 레코드는 배열 INSERT 1회로 전송한다.
+        묶음 요청이 실패하면 레코드별 실행으로 되돌아가 실패 행만 격리한다.
+        """
+        statements = []
+        keyless = []
+        
+        for record in batch:
+            # timestamp 필드 처리 (datetime → ISO string)
+            if converters is not None:
+                processed = {key: convert(record[key]) for key, convert in converters}
+            else:
+                processed = self._process_record_for_insert(record)
+            record_id = processed.pop('id', None)
+            if record_id:
+                # SurrealDB 2.x: Raw SQL UPSERT
+                content_json = dumps_json(processed, default=str)
+                statements.append(f"UPSERT {table_name}:{record_id} CONTENT {content_json};")
+            else:
+                keyless.append(processed)
+        
         success_count = 0
         error_count = 0
         
-        for record in batch:
-            record_id = record.get('id', 'unknown')
+        if statements:
             try:
-                # timestamp 필드 처리 (datetime → ISO string)
-                processed = self._process_record_for_insert(record)
-                
-                # UPSERT 쿼리 실행 (CREATE or UPDATE)
-                record_id = processed.pop('id', None)
-                if record_id:
-                    full_id = f"{table_name}:{record_id}"
-                    # SurrealDB 2.x: Raw SQL UPSERT
-                    import json as json_lib
-                    content_json = json_lib.dumps(processed, ensure_ascii=False, default=str)
-                    query = f"UPSERT {full_id} CONTENT {content_json};"
-                    result = await self._client.query(query)
-                    print(f"✅ Upserted: {full_id}")
-                    success_count += 1
-                else:
-                    result = await self._client.create(table_name, processed)
-                    print(f"✅ Created: {table_name} (auto-id)")
-                    success_count += 1
+                await self._client.query("\n".join(statements))
+                success_count += len(statements)
+            except Exception as e:
+                print(f"⚠️ 묶음 UPSERT 실패 ({table_name}, {len(statements)}건) → 개별 실행: {e}")
+                for statement in statements:
+                    try:
+                        await self._client.query(statement)
+                        success_count += 1
+                    except Exception as row_error:
+                        error_count += 1
+                        print(f"❌ UPSERT 실패 ({statement.split(' ', 2)[1]}): {row_error}")
+        
+        if keyless:
+            # id 없는 레코드는 배열 INSERT 한 번으로 생성 (실패 시 레코드별 CREATE)
+            try:
+                await self._client.insert(table_name, keyless)
+                success_count += len(keyless)
             except Exception as e:
-                error_count += 1
-                print(f"❌ UPSERT 실패 ({table_name}:{record_id}): {e}")
-                # 개별 실패는 무시하고 계속 진행
-                continue
+                print(f"⚠️ 묶음 INSERT 실패 ({table_name}, {len(keyless)}건) → 개별 실행: {e}")
+                for processed in keyless:
+                    try:
+                        await self._client.create(table_name, processed)
+                        success_count += 1
+                    except Exception as row_error:
+                        error_count += 1
+                        print(f"❌ CREATE 실패 ({table_name}): {row_error}")
         
         print(f"📊 Batch 결과: {success_count} 성공, {error_count} 실패")
         return success_count > 0
     
+    def _converters_for(self, schema: pa.Schema) -> List[Tuple[str, Callable[[Any], Any]]]:
+        """
+        Arrow 스키마 → 컬럼별 INSERT 전처리 함수 목록 (스키마당 한 번 생성 후 캐시)
+        
+        to_pylist 결과는 컬럼 타입이 고정이므로 값마다 isinstance 분기를 돌 필요가 없다.
+        """
+        converters = self._converters.get(schema)
+        if converters is None:
+            converters = []
+            for field in schema:
+                field_type = field.type
+                if pa.types.is_timestamp(field_type) or pa.types.is_date(field_type) or pa.types.is_time(field_type):
+                    converters.append((field.name, _to_isoformat))
+                elif pa.types.is_floating(field_type):
+                    converters.append((field.name, _nan_to_none))
+                else:
+                    converters.append((field.name, _identity))
+            self._converters[schema] = converters
+        return converters
+    
     def _process_record_for_insert(self, record: Dict) -> Dict:
         """레코드를 SurrealDB INSERT용으로 전처리"""
         processed = {}
@@ -301,35 +410,78 @@ class SurrealArrowBridge:
                 processed[key] = value
         return processed
     
-    def _push_to_memory(self, records: List[Dict], table_name: str) -> bool:
-        """메모리 스토리지에 저장 (Fallback)"""
-        if table_name not in self._memory_store:
-            self._memory_store[table_name] = []
+    def _push_batches_to_memory(self, batches: List[pa.RecordBatch], table_name: str) -> bool:
+        """메모리 스토리지에 저장 (Fallback, RecordBatch 참조만 보관 → 복사 없음)"""
+        stored = self._memory_store.setdefault(table_name, [])
+        stored.extend(batch for batch in batches if batch.num_rows)
         
-        self._memory_store[table_name].extend(records)
-        print(f"📝 Memory 저장: {len(records)} rows → {table_name} (총 {len(self._memory_store[table_name])} rows)")
+        rows = sum(batch.num_rows for batch in batches)
+        print(f"📝 Memory 저장: {rows} rows → {table_name} (총 {self._memory_row_count(table_name)} rows)")
         return True
     
-    async def pull_batch(self, query: str = None, table_name: str = None) -> Optional[pa.Table]:
+    def _memory_row_count(self, table_name: str) -> int:
+        """메모리 스토리지 테이블의 행 수"""
+        return sum(batch.num_rows for batch in self._memory_store.get(table_name, []))
+    
+    def _memory_table(self, table_name: str, schema: Optional[pa.Schema] = None) -> Optional[pa.Table]:
+        """
+        메모리 스토리지 배치들을 Arrow Table로 (배치 버퍼를 그대로 청크로 사용)
+        
+        push마다 스키마가 다를 수 있어 불일치 시에만 스키마 승격으로 합친다.
+        schema가 주어지면 해당 컬럼만 그 타입으로 맞추고 없는 컬럼은 null로 채운다.
+        """
+        batches = self._memory_store.get(table_name)
+        if not batches:
+            return None
+        
+        first_schema = batches[0].schema
+        if all(batch.schema.equals(first_schema) for batch in batches):
+            table = pa.Table.from_batches(batches)
+        else:
+            table = pa.concat_tables(
+                [pa.Table.from_batches([batch]) for batch in batches],
+                promote_options="permissive"
+            )
+        
+        if schema is None:
+            return table
+        return pa.Table.from_arrays([
+            table.column(field.name).cast(field.type) if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ], schema=schema)
+    
+    async def pull_batch(
+        self,
+        query: str = None,
+        table_name: str = None,
+        schema: Optional[pa.Schema] = None
+    ) -> Optional[pa.Table]:
         """
         SurrealDB에서 데이터를 Arrow Table로 인출.
         
         Args:
             query: SurrealQL 쿼리 (우선)
             table_name: 테이블명 (query 없을 시 SELECT * FROM table_name)
+            schema: 결과 스키마 (주어지면 해당 컬럼만 타입 추론 없이 생성)
         
         Returns:
             Arrow Table 또는 None
         """
         if self.memory_mode:
-            return self._pull_from_memory(table_name)
+            return self._pull_from_memory(table_name, schema)
         
-        return await self._pull_from_surreal(query, table_name)
+        return await self._pull_from_surreal(query, table_name, schema)
     
-    async def _pull_from_surreal(self, query: str = None, table_name: str = None) -> Optional[pa.Table]:
+    async def _pull_from_surreal(
+        self,
+        query: str = None,
+        table_name: str = None,
+        schema: Optional[pa.Schema] = None
+    ) -> Optional[pa.Table]:
         """SurrealDB에서 실제 인출"""
         if not self._client:
-            return self._pull_from_memory(table_name)
+            return self._pull_from_memory(table_name, schema)
         
         try:
             # 쿼리 결정
@@ -348,46 +500,106 @@ class SurrealArrowBridge:
             if not result or len(result) == 0:
                 return None
             
-            # SurrealDB 결과는 보통 [{"result": [...], "status": "OK"}] 형태
-            records = []
-            for res in result:
-                if isinstance(res, dict) and 'result' in res:
-                    records.extend(res['result'])
-                elif isinstance(res, list):
-                    records.extend(res)
-                elif isinstance(res, dict):
-                    records.append(res)
-            
+            records = _result_records(result)
             if not records:
                 return None
             
             # Dict List → Arrow Table
-            return self._records_to_arrow(records)
+            return self._records_to_arrow(records, schema)
             
         except Exception as e:
             print(f"❌ SurrealDB 인출 실패: {e}")
-            return self._pull_from_memory(table_name)
+            return self._pull_from_memory(table_name, schema)
     
-    def _pull_from_memory(self, table_name: str) -> Optional[pa.Table]:
+    async def pull_batch_stream(
+        self,
+        table_name: str,
+        batch_size: int = 16384,
+        schema: Optional[pa.Schema] = None
+    ):
+        """
+        SurrealDB 테이블을 batch_size 행 단위 RecordBatch로 스트리밍 인출.
+        
+        전체 결과를 한 번에 Table로 만들지 않으므로 피크 메모리가 배치 하나 크기로 제한되고,
+        소비자는 첫 배치부터 바로 처리를 시작할 수 있다.
+        DB 쿼리 오류는 예외로 전파된다 (부분 인출을 정상 종료로 보고하지 않음).
+        
+        Usage:
+            async for batch in bridge.pull_batch_stream("node"):
+                fact_core.load_batch_from_arrow(batch)
+        """
+        if self.memory_mode or not self._client:
+            table = self._memory_table(table_name, schema)
+            if table is not None:
+                for batch in table.to_batches(max_chunksize=batch_size):
+                    yield batch
+            return
+        
+        # 쿼리 오류는 그대로 전파 (중간 실패를 테이블 끝으로 오인하지 않도록, 호출자가 실패 보고)
+        start = 0
+        while True:
+            page = _result_records(
+                await self._client.query(f"SELECT * FROM {table_name} LIMIT {batch_size} START {start}")
+            )
+            if not page:
+                return
+            
+            table = self._records_to_arrow(page, schema)
+            for batch in table.to_batches():
+                yield batch
+            
+            if len(page) < batch_size:
+                return
+            start += batch_size
+    
+    async def count_rows(self, table_name: str) -> int:
+        """
+        테이블 행 수 조회 (전체 인출 전 빈 테이블 판별용, 응답 수십 바이트).
+        
+        Returns:
+            행 수. 조회 실패 시 -1 (호출자는 '알 수 없음'으로 보고 그대로 인출)
+        """
+        if self.memory_mode or not self._client:
+            return self._memory_row_count(table_name)
+        
+        try:
+            result = await self._client.query(f"SELECT count() FROM {table_name} GROUP ALL")
+        except Exception as e:
+            print(f"⚠️ 행 수 조회 실패 ({table_name}): {e}")
+            return -1
+        
+        rows = _result_records(result)
+        # 빈 테이블은 GROUP ALL 결과가 빈 배열
+        return int(rows[0].get('count', 0)) if rows else 0
+    
+    def _pull_from_memory(self, table_name: str, schema: Optional[pa.Schema] = None) -> Optional[pa.Table]:
         """메모리 스토리지에서 인출 (Fallback)"""
-        if not table_name or table_name not in self._memory_store:
+        if not table_name:
             return None
         
-        records = self._memory_store.get(table_name, [])
-        if not records:
+        table = self._memory_table(table_name, schema)
+        if table is None:
             return None
         
-        print(f"📖 Memory 인출: {len(records)} rows ← {table_name}")
-        return self._records_to_arrow(records)
+        print(f"📖 Memory 인출: {table.num_rows} rows ← {table_name}")
+        return table
     
-    def _records_to_arrow(self, records: List[Dict]) -> pa.Table:
-        """Dict 리스트를 Arrow Table로 변환"""
+    def _records_to_arrow(self, records: List[Dict], schema: Optional[pa.Schema] = None) -> pa.Table:
+        """
+        Dict 리스트를 Arrow Table로 변환 (pandas DataFrame 경유 없이 직접 생성)
+        
+        schema가 주어지면 해당 컬럼만 그 타입으로 생성하고(타입 추론 생략, 나머지 필드 무시),
+        없으면 모든 레코드의 키 합집합을 컬럼으로 삼는다 (누락 값은 null).
+        """
         if not records:
             return None
         
-        # Pandas DataFrame 경유 (타입 추론 활용)
-        df = pd.DataFrame(records)
-        return pa.Table.from_pandas(df, preserve_index=False)
+        if schema is not None:
+            return pa.Table.from_pylist(records, schema=schema)
+        
+        # 키 순서 유지 합집합 (레코드마다 필드가 다를 수 있음)
+        columns = dict.fromkeys(key for record in records for key in record)
+        return pa.table({key: [record.get(key) for record in records] for key in columns})
     
     # =========================================================================
     # Convenience Methods
@@ -400,14 +612,7 @@ class SurrealArrowBridge:
             return []
         
         try:
-            result = await self._client.query(sql)
-            records = []
-            for res in result:
-                if isinstance(res, dict) and 'result' in res:
-                    records.extend(res['result'])
-                elif isinstance(res, list):
-                    records.extend(res)
-            return records
+            return _result_records(await self._client.query(sql))
         except Exception as e:
             print(f"❌ 쿼리 실패: {e}")
             return []
@@ -456,7 +661,7 @@ class SurrealArrowBridge:
             "namespace": self.namespace,
             "database": self.database,
             "memory_tables": list(self._memory_store.keys()),
-            "memory_row_counts": {k: len(v) for k, v in self._memory_store.items()},
+            "memory_row_counts": {k: self._memory_row_count(k) for k in self._memory_store},
             "buffer_stats": self.buffer_manager.get_stats()
         }
     
@@ -477,6 +682,112 @@ class SurrealArrowBridge:
         return None
 
 
+# =============================================================================
+# SurrealBridgePool (동시 작업용 커넥션 풀)
+# =============================================================================
+
+class SurrealBridgePool:
+    """
+    SurrealArrowBridge 커넥션 풀.
+
+    SurrealDB WebSocket 클라이언트는 한 연결에서 recv()를 교차 실행할 수 없으므로
+    동시 push/pull은 각자 독립된 연결을 빌려 쓴다.
+
+    - acquire(): asyncio.Queue에서 유휴 브릿지를 꺼내고, 종료 시 반납
+    - DB 연결 실패 시 primary 하나만 Memory-Only 모드로 풀에 넣는다
+    - 모든 멤버는 _memory_store를 공유 (Memory-Only 데이터 일관성 유지)
+    """
+
+    DEFAULT_SIZE = int(os.getenv("SURREAL_POOL_SIZE", "4"))
+
+    def __init__(self, size: int = None, url: str = None, namespace: str = None, database: str = None):
+        self.size = max(1, size or self.DEFAULT_SIZE)
+        self._bridges: List[SurrealArrowBridge] = [
+            SurrealArrowBridge(url, namespace, database) for _ in range(self.size)
+        ]
+        for bridge in self._bridges[1:]:
+            bridge._memory_store = self.primary._memory_store
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def primary(self) -> SurrealArrowBridge:
+        """대표 브릿지 (상태 조회 및 단일 연결 호환용)"""
+        return self._bridges[0]
+
+    @property
+    def connected(self) -> bool:
+        return self.primary.connected
+
+    @property
+    def memory_mode(self) -> bool:
+        return self.primary.memory_mode
+
+    async def connect(self) -> bool:
+        """
+        primary 연결 후 나머지 멤버를 동시에 연결.
+        연결에 실패한 보조 멤버는 풀에서 제외된다.
+        """
+        self._queue = asyncio.Queue()
+        if not await self.primary.connect():
+            self._queue.put_nowait(self.primary)
+            return False
+
+        results = await asyncio.gather(
+            *(bridge.connect() for bridge in self._bridges[1:]),
+            return_exceptions=True
+        )
+        self._queue.put_nowait(self.primary)
+        for bridge, ok in zip(self._bridges[1:], results):
+            if ok is True:
+                self._queue.put_nowait(bridge)
+
+        print(f"🏊 SurrealBridgePool: {self._queue.qsize()}/{self.size} 연결 준비")
+        return True
+
+    @asynccontextmanager
+    async def acquire(self):
+        """유휴 브릿지를 빌려주고 블록 종료 시 반납"""
+        if self._queue is None:
+            await self.connect()
+        bridge = await self._queue.get()
+        try:
+            yield bridge
+        finally:
+            self._queue.put_nowait(bridge)
+
+    async def push_batch(self, arrow_table: pa.Table, table_name: str) -> bool:
+        """
+        Arrow Table을 풀 전체 연결로 나눠 저장.
+        
+        브릿지 하나의 push_batch는 모든 배치를 한 연결로 보내 사실상 직렬이므로,
+        RecordBatch마다 유휴 멤버를 빌려 연결 수만큼 동시에 UPSERT한다.
+        """
+        if self._queue is None:
+            await self.connect()
+        primary = self.primary
+        if primary.memory_mode or arrow_table is None or arrow_table.num_rows == 0:
+            return await primary.push_batch(arrow_table, table_name)
+        return await primary._push_to_surreal(arrow_table, table_name, insert=self._insert_on_member)
+
+    async def _insert_on_member(self, table_name: str, batch: pa.RecordBatch, converters) -> bool:
+        """유휴 멤버 연결로 RecordBatch 하나 저장"""
+        async with self.acquire() as bridge:
+            return await bridge._insert_record_batch(table_name, batch, converters)
+
+    async def close(self):
+        """모든 멤버 연결 종료"""
+        for bridge in self._bridges:
+            await bridge.close()
+        self._queue = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """풀 상태 정보"""
+        status = self.primary.get_status()
+        status["pool_size"] = self.size
+        status["pool_idle"] = self._queue.qsize() if self._queue else 0
+        return status
+
+
 # =============================================================================
 # Module-Level Singleton & Convenience Functions
 # =============================================================================
@@ -65,7 +65,8 @@ class SyncMixin:
         print("🔌 AIN Core 종료 중...")
         await self._sync_to_database()
         
-        if self.cc.bridge:
-            await self.cc.bridge.close()
+        if self.cc.bridge_pool:
+            await self.cc.bridge_pool.close()
+        self.cc.close_json_pool()
         
         print("👋 AIN Core 종료 완료")
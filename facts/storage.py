@@ -72,7 +72,21 @@ class StorageMixin:
         if table is None or table.num_rows == 0:
             return False
 
-        records = table.to_pylist()
+        count = self.load_batch_from_arrow(table)
+        print(f"✅ FactCore: {count}개 노드 복원 완료")
+        return True
+
+    def load_batch_from_arrow(self, batch) -> int:
+        """
+        RecordBatch(또는 Table) 하나를 지식 그래프에 누적 주입 (스트리밍 Hydration용)
+
+        Returns:
+            처리한 행 수
+        """
+        if batch is None or batch.num_rows == 0:
+            return 0
+
+        records = batch.to_pylist()
         
         for record in records:
             label = record.get('label')
@@ -88,8 +102,7 @@ class StorageMixin:
                 print(f"❌ FactCore Hydration 에러 ({label}): {e}")
                 continue
         
-        print(f"✅ FactCore: {len(records)}개 노드 복원 완료")
-        return True
+        return len(records)
 
     def load_edges_from_arrow(self, table):
         """Arrow Table로부터 노드 간의 관계(Edge)를 복원"""
@@ -9,6 +9,7 @@ LanceBridge와 VectorMemory의 연결, 데이터 삽입, 검색 기능을 검증
 3. 벡터 검색 (search_memory) 기능 검증
 4. 벡터 차원 일관성 검증
 5. VectorMemory 래퍼 클래스 동작 검증
+6. 일괄 저장 (add_memories) 및 유형 프리필터 검색 검증
 """
 
 import unittest
@@ -167,6 +168,41 @@ class TestLanceBridge(unittest.TestCase):
             "기억 추가 후 카운트가 1 증가해야 합니다."
         )
 
+    def test_add_memories_pads_and_truncates(self):
+        """일괄 저장 시 짧은/긴 벡터가 VECTOR_DIM으로 맞춰지고 저장 수가 반환되는지 확인"""
+        dim = self.bridge.VECTOR_DIM
+        records = [
+            {"text": "짧은 일괄 벡터", "vector": [0.5] * 100, "memory_type": "test"},
+            {"text": "긴 일괄 벡터", "vector": [0.3] * (dim + 50), "memory_type": "test"},
+            {"text": "정확한 일괄 벡터", "vector": [0.1] * dim},
+        ]
+        
+        added = self.bridge.add_memories(records)
+        
+        self.assertEqual(added, 3, "저장된 기억 수가 반환되어야 합니다.")
+        rows = {
+            row["text"]: row["vector"]
+            for row in self.bridge._table.to_arrow().to_pylist()
+        }
+        short = rows["짧은 일괄 벡터"]
+        self.assertEqual(len(short), dim)
+        self.assertAlmostEqual(short[99], 0.5, places=5)
+        self.assertEqual(short[100], 0.0, "부족분은 0으로 패딩되어야 합니다.")
+        self.assertEqual(len(rows["긴 일괄 벡터"]), dim, "초과분은 절단되어야 합니다.")
+
+    def test_search_memory_type_prefilter_with_quote(self):
+        """작은따옴표가 들어간 memory_type으로 프리필터 검색이 동작하는지 확인"""
+        vector = [0.2] * self.bridge.VECTOR_DIM
+        self.bridge.add_memories([
+            {"text": "따옴표 유형 기억", "vector": vector, "memory_type": "user's note"},
+            {"text": "다른 유형 기억", "vector": vector, "memory_type": "semantic"},
+        ])
+        
+        results = self.bridge.search_memory(vector, limit=5, memory_type="user's note")
+        
+        self.assertEqual([r["text"] for r in results], ["따옴표 유형 기억"])
+        self.assertEqual(results[0]["memory_type"], "user's note")
+
 
 class TestVectorMemory(unittest.TestCase):
     """
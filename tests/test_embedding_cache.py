@@ -0,0 +1,98 @@
+"""
+Embedding Cache Unit Tests
+==========================
+EmbeddingDiskCache의 2계층(LRU + SQLite) 동작을 검증한다.
+
+검증 항목:
+1. write-through 후 메모리/디스크 양쪽에서 조회 가능
+2. 모델 네임스페이스에 따른 키 분리
+3. TTL 만료 항목 무효화
+4. float16 저장 시 근사값 복원
+5. set_many 일괄 기록
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+try:
+    from api.embedding_cache import EmbeddingDiskCache
+    HAS_CACHE = True
+except ImportError:
+    HAS_CACHE = False
+    EmbeddingDiskCache = None
+
+
+class TestEmbeddingDiskCache(unittest.TestCase):
+    """EmbeddingDiskCache 검증"""
+
+    def setUp(self):
+        if not HAS_CACHE:
+            self.skipTest("api.embedding_cache module not available")
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, "embeddings.sqlite3")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_write_through_survives_restart(self):
+        """새 인스턴스(재시작)에서도 디스크 계층으로 조회되는지 확인"""
+        key = EmbeddingDiskCache.make_key("model-a", "retrieval_document", "hello")
+        EmbeddingDiskCache(self.db_path).set(key, "model-a", [0.25, 0.5, 0.75])
+
+        restored = EmbeddingDiskCache(self.db_path).get(key)
+        self.assertEqual(restored, [0.25, 0.5, 0.75])
+
+    def test_key_is_namespaced_by_model(self):
+        """모델이 다르면 다른 키가 생성되는지 확인"""
+        key_a = EmbeddingDiskCache.make_key("model-a", "retrieval_document", "hello")
+        key_b = EmbeddingDiskCache.make_key("model-b", "retrieval_document", "hello")
+        self.assertNotEqual(key_a, key_b)
+
+    def test_expired_entry_is_miss(self):
+        """TTL이 지난 항목은 반환되지 않는지 확인"""
+        cache = EmbeddingDiskCache(self.db_path)
+        key = EmbeddingDiskCache.make_key("model-a", "retrieval_document", "def f(): pass")
+        cache.set(key, "model-a", [1.0], ttl=-1)
+        self.assertIsNone(cache.get(key))
+
+    def test_zero_ttl_expires_immediately(self):
+        """ttl=0은 만료 없음이 아니라 즉시 만료로 취급되는지 확인"""
+        cache = EmbeddingDiskCache(self.db_path)
+        key = EmbeddingDiskCache.make_key("model-a", "retrieval_document", "zero")
+        cache.set(key, "model-a", [1.0], ttl=0)
+        self.assertIsNone(cache.get(key))
+
+    def test_set_many_persists_all_entries(self):
+        """set_many로 기록한 항목이 재시작 후에도 모두 조회되는지 확인"""
+        keys = [EmbeddingDiskCache.make_key("model-a", "retrieval_document", f"t{i}") for i in range(3)]
+        EmbeddingDiskCache(self.db_path).set_many(
+            "model-a", [(key, [float(i)], None) for i, key in enumerate(keys)]
+        )
+
+        restored = EmbeddingDiskCache(self.db_path)
+        self.assertEqual([restored.get(key) for key in keys], [[0.0], [1.0], [2.0]])
+
+    def test_float16_storage_round_trip(self):
+        """float16으로 저장한 벡터가 근사값으로 복원되는지 확인"""
+        key = EmbeddingDiskCache.make_key("model-a", "retrieval_document", "half")
+        EmbeddingDiskCache(self.db_path, storage_dtype="float16").set(key, "model-a", [0.1, -0.5, 0.9])
+
+        restored = EmbeddingDiskCache(self.db_path).get(key)
+        for expected, actual in zip([0.1, -0.5, 0.9], restored):
+            self.assertAlmostEqual(expected, actual, places=3)
+
+    def test_lru_eviction(self):
+        """메모리 계층이 최대 크기를 넘지 않는지 확인"""
+        cache = EmbeddingDiskCache(self.db_path, max_items=2)
+        for i in range(3):
+            cache.set(f"k{i}", "model-a", [float(i)])
+        self.assertEqual(cache.stats()["memory_size"], 2)
+        self.assertEqual(cache.stats()["disk_size"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
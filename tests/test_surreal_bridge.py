@@ -0,0 +1,205 @@
+"""
+SurrealArrowBridge Unit Tests
+=============================
+DB 연결 없이 검증 가능한 SurrealArrowBridge의 Memory-Only 저장소와
+SurrealBridgePool의 연결 대여 동작(스텁 클라이언트)을 검증한다.
+
+검증 항목:
+1. Memory 모드 push/pull 왕복 (RecordBatch 보관)
+2. 스키마가 다른 push의 승격 병합 및 pull_batch(schema=...) 투영
+3. count_rows 행 수 집계
+4. pull_batch_stream의 batch_size 단위 분할
+5. 풀 acquire/반납 순서 (FIFO)
+6. 풀 push_batch의 RecordBatch 멤버 분산
+7. DB 모드 pull_batch_stream 페이지 인출 (SDK 1.0+ 레코드 dict 응답, 오류 전파)
+"""
+
+import asyncio
+import re
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+try:
+    import pyarrow as pa
+    from database.surreal_bridge import SurrealArrowBridge, SurrealBridgePool
+    HAS_BRIDGE = True
+except ImportError:
+    HAS_BRIDGE = False
+    SurrealArrowBridge = None
+    SurrealBridgePool = None
+
+
+class StubClient:
+    """SurrealDB 클라이언트 대역 (실행된 UPSERT 문 수만 기록)"""
+
+    def __init__(self):
+        self.upserts = 0
+
+    async def query(self, sql):
+        await asyncio.sleep(0)  # 다른 배치 작업이 끼어들 수 있도록 양보
+        self.upserts += sql.count("UPSERT ")
+        return []
+
+    async def close(self):
+        pass
+
+
+class PagingStubClient(StubClient):
+    """SDK 1.0+처럼 레코드 dict 목록을 그대로 반환하는 대역 (count() 및 LIMIT/START 페이지)"""
+
+    def __init__(self, rows, fail_at=None):
+        super().__init__()
+        self.rows = rows
+        self.fail_at = fail_at
+
+    async def query(self, sql):
+        if "count()" in sql:
+            return [{"count": len(self.rows)}]
+        limit, start = map(int, re.search(r"LIMIT (\d+) START (\d+)", sql).groups())
+        if start == self.fail_at:
+            raise ConnectionError("connection lost")
+        return self.rows[start:start + limit]
+
+
+class TestMemoryModeStore(unittest.IsolatedAsyncioTestCase):
+    """Memory-Only 저장소(RecordBatch 목록) 검증"""
+
+    def setUp(self):
+        if not HAS_BRIDGE:
+            self.skipTest("database.surreal_bridge or pyarrow not available")
+        self.bridge = SurrealArrowBridge()
+        self.bridge.memory_mode = True
+
+    async def test_push_pull_round_trip(self):
+        """push한 행이 순서대로 그대로 인출되는지 확인"""
+        await self.bridge.push_batch(pa.table({"id": ["a", "b"], "score": [1, 2]}), "node")
+        await self.bridge.push_batch(pa.table({"id": ["c"], "score": [3]}), "node")
+
+        table = await self.bridge.pull_batch(table_name="node")
+
+        self.assertEqual(table.to_pydict(), {"id": ["a", "b", "c"], "score": [1, 2, 3]})
+
+    async def test_differing_schemas_are_promoted(self):
+        """컬럼 구성이 다른 push는 합집합 스키마로 병합되고 누락 값은 null인지 확인"""
+        await self.bridge.push_batch(pa.table({"a": [1, 2]}), "mixed")
+        await self.bridge.push_batch(pa.table({"a": [3], "b": ["x"]}), "mixed")
+
+        table = await self.bridge.pull_batch(table_name="mixed")
+
+        self.assertEqual(table.column_names, ["a", "b"])
+        self.assertEqual(table.column("b").to_pylist(), [None, None, "x"])
+
+    async def test_pull_with_schema_projects_columns(self):
+        """schema 지정 시 해당 컬럼만 그 타입으로, 없는 컬럼은 null로 반환되는지 확인"""
+        await self.bridge.push_batch(pa.table({"a": [1, 2], "b": ["x", "y"]}), "projected")
+        schema = pa.schema([("a", pa.float64()), ("c", pa.string())])
+
+        table = await self.bridge.pull_batch(table_name="projected", schema=schema)
+
+        self.assertEqual(table.schema, schema)
+        self.assertEqual(table.column("a").to_pylist(), [1.0, 2.0])
+        self.assertEqual(table.column("c").null_count, 2)
+
+    async def test_count_rows(self):
+        """count_rows가 저장된 모든 배치의 행 수를 합산하는지 확인"""
+        self.assertEqual(await self.bridge.count_rows("counted"), 0)
+        await self.bridge.push_batch(pa.table({"a": [1, 2, 3]}), "counted")
+        await self.bridge.push_batch(pa.table({"a": [4]}), "counted")
+
+        self.assertEqual(await self.bridge.count_rows("counted"), 4)
+
+    async def test_pull_batch_stream_chunks(self):
+        """pull_batch_stream이 batch_size 이하 배치로 나눠 전체 행을 내보내는지 확인"""
+        await self.bridge.push_batch(pa.table({"a": list(range(5))}), "streamed")
+
+        sizes = [batch.num_rows async for batch in self.bridge.pull_batch_stream("streamed", batch_size=2)]
+
+        self.assertEqual(sizes, [2, 2, 1])
+
+    async def test_missing_table(self):
+        """저장된 적 없는 테이블은 None / 빈 스트림인지 확인"""
+        self.assertIsNone(await self.bridge.pull_batch(table_name="missing"))
+        self.assertEqual([b async for b in self.bridge.pull_batch_stream("missing")], [])
+
+
+class TestStreamFromDatabase(unittest.IsolatedAsyncioTestCase):
+    """DB 모드 pull_batch_stream 검증 (실제 DB 대신 PagingStubClient)"""
+
+    def setUp(self):
+        if not HAS_BRIDGE:
+            self.skipTest("database.surreal_bridge or pyarrow not available")
+        self.rows = [{"id": f"node:n{i}", "label": f"n{i}"} for i in range(5)]
+        self.bridge = SurrealArrowBridge()
+        self.bridge.memory_mode = False
+        self.bridge.connected = True
+
+    async def test_bare_record_pages(self):
+        """레코드 dict 응답을 여러 페이지에 걸쳐 모두 인출하는지 확인"""
+        self.bridge._client = PagingStubClient(self.rows)
+
+        batches = [b async for b in self.bridge.pull_batch_stream("node", batch_size=2)]
+
+        self.assertEqual([b.num_rows for b in batches], [2, 2, 1])
+        self.assertEqual(sum(b.num_rows for b in batches), len(self.rows))
+        self.assertEqual(await self.bridge.count_rows("node"), len(self.rows))
+
+    async def test_query_error_propagates(self):
+        """중간 페이지 오류가 테이블 끝으로 처리되지 않고 예외로 전파되는지 확인"""
+        self.bridge._client = PagingStubClient(self.rows, fail_at=2)
+
+        received = []
+        with self.assertRaises(ConnectionError):
+            async for batch in self.bridge.pull_batch_stream("node", batch_size=2):
+                received.append(batch.num_rows)
+        self.assertEqual(received, [2])
+
+
+class TestSurrealBridgePool(unittest.IsolatedAsyncioTestCase):
+    """SurrealBridgePool 연결 대여/분산 검증 (실제 DB 대신 StubClient)"""
+
+    async def asyncSetUp(self):
+        if not HAS_BRIDGE:
+            self.skipTest("database.surreal_bridge or pyarrow not available")
+        self.pool = SurrealBridgePool(size=2)
+        # connect() 성공 상태를 재현: 멤버마다 스텁 연결을 붙이고 순서대로 큐에 넣음
+        self.pool._queue = asyncio.Queue()
+        for bridge in self.pool._bridges:
+            bridge._client = StubClient()
+            bridge.connected = True
+            bridge.memory_mode = False
+            self.pool._queue.put_nowait(bridge)
+
+    async def test_acquire_release_order(self):
+        """유휴 브릿지를 큐 순서대로 빌려주고 반납 순서대로 다시 빌려주는지 확인"""
+        primary, member = self.pool._bridges
+
+        async with self.pool.acquire() as first:
+            async with self.pool.acquire() as second:
+                self.assertIs(first, primary)
+                self.assertIs(second, member)
+                self.assertEqual(self.pool._queue.qsize(), 0)
+            self.assertEqual(self.pool._queue.qsize(), 1)
+
+        self.assertEqual(self.pool._queue.qsize(), 2)
+        async with self.pool.acquire() as reused:
+            self.assertIs(reused, member)  # 먼저 반납된 브릿지가 먼저 대여됨
+
+    async def test_push_batch_fans_out_across_members(self):
+        """RecordBatch들이 여러 멤버 연결로 나뉘어 전부 저장되는지 확인"""
+        rows = SurrealArrowBridge.INSERT_BATCH_SIZE * 2 + 50
+        table = pa.table({"id": [f"n{i}" for i in range(rows)], "value": list(range(rows))})
+
+        pushed = await self.pool.push_batch(table, "node")
+
+        upserts = [bridge._client.upserts for bridge in self.pool._bridges]
+        self.assertTrue(pushed)
+        self.assertEqual(sum(upserts), rows)
+        self.assertTrue(all(upserts), "모든 멤버 연결이 사용되어야 합니다.")
+        self.assertEqual(self.pool._queue.qsize(), 2, "대여한 연결은 모두 반납되어야 합니다.")
+
+
+if __name__ == "__main__":
+    unittest.main()
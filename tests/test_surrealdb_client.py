@@ -0,0 +1,60 @@
+"""
+SurrealDBClient Unit Tests
+==========================
+Legacy SurrealDBClient.create_many의 테이블별 스키마 캐시 동작을 검증한다.
+
+검증 항목:
+1. null 타입 필드가 있는 첫 행 이후에도 생성 성공
+2. 캐시된 타입과 다른 값이 들어오면 재추론
+"""
+
+import unittest
+import sys
+import os
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        from api.surrealdb import SurrealDBClient, HAS_ARROW, HAS_BRIDGE
+    HAS_CLIENT = HAS_ARROW and HAS_BRIDGE
+except ImportError:
+    HAS_CLIENT = False
+    SurrealDBClient = None
+
+
+class TestCreateManySchemaCache(unittest.TestCase):
+    """create_many 스키마 캐시 검증"""
+
+    def setUp(self):
+        if not HAS_CLIENT:
+            self.skipTest("api.surrealdb bridge or pyarrow not available")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            self.client = SurrealDBClient()
+        if self.client.bridge._client is not None:
+            self.skipTest("SurrealDB 연결 환경에서는 실행하지 않음")
+
+    def test_null_first_row_does_not_poison_cache(self):
+        """첫 행의 null 필드가 이후 생성을 막지 않는지 확인"""
+        first = self.client.create("test_schema_cache_null", {"a": 1, "b": None})
+        second = self.client.create("test_schema_cache_null", {"a": 1.5, "b": "x"})
+
+        self.assertIsNone(first["error"])
+        self.assertIsNone(second["error"])
+
+    def test_changed_type_is_reinferred(self):
+        """캐시된 int 타입에 float 값이 오면 재추론 후 캐시를 갱신하는지 확인"""
+        self.client.create("test_schema_cache_type", {"a": 1})
+        result = self.client.create("test_schema_cache_type", {"a": 1.5})
+
+        self.assertIsNone(result["error"])
+        self.assertEqual(
+            str(self.client._schema_cache["test_schema_cache_type"].field("a").type), "double"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()